@@ -14,8 +14,8 @@ from autogen_agentchat.teams import RoundRobinGroupChat
 from autogen_agentchat.conditions import MaxMessageTermination, TextMentionTermination
 from app.agents.termination_conditions import MessageTermination
 from autogen_ext.models.openai import OpenAIChatCompletionClient
-from app.agents.prompts import TARA_SYSTEM_PROMPT, TARA_GENZ_STYLE_APPENDIX
-from app.agents.tools import get_transits, get_lagnas, get_yogas, get_divisional_chart, get_vimshottari_dasha, get_lat_long, get_timezone
+from app.agents.prompts import get_tara_prompt, TARA_GENZ_STYLE_APPENDIX
+from app.agents.tools import get_transits, get_lagnas, get_yogas, get_divisional_chart, get_vimshottari_dasha, get_all_lagnas, get_birth_bundle, get_lat_long, get_timezone
 from app.agents.astrology_utils import get_d1_chart_data_jhora, get_today_date_ist
 from app.models import User
 from app.utils.logger import get_logger
@@ -96,14 +96,15 @@ class AstrologyAgent:
             user_info.append(f"Pronouns: {user.pronouns}")
         user_info_str = "\n".join(user_info)
         
+        tara_system_prompt = get_tara_prompt()
         logger.info(f"get_today_date_ist(): {get_today_date_ist()}")
-        logger.info(f"TARA_SYSTEM_PROMPT: {TARA_SYSTEM_PROMPT}")
+        logger.info(f"TARA_SYSTEM_PROMPT: {tara_system_prompt}")
         logger.info(f"user_info_str: {user_info_str}")
         
         # Build the system message with all context
-        base_prompt = TARA_SYSTEM_PROMPT
+        base_prompt = tara_system_prompt
         if getattr(self.user, 'genz_style_enabled', False):
-            base_prompt = f"{TARA_SYSTEM_PROMPT}\n{TARA_GENZ_STYLE_APPENDIX}"
+            base_prompt = f"{tara_system_prompt}\n{TARA_GENZ_STYLE_APPENDIX}"
 
         system_message = f"{base_prompt}\n\nUser Information:\n{user_info_str}"
         
@@ -177,6 +178,8 @@ class AstrologyAgent:
                 get_yogas,
                 get_divisional_chart,
                 get_vimshottari_dasha,
+                get_all_lagnas,
+                get_birth_bundle,
             ],
             description="A comprehensive astrology agent that follows a 5-step analysis process: Data Collection → Analysis → Dasha/Transit → Yoga/Combinations → Synthesis.",
         )
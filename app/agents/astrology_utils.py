@@ -20,6 +20,12 @@ MOON_SIGN_NAMES = [
     "Aries", "Taurus", "Gemini", "Cancer", "Leo", "Virgo",
     "Libra", "Scorpio", "Sagittarius", "Capricorn", "Aquarius", "Pisces"
 ]
+# 0-indexed sign names (0=Aries ... 11=Pisces), shared by the chart formatters below
+RASHI_NAMES = tuple(MOON_SIGN_NAMES[1:])
+
+def format_degrees(longitude: float) -> str:
+    """Format a longitude within a sign as whole degrees and minutes, e.g. 15°30'."""
+    return f"{int(longitude)}°{int((longitude % 1) * 60)}'"
 
 def get_moon_sign_name(moon_rashi: int) -> str | None:
     """
@@ -151,18 +157,15 @@ def get_sidereal_transits_ist(ist_dt, lat_deg, lon_deg, ephe_path='/app/ephe'):
     jd_ut = swe.utc_to_jd(ut.year, ut.month, ut.day,
                           ut.hour, ut.minute, ut.second, swe.GREG_CAL)[1]
 
-    signs = ['Aries','Taurus','Gemini','Cancer','Leo','Virgo',
-             'Libra','Scorpio','Sagittarius','Capricorn','Aquarius','Pisces']
-
     # Moon Sign (deg input, no ambiguity)
     moon_lon = swe.calc_ut(jd_ut, swe.MOON, flags)[0][0] % 360
-    moon_sign = signs[int(moon_lon // 30)]
+    moon_sign = RASHI_NAMES[int(moon_lon // 30)]
 
     # ✅ Use radians AND FLG_RADIANS in houses_ex()
     lat_rad = math.radians(lat_deg)
     lon_rad = math.radians(lon_deg)
     cusps, _ = swe.houses_ex(jd_ut, lat_rad, lon_rad, b'P', flags | swe.FLG_RADIANS)
-    asc_sign = signs[int(cusps[0] % 360 // 30)]
+    asc_sign = RASHI_NAMES[int(cusps[0] % 360 // 30)]
 
     # Ascendant‑lord and its transit (generic)
     lord_map = {
@@ -173,7 +176,7 @@ def get_sidereal_transits_ist(ist_dt, lat_deg, lon_deg, ephe_path='/app/ephe'):
     asc_lord = lord_map[asc_sign]
     planet_id = getattr(swe, asc_lord.upper())
     lord_lon = swe.calc_ut(jd_ut, planet_id, flags)[0][0] % 360
-    asc_lord_transit = signs[int(lord_lon // 30)]
+    asc_lord_transit = RASHI_NAMES[int(lord_lon // 30)]
 
     return {
        "moon_transit": moon_sign,
@@ -641,17 +644,13 @@ def get_lagnas_jhora(
         else:
             upapada_lagna = [0, 0]  # Default if Venus not found
         
-        # Get rashi names for better formatting
-        rashi_names = ['Aries', 'Taurus', 'Gemini', 'Cancer', 'Leo', 'Virgo',
-                      'Libra', 'Scorpio', 'Sagittarius', 'Capricorn', 'Aquarius', 'Pisces']
-        
         # Format lagna data with enhanced information
         def format_lagna_data(lagna_data, lagna_name, description):
             if isinstance(lagna_data, list) and len(lagna_data) >= 2:
                 constellation = lagna_data[0]
                 longitude = lagna_data[1]
-                rashi_name = rashi_names[constellation] if 0 <= constellation < 12 else "Unknown"
-                degrees = f"{int(longitude)}°{int((longitude % 1) * 60)}'"
+                rashi_name = RASHI_NAMES[constellation] if 0 <= constellation < 12 else "Unknown"
+                degrees = format_degrees(longitude)
                 
                 return {
                     "constellation": constellation,
@@ -1035,15 +1034,11 @@ def get_arudha_lagna_jhora(
         # Calculate Graha Arudhas (for each planet)
         graha_arudhas = graha_arudhas_from_planet_positions(planet_positions)
         
-        # Get rashi names (0-indexed: 0=Aries, 1=Taurus, etc.)
-        rashi_names = ['Aries', 'Taurus', 'Gemini', 'Cancer', 'Leo', 'Virgo',
-                      'Libra', 'Scorpio', 'Sagittarius', 'Capricorn', 'Aquarius', 'Pisces']
-        
         # Format Bhava Arudhas (A1-A12)
         bhava_arudha_data = {}
         for i, rashi in enumerate(bhava_arudhas):
             house_num = i + 1
-            rashi_name = rashi_names[rashi]
+            rashi_name = RASHI_NAMES[rashi]
             bhava_arudha_data[f'A{house_num}'] = {
                 'house': house_num,
                 'rashi': rashi,
@@ -1056,7 +1051,7 @@ def get_arudha_lagna_jhora(
         graha_arudha_data = {}
         for i, rashi in enumerate(graha_arudhas):
             planet_name = planet_names[i]
-            rashi_name = rashi_names[rashi]
+            rashi_name = RASHI_NAMES[rashi]
             graha_arudha_data[planet_name] = {
                 'planet': planet_name,
                 'rashi': rashi,
@@ -1072,7 +1067,7 @@ def get_arudha_lagna_jhora(
         else:  # If it's already 0-indexed
             asc_rashi_index = asc_house
             
-        asc_rashi_name = rashi_names[asc_rashi_index] if 0 <= asc_rashi_index < 12 else "Unknown"
+        asc_rashi_name = RASHI_NAMES[asc_rashi_index] if 0 <= asc_rashi_index < 12 else "Unknown"
         
         return {
             "bhava_arudhas": bhava_arudha_data,
@@ -1171,10 +1166,6 @@ def get_karakamsa_lagna_jhora(
             karakamsa_constellation = 0
             karakamsa_longitude = 0
         
-        # Get rashi names
-        rashi_names = ['Aries', 'Taurus', 'Gemini', 'Cancer', 'Leo', 'Virgo',
-                      'Libra', 'Scorpio', 'Sagittarius', 'Capricorn', 'Aquarius', 'Pisces']
-        
         # Planet names for Atmakaraka identification
         planet_names = ['Lagna', 'Sun', 'Moon', 'Mars', 'Mercury', 'Jupiter', 'Venus', 'Saturn', 'Rahu', 'Ketu']
         
@@ -1182,8 +1173,8 @@ def get_karakamsa_lagna_jhora(
             "karakamsa_lagna": {
                 "constellation": karakamsa_constellation,
                 "longitude": karakamsa_longitude,
-                "rashi_name": rashi_names[karakamsa_constellation] if 0 <= karakamsa_constellation < 12 else "Unknown",
-                "degrees": f"{int(karakamsa_longitude)}°{int((karakamsa_longitude % 1) * 60)}'",
+                "rashi_name": RASHI_NAMES[karakamsa_constellation] if 0 <= karakamsa_constellation < 12 else "Unknown",
+                "degrees": format_degrees(karakamsa_longitude),
                 "description": "Karakamsa Lagna - Navamsa sign of Atmakaraka for life purpose and dharma"
             },
             "atmakaraka": {
@@ -1626,12 +1617,6 @@ def calculate_birth_chart_moon_sun_signs(
         swe.set_ephe_path(ephe_path)
         swe.set_sid_mode(swe.SIDM_LAHIRI)  # Use Lahiri ayanamsa for Vedic astrology
         
-        # Zodiac sign names (0-indexed for calculations)
-        zodiac_signs = [
-            'Aries', 'Taurus', 'Gemini', 'Cancer', 'Leo', 'Virgo',
-            'Libra', 'Scorpio', 'Sagittarius', 'Capricorn', 'Aquarius', 'Pisces'
-        ]
-        
         # 1. CALCULATE BIRTH CHART SIGNS
         
         # Create birth datetime object
@@ -1659,21 +1644,21 @@ def calculate_birth_chart_moon_sun_signs(
         birth_moon_data = swe.calc_ut(birth_jd, swe.MOON, flags)
         birth_moon_longitude = birth_moon_data[0][0] % 360
         birth_moon_sign_index = int(birth_moon_longitude // 30)
-        birth_moon_sign = zodiac_signs[birth_moon_sign_index]
+        birth_moon_sign = RASHI_NAMES[birth_moon_sign_index]
         birth_moon_rashi = birth_moon_sign_index + 1
         
         # Sun position at birth  
         birth_sun_data = swe.calc_ut(birth_jd, swe.SUN, flags)
         birth_sun_longitude = birth_sun_data[0][0] % 360
         birth_sun_sign_index = int(birth_sun_longitude // 30)
-        birth_sun_sign = zodiac_signs[birth_sun_sign_index]
+        birth_sun_sign = RASHI_NAMES[birth_sun_sign_index]
         birth_sun_rashi = birth_sun_sign_index + 1
         
         # Ascendant position at birth
         birth_cusps, _ = swe.houses_ex(birth_jd, birth_latitude, birth_longitude, b'P', flags)
         birth_asc_longitude = birth_cusps[0] % 360  # First element is ascendant
         birth_asc_sign_index = int(birth_asc_longitude // 30)
-        birth_asc_sign = zodiac_signs[birth_asc_sign_index]
+        birth_asc_sign = RASHI_NAMES[birth_asc_sign_index]
         
         # Ascendant lord mapping
         ascendant_lords = {
@@ -1702,12 +1687,12 @@ def calculate_birth_chart_moon_sun_signs(
         current_moon_data = swe.calc_ut(current_jd, swe.MOON, flags)
         current_moon_longitude = current_moon_data[0][0] % 360
         current_moon_sign_index = int(current_moon_longitude // 30)
-        current_moon_sign = zodiac_signs[current_moon_sign_index]
+        current_moon_sign = RASHI_NAMES[current_moon_sign_index]
         
         current_sun_data = swe.calc_ut(current_jd, swe.SUN, flags)
         current_sun_longitude = current_sun_data[0][0] % 360
         current_sun_sign_index = int(current_sun_longitude // 30)
-        current_sun_sign = zodiac_signs[current_sun_sign_index]
+        current_sun_sign = RASHI_NAMES[current_sun_sign_index]
         
         # Calculate current ascendant lord transit
         planet_ids = {
@@ -1721,7 +1706,7 @@ def calculate_birth_chart_moon_sun_signs(
             current_asc_lord_data = swe.calc_ut(current_jd, current_asc_lord_id, flags)
             current_asc_lord_longitude = current_asc_lord_data[0][0] % 360
             current_asc_lord_sign_index = int(current_asc_lord_longitude // 30)
-            current_asc_lord_transit = zodiac_signs[current_asc_lord_sign_index]
+            current_asc_lord_transit = RASHI_NAMES[current_asc_lord_sign_index]
         else:
             current_asc_lord_transit = "Unknown"
             current_asc_lord_longitude = 0.0
@@ -1,7 +1,21 @@
-from typing import Sequence, Optional
+from types import MappingProxyType
+from typing import Mapping, Sequence, Optional
 from autogen_agentchat.base import TerminationCondition
 from autogen_agentchat.messages import StopMessage
 
+# Shared (agent_name -> keywords) table used when no extra terminations are given.
+# Read-only so every MessageTermination instance can reference it without copying.
+_DEFAULT_TERM_MAP: Mapping[str, tuple[str, ...]] = MappingProxyType({})
+
+
+def _build_term_map(extra_terminations) -> Mapping[str, tuple[str, ...]]:
+    """Index (agent_name, keyword) pairs by agent name into a read-only mapping."""
+    term_map: dict[str, tuple[str, ...]] = {}
+    for agent, keyword in extra_terminations:
+        term_map[agent] = term_map.get(agent, ()) + (keyword,)
+    return MappingProxyType(term_map)
+
+
 class MessageTermination(TerminationCondition):
     """Terminates the conversation when a specified agent outputs a message ending with a specified keyword (e.g., 'APPROVE' for VerificationAgent)."""
 
@@ -9,7 +23,18 @@ class MessageTermination(TerminationCondition):
         super().__init__()
         self._terminated = False
         # extra_terminations: list of (agent_name, keyword) pairs
-        self.extra_terminations = extra_terminations or []
+        if extra_terminations is None:
+            self._term_map = _DEFAULT_TERM_MAP
+        else:
+            self._term_map = _build_term_map(extra_terminations)
+
+    @property
+    def extra_terminations(self) -> tuple[tuple[str, str], ...]:
+        return tuple(
+            (agent, keyword)
+            for agent, keywords in self._term_map.items()
+            for keyword in keywords
+        )
 
     @property
     def terminated(self) -> bool:
@@ -22,22 +47,28 @@ class MessageTermination(TerminationCondition):
                 source="MessageTermination",
             )
 
+        term_map = self._term_map
+        if not term_map:
+            return None
+
         for message in messages:
-            if (
-                hasattr(message, "content")
-                and hasattr(message, "source")
-                and isinstance(message.content, str)
-            ):
-                content = message.content.strip()
-                # Only check extra terminations
-                for agent, keyword in self.extra_terminations:
-                    if getattr(message, "source", None) == agent and content.endswith(keyword):
-                        self._terminated = True
-                        return StopMessage(
-                            content=f"Received '{keyword}' message from {agent}.",
-                            source="MessageTermination",
-                        )
+            content = getattr(message, "content", None)
+            if not isinstance(content, str):
+                continue
+            agent = getattr(message, "source", None)
+            keywords = term_map.get(agent)
+            if not keywords:
+                continue
+            content = content.strip()
+            # Only check extra terminations
+            for keyword in keywords:
+                if content.endswith(keyword):
+                    self._terminated = True
+                    return StopMessage(
+                        content=f"Received '{keyword}' message from {agent}.",
+                        source="MessageTermination",
+                    )
         return None
 
     async def reset(self) -> None:
-        self._terminated = False 
\ No newline at end of file
+        self._terminated = False 
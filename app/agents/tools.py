@@ -1,14 +1,23 @@
 """
 Tools for the agent system.
 """
+import copy
+import functools
+import itertools
 import os
+import re
+import sys
+import time
+from types import MappingProxyType
 from tavily import TavilyClient
 from app.models import User
 from app.models.partner import Partner
-from datetime import datetime
-import pytz
+from datetime import date, datetime, timezone as dt_timezone
+from zoneinfo import ZoneInfo
+import numpy as np
 from geopy.geocoders import Nominatim
 from timezonefinder import TimezoneFinder
+import swisseph as swe
 from app.agents.astrology_utils import (
     get_transits_jhora as _get_transits,
     get_lagnas_jhora as _get_lagnas,
@@ -19,13 +28,35 @@ from app.agents.astrology_utils import (
     get_karakamsa_lagna_jhora as _get_karakamsa_lagna
 )
 
-from datetime import datetime
-
+from app.cache import get_cached_data, set_cached_data
+from app.schemas.user import ChartData
 from app.utils.logger import get_logger
 
 # Configure logging
 logger = get_logger(__name__)
 
+_JHORA_PATH = os.path.abspath(os.path.join(os.path.dirname(__file__), '../../jhora'))
+if _JHORA_PATH not in sys.path:
+    sys.path.append(_JHORA_PATH)
+from jhora import utils
+from jhora.panchanga import drik
+from jhora.panchanga.drik import Place
+from jhora.horoscope.chart.ashtakavarga import get_ashtaka_varga
+from jhora.horoscope.chart.strength import shad_bala
+
+# Swiss Ephemeris settings are process-global; configure them once instead of per call
+DEFAULT_EPHE_PATH = "/app/ephe"
+swe.set_ephe_path(DEFAULT_EPHE_PATH)
+swe.set_sid_mode(swe.SIDM_LAHIRI)
+_active_ephe_path = DEFAULT_EPHE_PATH
+
+def _set_ephe_path(ephe_path: str) -> None:
+    """Point Swiss Ephemeris at ephe_path, skipping the call when it is already active."""
+    global _active_ephe_path
+    if ephe_path != _active_ephe_path:
+        swe.set_ephe_path(ephe_path)
+        _active_ephe_path = ephe_path
+
 
 def create_person_data_tool(person: object, tool_name: str):
     """
@@ -43,18 +74,26 @@ def create_person_data_tool(person: object, tool_name: str):
     """
     if not isinstance(person, (User, Partner)):
         raise TypeError(f"Expected User or Partner, got {type(person).__name__}")
+    # Snapshot once: the person is fixed for the tool's lifetime, so calls skip the attribute reads
+    snapshot = {
+        "id": person.id,
+        "name": person.name,
+        "gender": getattr(person, "gender", None),
+        "city_of_birth": person.city_of_birth,
+        "current_residing_city": getattr(person, "current_residing_city", None),
+        "time_of_birth": person.time_of_birth.isoformat() if person.time_of_birth else None,
+    }
     def fetch_person_data():
-        return {
-            "id": person.id,
-            "name": person.name,
-            "gender": getattr(person, "gender", None),
-            "city_of_birth": person.city_of_birth,
-            "current_residing_city": getattr(person, "current_residing_city", None),
-            "time_of_birth": person.time_of_birth.isoformat() if person.time_of_birth else None,
-        }
+        return dict(snapshot)
     fetch_person_data.__name__ = tool_name
     return fetch_person_data
 
+TAVILY_KEY_MISSING_ERROR = "Error: TAVILY_API_KEY environment variable not set. Please configure your Tavily API key."
+
+# Tavily configuration is read once at import; the sync client keeps its own session
+_TAVILY_KEY = os.getenv("TAVILY_API_KEY")
+_TAVILY = TavilyClient(api_key=_TAVILY_KEY) if _TAVILY_KEY else None
+
 def web_search(query: str) -> str:
     """
     Search the web for astrology-related information using Tavily.
@@ -68,17 +107,12 @@ def web_search(query: str) -> str:
         web_search("current planetary positions")
         # Returns: summary and top results as string
     """
+    if _TAVILY is None:
+        return TAVILY_KEY_MISSING_ERROR
     try:
-        # Initialize Tavily client
-        tavily_api_key = os.getenv("TAVILY_API_KEY")
-        if not tavily_api_key:
-            return "Error: TAVILY_API_KEY environment variable not set. Please configure your Tavily API key."
-        
-        tavily_client = TavilyClient(api_key=tavily_api_key)
-        
         # Perform search with astrology context
         astrology_query = f"astrology {query}"
-        response = tavily_client.search(
+        response = _TAVILY.search(
             query=astrology_query,
             search_depth="advanced",  # Get more comprehensive results
             max_results=10,  # Limit results for better performance
@@ -113,6 +147,12 @@ def web_search(query: str) -> str:
     except Exception as e:
         return f"Error searching for astrology information: {str(e)}"
 
+@functools.lru_cache(maxsize=None)
+def _get_zoneinfo(name: str) -> ZoneInfo:
+    """Return the ZoneInfo for an IANA timezone name, constructed once per name."""
+    return ZoneInfo(name)
+
+@functools.lru_cache(maxsize=8192)
 def get_panchanga(
     birth_date: str,
     birth_time: str,
@@ -121,7 +161,7 @@ def get_panchanga(
     latitude: float,
     altitude: float = 0.0,
     ephe_path: str = "/app/ephe"
-) -> dict:
+) -> MappingProxyType:
     """
     Returns Moon's Rashi, Nakshatra, Pada, Tithi, Yoga, and Karana for Vedic compatibility.
     
@@ -134,28 +174,20 @@ def get_panchanga(
         altitude (float): Altitude in meters
         ephe_path (str): Path to ephemeris
     Returns:
-        dict: Panchanga details
+        MappingProxyType: Read-only panchanga details (cached per argument set)
     Example Usage:
         # Get the panchanga for a specific birth
         get_panchanga('1990-03-15', '06:30', 'Asia/Kolkata', 80.27, 13.08)
         # Returns: dict with moon_rashi, nakshatra, etc.
     """
-    import sys
-    sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../../jhora')))
-    import swisseph as swe
-    from jhora.panchanga import drik
-    from jhora.panchanga.drik import Place
-    from jhora import utils
-
-    # 1. Set up Swiss Ephemeris
-    swe.set_ephe_path(ephe_path)
-    swe.set_sid_mode(swe.SIDM_LAHIRI)
+    # 1. Set up Swiss Ephemeris (ephemeris path and sidereal mode are set at import)
+    _set_ephe_path(ephe_path)
     swe.set_topo(lon=longitude, lat=latitude, alt=altitude)
 
     # 2. Prepare datetime in UTC
-    dt = datetime.strptime(f"{birth_date} {birth_time}", "%Y-%m-%d %H:%M")
-    local_dt = pytz.timezone(timezone).localize(dt)
-    utc = local_dt.astimezone(pytz.utc)
+    dt = datetime.fromisoformat(f"{birth_date}T{birth_time}")
+    local_dt = dt.replace(tzinfo=_get_zoneinfo(timezone))
+    utc = local_dt.astimezone(dt_timezone.utc)
     jd = swe.julday(utc.year, utc.month, utc.day, utc.hour + utc.minute / 60.0)
 
     # 3. Place struct for drik
@@ -183,15 +215,16 @@ def get_panchanga(
     karana_info = drik.karana(jd, place)
     karana_num = karana_info[0]  # 1-60
 
-    logger.info(f"Moon Rashi: {moon_rashi}, Nakshatra: {nakshatra}, Pada: {pada}, Tithi: {tithi_num}, Yoga: {yoga_num}, Karana: {karana_num}")
-    return {
+    logger.debug("Moon Rashi: %s, Nakshatra: %s, Pada: %s, Tithi: %s, Yoga: %s, Karana: %s", moon_rashi, nakshatra, pada, tithi_num, yoga_num, karana_num)
+    # Read-only view: the result is cached and shared between callers
+    return MappingProxyType({
         "moon_rashi": moon_rashi,      # 1–12 (Aries–Pisces)
         "nakshatra": nakshatra,        # 1–27
         "pada": pada,                  # 1–4
         "tithi": tithi_num,            # 1–30
         "yoga": yoga_num,              # 1–27
         "karana": karana_num           # 1–60
-    }
+    })
 
 # --- Ashtakoota Data Tables ---
 RASHI_TO_VARNA = {
@@ -199,6 +232,9 @@ RASHI_TO_VARNA = {
     7: 'Shudra', 8: 'Kshatriya', 9: 'Kshatriya', 10: 'Vaishya', 11: 'Shudra', 12: 'Brahmin'
 }
 VARNA_HIERARCHY = {'Brahmin': 4, 'Kshatriya': 3, 'Vaishya': 2, 'Shudra': 1}
+# Rashi (1-12) -> varna rank; slot 0 is unused
+VARNA_RANK = np.array([0] + [VARNA_HIERARCHY[RASHI_TO_VARNA[r]] for r in range(1, 13)], dtype=np.int8)
+del VARNA_HIERARCHY
 RASHI_TO_VASHYA = {
     1: 'Chatushpada', 2: 'Chatushpada', 3: 'Dwipad', 4: 'Jalachar', 5: 'Chatushpada', 6: 'Dwipad',
     7: 'Dwipad', 8: 'Keeta', 9: 'Dwipad', 10: 'Jalachar', 11: 'Jalachar', 12: 'Jalachar'
@@ -247,55 +283,52 @@ YONI_TYPES = [
 # 13 traditional yoni types (Ashva, Gaja, Mesha, Sarpa, Shvana, Marjara, Nakula, Mushaka, Gau, Mahisha, Vyaghra, Mriga, Vana, Simha, Matsya)
 # But in Nakshatra mapping, only 13 are used, so we use those.
 
-# Friendly, enemy, highly inimical pairs from Vedic sources
-FRIENDLY_PAIRS = set([
+# Friendly, enemy, highly inimical pairs from Vedic sources.
+# Each relation is symmetric, so every pair is listed once in one orientation.
+FRIENDLY_PAIRS = (
     ('Ashva', 'Sarpa'), ('Ashva', 'Mriga'), ('Ashva', 'Vana'),
     ('Gaja', 'Mesha'), ('Gaja', 'Mahisha'), ('Gaja', 'Vana'),
     ('Mesha', 'Gau'), ('Mesha', 'Mahisha'),
-    ('Sarpa', 'Gaja'), ('Sarpa', 'Ashva'),
+    ('Sarpa', 'Gaja'),
     ('Shvana', 'Vana'),
     ('Marjara', 'Mriga'), ('Marjara', 'Simha'),
     ('Nakula', 'Matsya'),
     ('Mushaka', 'Marjara'),
-    ('Gau', 'Mesha'), ('Gau', 'Vyaghra'),
-    ('Mahisha', 'Gaja'), ('Mahisha', 'Mesha'),
-    ('Vyaghra', 'Gau'),
-    ('Mriga', 'Ashva'), ('Mriga', 'Marjara'),
-    ('Vana', 'Ashva'), ('Vana', 'Gaja'), ('Vana', 'Shvana'),
-    ('Simha', 'Marjara'),
-    ('Matsya', 'Nakula'),
-])
-ENEMY_PAIRS = set([
+    ('Gau', 'Vyaghra'),
+)
+ENEMY_PAIRS = (
     ('Ashva', 'Mahisha'), ('Gaja', 'Simha'), ('Mesha', 'Vana'), ('Sarpa', 'Nakula'),
-    ('Shvana', 'Mriga'), ('Marjara', 'Mushaka'), ('Nakula', 'Sarpa'),
-    ('Gau', 'Vyaghra'), ('Mahisha', 'Ashva'), ('Vyaghra', 'Gau'),
-    ('Mriga', 'Shvana'), ('Vana', 'Mesha'), ('Simha', 'Gaja'), ('Mushaka', 'Marjara')
-])
-HIGHLY_INIMICAL_PAIRS = set([
-    ('Ashva', 'Mahisha'), ('Mahisha', 'Ashva'),
-    ('Gaja', 'Simha'), ('Simha', 'Gaja'),
-    ('Mesha', 'Vana'), ('Vana', 'Mesha'),
-    ('Nakula', 'Sarpa'), ('Sarpa', 'Nakula'),
-    ('Mriga', 'Shvana'), ('Shvana', 'Mriga'),
-    ('Marjara', 'Mushaka'), ('Mushaka', 'Marjara'),
-    ('Gau', 'Vyaghra'), ('Vyaghra', 'Gau')
-])
-
-# Build the full YONI_COMPATIBILITY matrix
-YONI_COMPATIBILITY = {}
-for y1 in NAKSHATRA_TO_YONI.values():
-    for y2 in NAKSHATRA_TO_YONI.values():
-        pair = (y1, y2)
-        if y1 == y2:
-            YONI_COMPATIBILITY[pair] = 4
-        elif pair in HIGHLY_INIMICAL_PAIRS:
-            YONI_COMPATIBILITY[pair] = 0
-        elif pair in FRIENDLY_PAIRS or (y2, y1) in FRIENDLY_PAIRS:
-            YONI_COMPATIBILITY[pair] = 3
-        elif pair in ENEMY_PAIRS or (y2, y1) in ENEMY_PAIRS:
-            YONI_COMPATIBILITY[pair] = 1
-        else:
-            YONI_COMPATIBILITY[pair] = 2
+    ('Shvana', 'Mriga'), ('Marjara', 'Mushaka'), ('Gau', 'Vyaghra'),
+)
+HIGHLY_INIMICAL_PAIRS = (
+    ('Ashva', 'Mahisha'), ('Gaja', 'Simha'), ('Mesha', 'Vana'), ('Nakula', 'Sarpa'),
+    ('Mriga', 'Shvana'), ('Marjara', 'Mushaka'), ('Gau', 'Vyaghra'),
+)
+
+# Yoni compatibility as a symmetric matrix over yoni indices. Indices follow the yoni
+# names used by NAKSHATRA_TO_YONI; pair-table names without a nakshatra never match,
+# exactly as with the previous name-keyed lookups.
+YONI_NAMES = tuple(dict.fromkeys(NAKSHATRA_TO_YONI.values()))
+_YONI_TO_IDX = {name: i for i, name in enumerate(YONI_NAMES)}
+# Nakshatra (1-27) -> yoni index; slot 0 is unused
+YONI_IDX = np.array([0] + [_YONI_TO_IDX[NAKSHATRA_TO_YONI[n]] for n in range(1, 28)], dtype=np.int8)
+
+def _yoni_pair_indices(pairs):
+    """Return symmetric (rows, cols) yoni-index arrays covering both orientations of each indexed pair."""
+    idx = np.array(
+        [(_YONI_TO_IDX[y1], _YONI_TO_IDX[y2]) for y1, y2 in pairs if y1 in _YONI_TO_IDX and y2 in _YONI_TO_IDX],
+        dtype=np.intp
+    ).reshape(-1, 2)
+    return np.concatenate((idx[:, 0], idx[:, 1])), np.concatenate((idx[:, 1], idx[:, 0]))
+
+# Later assignments take precedence: same yoni > highly inimical > friendly > enemy > neutral.
+# Each category is written in both orientations, so a single [y1, y2] lookup always suffices.
+YONI_MAT = np.full((len(YONI_NAMES), len(YONI_NAMES)), 2, dtype=np.int8)
+for _pairs, _score in ((ENEMY_PAIRS, 1), (FRIENDLY_PAIRS, 3), (HIGHLY_INIMICAL_PAIRS, 0)):
+    YONI_MAT[_yoni_pair_indices(_pairs)] = _score
+np.fill_diagonal(YONI_MAT, 4)
+# Only the int8 matrix is needed at runtime; drop the name-keyed pair tables
+del _pairs, _score, FRIENDLY_PAIRS, ENEMY_PAIRS, HIGHLY_INIMICAL_PAIRS
 
 RASHI_LORDS = {
     1: 'Mars', 2: 'Venus', 3: 'Mercury', 4: 'Moon', 5: 'Sun', 6: 'Mercury', 7: 'Venus', 8: 'Mars', 9: 'Jupiter', 10: 'Saturn', 11: 'Saturn', 12: 'Jupiter'
@@ -330,6 +363,98 @@ NAKSHATRA_TO_NADI = {
     1: 'Adi', 2: 'Madhya', 3: 'Antya', 4: 'Adi', 5: 'Madhya', 6: 'Antya', 7: 'Adi', 8: 'Madhya', 9: 'Antya', 10: 'Adi', 11: 'Madhya', 12: 'Antya', 13: 'Adi', 14: 'Madhya', 15: 'Antya', 16: 'Adi', 17: 'Madhya', 18: 'Antya', 19: 'Adi', 20: 'Madhya', 21: 'Antya', 22: 'Adi', 23: 'Madhya', 24: 'Antya', 25: 'Adi', 26: 'Madhya', 27: 'Antya'
 }
 
+# --- Ashtakoota per-koota scorers (used once at import to fill the lookup matrices) ---
+# 5. Maitri (Graha Maitri)
+def _maitri_score(r1, r2):
+    lord1 = RASHI_LORDS[r1]
+    lord2 = RASHI_LORDS[r2]
+    if lord1 == lord2:
+        return 5
+    elif lord2 in PLANET_RELATIONSHIPS[lord1]['friends']:
+        return 4
+    elif lord2 in PLANET_RELATIONSHIPS[lord1]['neutral']:
+        return 3
+    elif lord2 in PLANET_RELATIONSHIPS[lord1]['enemies']:
+        return 1
+    return 0
+# 7. Bhakoot
+def _bhakoot_score(r1, r2):
+    return BHAKOOT_MATRIX.get((r1, r2), 0)
+# 8. Nadi
+def _nadi_score(n1, n2):
+    nadi1 = NAKSHATRA_TO_NADI[n1]
+    nadi2 = NAKSHATRA_TO_NADI[n2]
+    return 8 if nadi1 != nadi2 else 0
+
+def _build_score_matrix(score_fn, values, size, dtype=np.int8):
+    """Evaluate score_fn over every (a, b) pair of values into a (size, size) matrix."""
+    mat = np.zeros((size, size), dtype=dtype)
+    for a in values:
+        for b in values:
+            mat[a, b] = score_fn(a, b)
+    return mat
+
+# --- Precomputed Ashtakoota lookup matrices ---
+# Rashi tables are (13, 13) and nakshatra tables are (28, 28) so the 1-based rashi and
+# nakshatra numbers index them directly (row/column 0 is unused). All are [boy, girl]
+# except GANA_SCORE_MAT, which follows the gana table's [girl, boy] order.
+_RASHIS = range(1, 13)
+_NAKSHATRAS = range(1, 28)
+# Varna scores 1 when the boy's varna ranks at or above the girl's
+VARNA_SCORE_MAT = np.zeros((13, 13), dtype=np.int8)
+VARNA_SCORE_MAT[1:, 1:] = VARNA_RANK[1:, None] >= VARNA_RANK[None, 1:]
+# Vashya: same or compatible vashya type scores 2, otherwise 1; special rashi pairs override
+VASHYA_SCORE_MAT = np.zeros((13, 13), dtype=np.int8)
+for _r1 in _RASHIS:
+    for _r2 in _RASHIS:
+        _v1 = RASHI_TO_VASHYA[_r1]
+        _v2 = RASHI_TO_VASHYA[_r2]
+        VASHYA_SCORE_MAT[_r1, _r2] = 2 if _v1 == _v2 or _v2 in VASHYA_COMPATIBLE.get(_v1, []) else 1
+for (_r1, _r2), _score in VASHYA_SPECIAL.items():
+    VASHYA_SCORE_MAT[_r1, _r2] = _score
+del _r1, _r2, _v1, _v2, _score, RASHI_TO_VASHYA, VASHYA_COMPATIBLE, VASHYA_SPECIAL
+MAITRI_SCORE_MAT = _build_score_matrix(_maitri_score, _RASHIS, 13)
+BHAKOOT_MAT = _build_score_matrix(_bhakoot_score, _RASHIS, 13)
+# Tara Koota with fractional scores (see: https://www.jyotishgher.in/kundli-milan/tara-dosha.php).
+# Counts are inclusive (girl -> boy and boy -> girl), so the tara remainder is
+# ((distance - 1) mod 9) + 1; each favorable direction is worth 1.5.
+TARA_FAVORABLE = np.zeros(10, dtype=np.bool_)
+TARA_FAVORABLE[[2, 4, 6, 8, 9]] = True
+_nak = np.arange(1, 28)
+_boy_to_girl = _nak[:, None] - _nak[None, :]
+TARA_SCORE_MAT = np.zeros((28, 28), dtype=np.float32)
+TARA_SCORE_MAT[1:, 1:] = 1.5 * (
+    TARA_FAVORABLE[(_boy_to_girl - 1) % 9 + 1].astype(np.float32)
+    + TARA_FAVORABLE[(-_boy_to_girl - 1) % 9 + 1]
+)
+del _nak, _boy_to_girl
+# Gana: standard Gana Koota scoring table indexed [girl gana, boy gana] (see: https://www.anytimeastro.com/blog/astrology/gana-koota-in-kundli-matching/, https://www.astroyogi.com/blog/gana-koota-in-kundli-matching.aspx, https://www.ganeshaspeaks.com/astrology/nakshatras-constellations/gana-in-astrology/)
+GANA_TYPES = ('Deva', 'Manushya', 'Rakshasa')
+GANA_MAT = np.array([
+    [6, 6, 0],  # Deva
+    [5, 6, 1],  # Manushya
+    [1, 0, 6],  # Rakshasa
+], dtype=np.int8)
+# Nakshatra (1-27) -> gana index; slot 0 is unused
+GANA_IDX = np.array([0] + [GANA_TYPES.index(NAKSHATRA_TO_GANA[n]) for n in _NAKSHATRAS], dtype=np.int8)
+GANA_SCORE_MAT = np.zeros((28, 28), dtype=np.int8)
+GANA_SCORE_MAT[1:, 1:] = GANA_MAT[np.ix_(GANA_IDX[1:], GANA_IDX[1:])]
+NADI_SCORE_MAT = _build_score_matrix(_nadi_score, _NAKSHATRAS, 28)
+YONI_SCORE_MAT = np.zeros((28, 28), dtype=np.int8)
+YONI_SCORE_MAT[1:, 1:] = YONI_MAT[np.ix_(YONI_IDX[1:], YONI_IDX[1:])]
+
+# Static per-koota explanations; compatibility_ashtakoota hands out a plain dict copy
+ASHTAKOOTA_EXPLANATION = MappingProxyType({
+    'Varna': 'Varna (Personality): Based on Moon sign caste classification.',
+    'Vashya': 'Vashya (Dominance/Mutual Influence): Based on Rashi mutual influence.',
+    'Tara': 'Tara (Health): Based on Nakshatra distance.',
+    'Yoni': 'Yoni (Sexual): Based on Nakshatra yoni animal compatibility.',
+    'Maitri': 'Maitri (Friendship): Based on Moon lord friendship.',
+    'Gana': 'Gana (Temperament): Based on Nakshatra gana type.',
+    'Bhakoot': 'Bhakoot (Emotional): Based on Moon sign distance matrix.',
+    'Nadi': 'Nadi (Future Generation): Based on Nakshatra nadi type.'
+})
+
 def compatibility_ashtakoota(
     boy_rashi: int,
     boy_nakshatra: int,
@@ -355,130 +480,27 @@ def compatibility_ashtakoota(
         compatibility_ashtakoota(1, 5, 2, 3, 7, 1)
         # Returns: dict with scores and explanations
     """
-    # 1. Varna
-    def varna_score(r1, r2):
-        v1 = RASHI_TO_VARNA[r1]
-        v2 = RASHI_TO_VARNA[r2]
-        if v1 == v2 or VARNA_HIERARCHY[v1] >= VARNA_HIERARCHY[v2]:
-            return 1
-        return 0
-    # 2. Vashya
-    def vashya_score(r1, r2):
-        if (r1, r2) in VASHYA_SPECIAL:
-            return VASHYA_SPECIAL[(r1, r2)]
-        v1 = RASHI_TO_VASHYA[r1]
-        v2 = RASHI_TO_VASHYA[r2]
-        if v1 == v2 or v2 in VASHYA_COMPATIBLE.get(v1, []):
-            return 2
-        return 1
-    # 3. Tara
-    def tara_score(boy_nakshatra, girl_nakshatra):
-        # Tara Koota with fractional scores (see: https://www.jyotishgher.in/kundli-milan/tara-dosha.php)
-        # Count from girl to boy (inclusive)
-        d1 = (boy_nakshatra - girl_nakshatra) % 27
-        if d1 == 0:
-            d1 = 27
-        rem1 = d1 % 9
-        if rem1 == 0:
-            rem1 = 9
-        # Count from boy to girl (inclusive)
-        d2 = (girl_nakshatra - boy_nakshatra) % 27
-        if d2 == 0:
-            d2 = 27
-        rem2 = d2 % 9
-        if rem2 == 0:
-            rem2 = 9
-        favorable = {2, 4, 6, 8, 9}
-        even1 = rem1 in favorable
-        even2 = rem2 in favorable
-        if even1 and even2:
-            return 3
-        elif even1 or even2:
-            return 1.5
-        else:
-            return 0
-    # 4. Yoni
-    def yoni_score(n1, n2):
-        y1 = NAKSHATRA_TO_YONI[n1]
-        y2 = NAKSHATRA_TO_YONI[n2]
-        if (y1, y2) in YONI_COMPATIBILITY:
-            return YONI_COMPATIBILITY[(y1, y2)]
-        elif (y2, y1) in YONI_COMPATIBILITY:
-            return YONI_COMPATIBILITY[(y2, y1)]
-        return 2
-    # 5. Maitri (Graha Maitri)
-    def maitri_score(r1, r2):
-        lord1 = RASHI_LORDS[r1]
-        lord2 = RASHI_LORDS[r2]
-        if lord1 == lord2:
-            return 5
-        elif lord2 in PLANET_RELATIONSHIPS[lord1]['friends']:
-            return 4
-        elif lord2 in PLANET_RELATIONSHIPS[lord1]['neutral']:
-            return 3
-        elif lord2 in PLANET_RELATIONSHIPS[lord1]['enemies']:
-            return 1
-        return 0
-    # 6. Gana
-    def gana_score(girl_nakshatra, boy_nakshatra):
-        # Standard Gana Koota scoring table (see: https://www.anytimeastro.com/blog/astrology/gana-koota-in-kundli-matching/, https://www.astroyogi.com/blog/gana-koota-in-kundli-matching.aspx, https://www.ganeshaspeaks.com/astrology/nakshatras-constellations/gana-in-astrology/)
-        g1 = NAKSHATRA_TO_GANA[girl_nakshatra]
-        g2 = NAKSHATRA_TO_GANA[boy_nakshatra]
-        logger.info(f"Gana: {g1}, {g2}")
-        scoring_table = {
-            ('Deva', 'Deva'): 6,
-            ('Deva', 'Manushya'): 6,
-            ('Deva', 'Rakshasa'): 0,
-            ('Manushya', 'Deva'): 5,
-            ('Manushya', 'Manushya'): 6,
-            ('Manushya', 'Rakshasa'): 1,
-            ('Rakshasa', 'Deva'): 1,
-            ('Rakshasa', 'Manushya'): 0,
-            ('Rakshasa', 'Rakshasa'): 6,
-        }
-        return scoring_table.get((g1, g2), 0)
-    # 7. Bhakoot
-    def bhakoot_score(r1, r2):
-        return BHAKOOT_MATRIX.get((r1, r2), 0)
-    # 8. Nadi
-    def nadi_score(n1, n2):
-        nadi1 = NAKSHATRA_TO_NADI[n1]
-        nadi2 = NAKSHATRA_TO_NADI[n2]
-        return 8 if nadi1 != nadi2 else 0
-    # Dosha Cancellations
-    def nadi_dosha_cancel(r1, n1, r2, n2):
-        return (r1 == r2 and n1 != n2) or (n1 == n2 and r1 != r2) or (n1 == n2 and r1 == r2)
-    def bhakoot_dosha_cancel(r1, r2):
-        return r1 == r2
     # Compute all
     scores = {
-        'Varna': varna_score(boy_rashi, girl_rashi),
-        'Vashya': vashya_score(boy_rashi, girl_rashi),
-        'Tara': tara_score(boy_nakshatra, girl_nakshatra),
-        'Yoni': yoni_score(boy_nakshatra, girl_nakshatra),
-        'Maitri': maitri_score(boy_rashi, girl_rashi),
-        'Gana': gana_score(girl_nakshatra, boy_nakshatra),
-        'Bhakoot': bhakoot_score(boy_rashi, girl_rashi),
-        'Nadi': nadi_score(boy_nakshatra, girl_nakshatra),
+        'Varna': int(VARNA_SCORE_MAT[boy_rashi, girl_rashi]),
+        'Vashya': int(VASHYA_SCORE_MAT[boy_rashi, girl_rashi]),
+        'Tara': float(TARA_SCORE_MAT[boy_nakshatra, girl_nakshatra]),
+        'Yoni': int(YONI_SCORE_MAT[boy_nakshatra, girl_nakshatra]),
+        'Maitri': int(MAITRI_SCORE_MAT[boy_rashi, girl_rashi]),
+        'Gana': int(GANA_SCORE_MAT[girl_nakshatra, boy_nakshatra]),
+        'Bhakoot': int(BHAKOOT_MAT[boy_rashi, girl_rashi]),
+        'Nadi': int(NADI_SCORE_MAT[boy_nakshatra, girl_nakshatra]),
     }
 
     total = sum(scores.values())
-    # Dosha cancellation info
-    nadi_cancel = nadi_dosha_cancel(boy_rashi, boy_nakshatra, girl_rashi, girl_nakshatra)
-    bhakoot_cancel = bhakoot_dosha_cancel(boy_rashi, girl_rashi)
+    # Dosha cancellation info: Nadi is cancelled by a shared Rashi or a shared Nakshatra,
+    # Bhakoot by a shared Rashi
+    nadi_cancel = boy_rashi == girl_rashi or boy_nakshatra == girl_nakshatra
+    bhakoot_cancel = boy_rashi == girl_rashi
     return {
         'scores': scores,
         'total': total,
-        'explanation': {
-            'Varna': 'Varna (Personality): Based on Moon sign caste classification.',
-            'Vashya': 'Vashya (Dominance/Mutual Influence): Based on Rashi mutual influence.',
-            'Tara': 'Tara (Health): Based on Nakshatra distance.',
-            'Yoni': 'Yoni (Sexual): Based on Nakshatra yoni animal compatibility.',
-            'Maitri': 'Maitri (Friendship): Based on Moon lord friendship.',
-            'Gana': 'Gana (Temperament): Based on Nakshatra gana type.',
-            'Bhakoot': 'Bhakoot (Emotional): Based on Moon sign distance matrix.',
-            'Nadi': 'Nadi (Future Generation): Based on Nakshatra nadi type.'
-        },
+        'explanation': dict(ASHTAKOOTA_EXPLANATION),
         'dosha_cancellation': {
             'Nadi': nadi_cancel,
             'Bhakoot': bhakoot_cancel
@@ -486,6 +508,28 @@ def compatibility_ashtakoota(
     }
 
 # --- Utilities for geocoding and timezone ---
+# Geocoded coordinates never change, so keep them in Redis well beyond a process lifetime
+# (Nominatim allows ~1 request/second).
+GEOCODE_CACHE_TTL_SECONDS = 30 * 24 * 60 * 60
+
+_geolocator = None
+_timezone_finder = None
+
+def _get_geolocator() -> Nominatim:
+    """Return the process-wide Nominatim geocoder, creating it on first use."""
+    global _geolocator
+    if _geolocator is None:
+        _geolocator = Nominatim(user_agent="astro_app")
+    return _geolocator
+
+def _get_timezone_finder() -> TimezoneFinder:
+    """Return the process-wide TimezoneFinder, loading its polygon data on first use."""
+    global _timezone_finder
+    if _timezone_finder is None:
+        _timezone_finder = TimezoneFinder()
+    return _timezone_finder
+
+@functools.lru_cache(maxsize=4096)
 def get_lat_long(city_name: str):
     """
     Return (latitude, longitude) for a city name using geopy.
@@ -499,13 +543,18 @@ def get_lat_long(city_name: str):
         get_lat_long("Chennai")
         # Returns: (13.08, 80.27)
     """
-    geolocator = Nominatim(user_agent="astro_app")
-    location = geolocator.geocode(city_name, timeout=30)
+    cache_key = f"geocode:{city_name.strip().lower()}"
+    cached = get_cached_data(cache_key)
+    if cached:
+        return tuple(cached)
+    location = _get_geolocator().geocode(city_name, timeout=30)
     if location:
+        set_cached_data(cache_key, [location.latitude, location.longitude], GEOCODE_CACHE_TTL_SECONDS)
         return location.latitude, location.longitude
     else:
         raise ValueError(f"Could not geocode city: {city_name}")
 
+@functools.lru_cache(maxsize=4096)
 def get_timezone(lat: float, lon: float):
     """
     Return timezone string for given latitude and longitude using timezonefinder.
@@ -520,13 +569,74 @@ def get_timezone(lat: float, lon: float):
         get_timezone(13.08, 80.27)
         # Returns: 'Asia/Kolkata'
     """
-    tf = TimezoneFinder()
-    tz = tf.timezone_at(lng=lon, lat=lat)
+    tz = _get_timezone_finder().timezone_at(lng=lon, lat=lat)
     if tz:
         return tz
     else:
         raise ValueError(f"Could not find timezone for lat={lat}, lon={lon}")
 
+# --- Memoized JHora computations ---
+# Charts, dashas and lagnas are pure functions of the birth arguments, and the same birth is
+# re-queried across tools and turns. Results are cached per argument tuple and handed out as
+# deep copies so a caller mutating its result cannot poison the cache. Being process-wide, the
+# caches also absorb repeated lookups within one agent request, so no request-scoped memo is kept.
+def _memoize_copy(func, maxsize: int = 1024):
+    """Wrap func in an LRU cache whose hits return deep copies of the cached result."""
+    cached = functools.lru_cache(maxsize=maxsize)(func)
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        return copy.deepcopy(cached(*args, **kwargs))
+
+    wrapper.cache_info = cached.cache_info
+    wrapper.cache_clear = cached.cache_clear
+    return wrapper
+
+_cached_rasi_impl = _memoize_copy(_get_rasi_chart_with_dasha_and_significators_impl, maxsize=4096)
+_memoized_lagnas = _memoize_copy(_get_lagnas)
+
+def _cached_lagnas(
+    year: int,
+    month: int,
+    day: int,
+    hour: int,
+    minute: int,
+    second: int,
+    latitude: float,
+    longitude: float,
+    timezone_offset: float,
+    ayanamsa_mode: str = 'LAHIRI',
+    language: str = 'en',
+    divisional_chart_factor: int = 1
+) -> dict:
+    """Memoized _get_lagnas keyed on coordinates and offset rounded to 6 decimals, so near-identical floats share an entry."""
+    return _memoized_lagnas(
+        year, month, day, hour, minute, second,
+        round(latitude, 6), round(longitude, 6), round(timezone_offset, 6),
+        ayanamsa_mode, language, divisional_chart_factor
+    )
+
+_cached_arudha_lagna = _memoize_copy(_get_arudha_lagna)
+# get_divisional_chart serializes with model_dump, which already builds fresh dicts
+_cached_divisional_chart = functools.lru_cache(maxsize=1024)(_get_divisional_chart)
+
+@functools.lru_cache(maxsize=4096)
+def _jd_place(
+    year: int,
+    month: int,
+    day: int,
+    hour: int,
+    minute: int,
+    second: int,
+    latitude: float,
+    longitude: float,
+    timezone_offset: float
+) -> tuple:
+    """Return the jhora (julian day, drik.Place) pair for a birth; both are immutable and safe to share."""
+    jd = utils.julian_day_number(drik.Date(year, month, day), (hour, minute, second))
+    return jd, drik.Place('', latitude, longitude, timezone_offset)
+
+@_memoize_copy
 def get_transits(
     year: int,
     month: int,
@@ -584,7 +694,7 @@ def get_transits(
         get_transits(1990, 3, 15, 6, 30, 0, 13.08, 80.27, 5.5)
         # Returns: dict with transit chart info
     """
-    logger.info(f"get_transits called with: year={year}, month={month}, day={day}, hour={hour}, minute={minute}, second={second}, latitude={latitude}, longitude={longitude}, timezone_offset={timezone_offset}, language={language}, divisional_chart_factor={divisional_chart_factor}, years_from_birth={years_from_birth}, months={months}")
+    logger.debug("get_transits called with: year=%s, month=%s, day=%s, hour=%s, minute=%s, second=%s, latitude=%s, longitude=%s, timezone_offset=%s, language=%s, divisional_chart_factor=%s, years_from_birth=%s, months=%s", year, month, day, hour, minute, second, latitude, longitude, timezone_offset, language, divisional_chart_factor, years_from_birth, months)
     return _get_transits(
         year, month, day, hour, minute, second, latitude, longitude, timezone_offset,
         "LAHIRI", language, divisional_chart_factor, years_from_birth, months
@@ -648,13 +758,14 @@ def get_lagnas(
         get_lagnas(1990, 3, 15, 6, 30, 0, 13.08, 80.27, 5.5)
         # Returns: dict with lagna data
     """
-    logger.info(f"get_lagnas called with: year={year}, month={month}, day={day}, hour={hour}, minute={minute}, second={second}, latitude={latitude}, longitude={longitude}, timezone_offset={timezone_offset}, language={language}, divisional_chart_factor={divisional_chart_factor}")
-    return _get_lagnas(
+    logger.debug("get_lagnas called with: year=%s, month=%s, day=%s, hour=%s, minute=%s, second=%s, latitude=%s, longitude=%s, timezone_offset=%s, language=%s, divisional_chart_factor=%s", year, month, day, hour, minute, second, latitude, longitude, timezone_offset, language, divisional_chart_factor)
+    return _cached_lagnas(
         year, month, day, hour, minute, second, latitude, longitude, timezone_offset,
         "LAHIRI", language, divisional_chart_factor
     )
 
 
+@_memoize_copy
 def get_yogas(
     year: int,
     month: int,
@@ -697,7 +808,7 @@ def get_yogas(
         get_yogas(1990, 3, 15, 6, 30, 0, 13.08, 80.27, 5.5)
         # Returns: dict with yoga names only
     """
-    logger.info(f"get_yogas called with: year={year}, month={month}, day={day}, hour={hour}, minute={minute}, second={second}, latitude={latitude}, longitude={longitude}, timezone_offset={timezone_offset}, language={language}")
+    logger.debug("get_yogas called with: year=%s, month=%s, day=%s, hour=%s, minute=%s, second=%s, latitude=%s, longitude=%s, timezone_offset=%s, language=%s", year, month, day, hour, minute, second, latitude, longitude, timezone_offset, language)
     result = _get_yogas(
         year, month, day, hour, minute, second, latitude, longitude, timezone_offset,
         "LAHIRI", language
@@ -760,9 +871,9 @@ def get_divisional_chart(
                 "House 3: Empty",         # House 3 contents
                 ...                       # All 12 houses
             ],
-            "ascendant_house": 2,  # House number (0-11) where ascendant falls
-            "error": null          # Error message if any
+            "ascendant_house": 2   # House number (0-11) where ascendant falls
         }
+        Fields that are not set (e.g. "error" on success) are omitted.
         
         Chart names supported:
         - D1/D2/D3/D4/D5/D6/D7/D8/D9/D10/D11/D12/D16/D20/D24/D27/D30/D40/D45/D60/D81/D108/D144
@@ -774,13 +885,41 @@ def get_divisional_chart(
         get_divisional_chart('d9', 1990, 3, 15, 6, 30, 0, 13.08, 80.27, 5.5)
         # Returns: dict with divisional chart info
     """
-    logger.info(f"get_divisional_chart called with: chart={chart}, year={year}, month={month}, day={day}, hour={hour}, minute={minute}, second={second}, latitude={latitude}, longitude={longitude}, timezone_offset={timezone_offset}, language={language}")
-    chart_data = _get_divisional_chart(
+    logger.debug("get_divisional_chart called with: chart=%s, year=%s, month=%s, day=%s, hour=%s, minute=%s, second=%s, latitude=%s, longitude=%s, timezone_offset=%s, language=%s", chart, year, month, day, hour, minute, second, latitude, longitude, timezone_offset, language)
+    chart_data = _cached_divisional_chart(
         chart, year, month, day, hour, minute, second, latitude, longitude, timezone_offset,
         "LAHIRI", language
     )
     # Convert ChartData object to dictionary format as documented
-    return chart_data.model_dump()
+    return chart_data.model_dump(exclude_none=True)
+
+def get_divisional_chart_model(
+    chart: str,
+    year: int,
+    month: int,
+    day: int,
+    hour: int,
+    minute: int,
+    second: int,
+    latitude: float,
+    longitude: float,
+    timezone_offset: float,
+    language: str = 'en'
+) -> ChartData:
+    """
+    Return the divisional chart as a ChartData model for internal callers, skipping the dict conversion.
+    
+    The model is shared with the chart cache and must be treated as read-only. Arguments are the
+    same as get_divisional_chart.
+    
+    Example Usage:
+        # Read the D9 houses directly from the model
+        get_divisional_chart_model('d9', 1990, 3, 15, 6, 30, 0, 13.08, 80.27, 5.5).charts
+    """
+    return _cached_divisional_chart(
+        chart, year, month, day, hour, minute, second, latitude, longitude, timezone_offset,
+        "LAHIRI", language
+    )
 
 def get_rasi_chart_with_dasha_and_significators(
     year: int,
@@ -817,11 +956,109 @@ def get_rasi_chart_with_dasha_and_significators(
         get_rasi_chart_with_dasha_and_significators(1990, 3, 15, 6, 30, 0, '+05:30', 13.08, 80.27)
         # Returns: dict with chart and dasha info
     """
-    logger.info(f"get_rasi_chart_with_dasha_and_significators called with: year={year}, month={month}, day={day}, hour={hour}, minute={minute}, second={second}, utc={utc}, latitude={latitude}, longitude={longitude}, ayanamsa={ayanamsa}, house_system={house_system}")
-    return _get_rasi_chart_with_dasha_and_significators_impl(
+    logger.debug("get_rasi_chart_with_dasha_and_significators called with: year=%s, month=%s, day=%s, hour=%s, minute=%s, second=%s, utc=%s, latitude=%s, longitude=%s, ayanamsa=%s, house_system=%s", year, month, day, hour, minute, second, utc, latitude, longitude, ayanamsa, house_system)
+    return _cached_rasi_impl(
         year, month, day, hour, minute, second, utc, latitude, longitude, ayanamsa, house_system
     )
 
+# Dasha dates arrive as 'DD-MM-YYYY' or 'YYYY-MM-DD[ HH:MM:SS]'; one pattern captures either form
+_DASHA_DATE = re.compile(r'(\d{2})-(\d{2})-(\d{4})|(\d{4})-(\d{2})-(\d{2})')
+
+def _iso_date(value: str) -> str:
+    """Normalize a 'DD-MM-YYYY' or 'YYYY-MM-DD...' date string to 'YYYY-MM-DD', or 'NaT' if unrecognized."""
+    match = _DASHA_DATE.match(value)
+    if match is None:
+        return 'NaT'
+    day, month, year, iso_year, iso_month, iso_day = match.groups()
+    if year:
+        return f"{year}-{month}-{day}"
+    return f"{iso_year}-{iso_month}-{iso_day}"
+
+def _dasha_dates(periods: list) -> tuple:
+    """Parse the start/end strings of dasha or bhukti periods into datetime64[D] arrays (NaT when missing)."""
+    starts = np.array([_iso_date(p.get('start') or '') for p in periods], dtype='datetime64[D]')
+    ends = np.array([_iso_date(p.get('end') or '') for p in periods], dtype='datetime64[D]')
+    return starts, ends
+
+def _period_overlap(starts: np.ndarray, ends: np.ndarray, lo, hi, today) -> tuple:
+    """
+    Return (mask of periods overlapping [lo, hi), index among the masked periods that contains today or -1).
+    
+    A period contains today when start <= today < end; NaT dates never match. Period dates are
+    midnights, so this matches the datetime.now() check start <= now <= end at day granularity:
+    a period ending today has already ended. Periods are contiguous and chronological, so the
+    current one is found by binary search.
+    """
+    mask = (starts < hi) & (ends >= lo)
+    masked_starts = starts[mask]
+    current = int(np.searchsorted(masked_starts, today, side='right')) - 1
+    if current >= 0 and today < ends[mask][current]:
+        return mask, current
+    return mask, -1
+
+class _ReadOnlyDict(dict):
+    """
+    A dict that refuses mutation, for cached entries handed out by reference.
+    
+    Unlike MappingProxyType it is still a dict, so it serializes and prints like one in tool output;
+    copies (copy.copy, copy.deepcopy, pickling) come back as plain, mutable dicts.
+    """
+    __slots__ = ()
+    
+    def _read_only(self, *args, **kwargs):
+        raise TypeError("cached vimshottari entries are read-only; copy with dict(entry) to modify")
+    
+    __setitem__ = __delitem__ = __ior__ = _read_only
+    clear = pop = popitem = setdefault = update = _read_only
+    
+    def __copy__(self):
+        return dict(self)
+    
+    def __deepcopy__(self, memo):
+        return copy.deepcopy(dict(self), memo)
+    
+    def __reduce__(self):
+        return (dict, (dict(self),))
+
+@functools.lru_cache(maxsize=4096)
+def _vimshottari_timeline(
+    year: int,
+    month: int,
+    day: int,
+    hour: int,
+    minute: int,
+    second: int,
+    utc: str,
+    latitude: float,
+    longitude: float,
+    ayanamsa: str,
+    house_system: str
+) -> dict:
+    """
+    Return a birth's vimshottari dashas with every start/end date pre-parsed to datetime64[D].
+    
+    Parsing happens once per birth here, so get_vimshottari_dasha filters with plain array
+    compares. Bhukti entries are frozen as _ReadOnlyDict so results can share them by reference;
+    the other cached dicts and arrays are internal and must not be mutated.
+    """
+    chart_data = _cached_rasi_impl(
+        year, month, day, hour, minute, second, utc, latitude, longitude, ayanamsa, house_system
+    )
+    if chart_data.get('error'):
+        return {"error": chart_data['error']}
+    dashas = chart_data.get('vimshottari_dasa', [])
+    # Every date comes from the same producer, so checking the first one validates the format for all
+    if dashas and not _DASHA_DATE.match(dashas[0].get('start') or ''):
+        return {"error": f"Unrecognized vimshottari dasa date format: {dashas[0].get('start')!r}"}
+    starts, ends = _dasha_dates(dashas)
+    return {
+        "dashas": dashas,
+        "starts": starts,
+        "ends": ends,
+        "bhuktis": [tuple(_ReadOnlyDict(bhukti) for bhukti in dasha.get('bhuktis', [])) for dasha in dashas],
+        "bhukti_dates": [_dasha_dates(dasha.get('bhuktis', [])) for dasha in dashas]
+    }
+
 def get_vimshottari_dasha(
     year: int,
     month: int,
@@ -835,7 +1072,8 @@ def get_vimshottari_dasha(
     ayanamsa: str = 'Lahiri',
     house_system: str = 'Placidus',
     start_year: int = None,
-    end_year: int = None
+    end_year: int = None,
+    max_periods: int = None
 ) -> dict:
     """
     Calculate vimshottari dasha (planetary periods) for a given birth time and location within a specific period.
@@ -854,6 +1092,7 @@ def get_vimshottari_dasha(
         house_system (str): House system (default 'Placidus')
         start_year (int): Start year for dasha timeline (default: birth year)
         end_year (int): End year for dasha timeline (default: birth year + 120)
+        max_periods (int): Maximum number of dasha periods to return, earliest first (default: no limit)
     
     Returns:
         dict: Vimshottari dasha periods with the following structure:
@@ -928,6 +1167,12 @@ def get_vimshottari_dasha(
         - Only returns dasha periods that overlap with the requested year range
         - If no range specified, returns full 120-year cycle
         - Current dasha/bhukti only populated if within requested range
+        - Bhukti entries are shared, read-only dicts; copy one with dict(bhukti) before modifying it
+        - max_periods keeps only the first N overlapping dasha periods; pass a small value
+          (e.g. 5) when a wide range is requested and only the next few periods matter.
+          current_dasha/current_bhukti are still reported when the cap cuts them off
+        - The full cycle is computed once per birth and cached, so narrow ranges
+          (e.g. the current year) are sliced from it without recomputing the chart
     
     Example Usage:
         # Calculate vimshottari dasha for 2024-2030 for a birth
@@ -938,7 +1183,7 @@ def get_vimshottari_dasha(
         get_vimshottari_dasha(1990, 3, 15, 6, 30, 0, '+05:30', 13.08, 80.27)
         # Returns: dict with complete 120-year dasha cycle
     """
-    logger.info(f"get_vimshottari_dasha called with: year={year}, month={month}, day={day}, hour={hour}, minute={minute}, second={second}, utc={utc}, latitude={latitude}, longitude={longitude}, ayanamsa={ayanamsa}, house_system={house_system}, start_year={start_year}, end_year={end_year}")
+    logger.debug("get_vimshottari_dasha called with: year=%s, month=%s, day=%s, hour=%s, minute=%s, second=%s, utc=%s, latitude=%s, longitude=%s, ayanamsa=%s, house_system=%s, start_year=%s, end_year=%s, max_periods=%s", year, month, day, hour, minute, second, utc, latitude, longitude, ayanamsa, house_system, start_year, end_year, max_periods)
     
     try:
         # Set default period if not specified
@@ -947,23 +1192,18 @@ def get_vimshottari_dasha(
         if end_year is None:
             end_year = year + 120  # Full vimshottari cycle
         
-        logger.info(f"Using period: start_year={start_year}, end_year={end_year}")
+        started = time.perf_counter()
         
-        # Get the full chart data which includes vimshottari dasha
-        logger.info("Calling _get_rasi_chart_with_dasha_and_significators_impl...")
-        chart_data = _get_rasi_chart_with_dasha_and_significators_impl(
+        # Get the full vimshottari timeline with dates already parsed for this birth
+        timeline = _vimshottari_timeline(
             year, month, day, hour, minute, second, utc, latitude, longitude, ayanamsa, house_system
         )
         
-        logger.info(f"Chart data keys: {list(chart_data.keys()) if isinstance(chart_data, dict) else 'Not a dict'}")
-        
-        if chart_data.get('error'):
-            logger.error(f"Error in chart data: {chart_data['error']}")
-            return {"error": chart_data['error']}
-        
-        full_vimshottari_dasa = chart_data.get('vimshottari_dasa', [])
-        logger.info(f"Full vimshottari dasa count: {len(full_vimshottari_dasa)}")
+        if timeline.get('error'):
+            logger.error("Error in chart data: %s", timeline['error'])
+            return {"error": timeline['error']}
         
+        full_vimshottari_dasa = timeline['dashas']
         if not full_vimshottari_dasa:
             logger.warning("No vimshottari dasa data found in chart_data")
             return {
@@ -979,165 +1219,47 @@ def get_vimshottari_dasha(
                 "error": "No vimshottari dasa data available"
             }
         
-        # Filter dasha periods by the specified year range
-        filtered_dasha = []
-        for i, dasha in enumerate(full_vimshottari_dasa):
-            logger.info(f"Processing dasha {i+1}: {dasha.get('dasa_lord', 'Unknown')}")
-            
-            start_date = dasha.get('start', '')
-            end_date = dasha.get('end', '')
-            
-            logger.info(f"Dasha {i+1} dates: start={start_date}, end={end_date}")
-            
-            if start_date and end_date:
-                try:
-                    # Parse dates - they come in DD-MM-YYYY format
-                    if '-' in start_date and len(start_date.split('-')) == 3:
-                        # Check if it's DD-MM-YYYY format
-                        parts = start_date.split('-')
-                        if len(parts[0]) == 2 and len(parts[1]) == 2 and len(parts[2]) == 4:
-                            # Convert DD-MM-YYYY to YYYY-MM-DD
-                            dasha_start_year = int(parts[2])  # Year is the third part
-                            dasha_end_year = int(end_date.split('-')[2])  # Same for end date
-                        else:
-                            # Assume YYYY-MM-DD format
-                            dasha_start_year = int(parts[0])
-                            dasha_end_year = int(end_date.split('-')[0])
-                    else:
-                        logger.warning(f"Unexpected date format for dasha {i+1}: {start_date}")
-                        continue
-                    
-                    logger.info(f"Dasha {i+1} years: start_year={dasha_start_year}, end_year={dasha_end_year}")
-                    
-                    # Check if dasha period overlaps with requested range
-                    if (dasha_start_year <= end_year and dasha_end_year >= start_year):
-                        logger.info(f"Dasha {i+1} overlaps with requested period")
-                        
-                        # Filter bhuktis within the requested range
-                        filtered_bhuktis = []
-                        bhuktis = dasha.get('bhuktis', [])
-                        logger.info(f"Dasha {i+1} has {len(bhuktis)} bhuktis")
-                        
-                        for j, bhukti in enumerate(bhuktis):
-                            bhukti_start = bhukti.get('start', '')
-                            bhukti_end = bhukti.get('end', '')
-                            
-                            logger.info(f"Bhukti {j+1} dates: start={bhukti_start}, end={bhukti_end}")
-                            
-                            if bhukti_start and bhukti_end:
-                                try:
-                                    # Parse bhukti dates - same logic as dasha dates
-                                    if '-' in bhukti_start and len(bhukti_start.split('-')) == 3:
-                                        parts = bhukti_start.split('-')
-                                        if len(parts[0]) == 2 and len(parts[1]) == 2 and len(parts[2]) == 4:
-                                            # Convert DD-MM-YYYY to YYYY-MM-DD
-                                            bhukti_start_year = int(parts[2])
-                                            bhukti_end_year = int(bhukti_end.split('-')[2])
-                                        else:
-                                            # Assume YYYY-MM-DD format
-                                            bhukti_start_year = int(parts[0])
-                                            bhukti_end_year = int(bhukti_end.split('-')[0])
-                                    else:
-                                        logger.warning(f"Unexpected bhukti date format: {bhukti_start}")
-                                        continue
-                                    
-                                    logger.info(f"Bhukti {j+1} years: start_year={bhukti_start_year}, end_year={bhukti_end_year}")
-                                    
-                                    # Check if bhukti period overlaps with requested range
-                                    if (bhukti_start_year <= end_year and bhukti_end_year >= start_year):
-                                        logger.info(f"Bhukti {j+1} overlaps with requested period")
-                                        filtered_bhuktis.append(bhukti)
-                                    else:
-                                        logger.info(f"Bhukti {j+1} does not overlap with requested period")
-                                except Exception as e:
-                                    logger.warning(f"Error parsing bhukti dates: {e}")
-                                    # If we can't parse the bhukti dates, include it
-                                    filtered_bhuktis.append(bhukti)
-                        
-                        # Create filtered dasha entry
-                        filtered_dasha.append({
-                            "dasa_lord": dasha.get('dasa_lord'),
-                            "start": start_date,
-                            "end": end_date,
-                            "bhuktis": filtered_bhuktis
-                        })
-                        logger.info(f"Added filtered dasha {i+1} with {len(filtered_bhuktis)} bhuktis")
-                    else:
-                        logger.info(f"Dasha {i+1} does not overlap with requested period")
-                        
-                except Exception as e:
-                    logger.warning(f"Error parsing dasha dates: {e}")
-                    # If we can't parse the dasha dates, include it
-                    filtered_dasha.append(dasha)
+        # Filter dasha periods by the specified year range with array compares on the
+        # pre-parsed dates; the same pass locates the period containing today
+        # Loop invariants are bound once, already in the arrays' day unit
+        period_lo = np.datetime64(str(start_year), 'Y').astype('datetime64[D]')
+        period_hi = np.datetime64(str(end_year + 1), 'Y').astype('datetime64[D]')
+        today = np.datetime64(date.today())
+        bhukti_dates = timeline['bhukti_dates']
+        dasha_mask, current_index = _period_overlap(timeline['starts'], timeline['ends'], period_lo, period_hi, today)
         
-        logger.info(f"Filtered dasha count: {len(filtered_dasha)}")
+        def build_dasha(i: int) -> tuple:
+            dasha = full_vimshottari_dasa[i]
+            bhuktis = timeline['bhuktis'][i]
+            bhukti_mask, current_bhukti_index = _period_overlap(*bhukti_dates[i], period_lo, period_hi, today)
+            return {
+                "dasa_lord": dasha.get('dasa_lord'),
+                "start": dasha.get('start'),
+                "end": dasha.get('end'),
+                # Read-only bhukti entries are shared with the cached timeline; the list is per result
+                "bhuktis": [bhuktis[j] for j in np.flatnonzero(bhukti_mask)]
+            }, current_bhukti_index
         
-        # Find current dasha and bhukti
-        current_date = datetime.now()
+        dasha_indexes = np.flatnonzero(dasha_mask)
+        filtered_dasha = []
+        current_bhukti_indexes = []
+        # Periods past max_periods are never built
+        for i in dasha_indexes[:max_periods]:
+            filtered, current_bhukti_index = build_dasha(i)
+            filtered_dasha.append(filtered)
+            current_bhukti_indexes.append(current_bhukti_index)
+        
+        # Current dasha and bhukti (only within the requested range, even when max_periods cut it off)
         current_dasha = None
         current_bhukti = None
-        
-        logger.info(f"Current date: {current_date}")
-        
-        for i, dasha in enumerate(filtered_dasha):
-            start_date = dasha.get('start', '')
-            end_date = dasha.get('end', '')
-            if start_date and end_date:
-                try:
-                    # Parse dates for current dasha detection
-                    if '-' in start_date and len(start_date.split('-')) == 3:
-                        parts = start_date.split('-')
-                        if len(parts[0]) == 2 and len(parts[1]) == 2 and len(parts[2]) == 4:
-                            # Convert DD-MM-YYYY to datetime
-                            start_dt = datetime.strptime(f"{parts[2]}-{parts[1]}-{parts[0]}", '%Y-%m-%d')
-                            end_dt = datetime.strptime(f"{end_date.split('-')[2]}-{end_date.split('-')[1]}-{end_date.split('-')[0]}", '%Y-%m-%d')
-                        else:
-                            # Assume YYYY-MM-DD format
-                            start_dt = datetime.strptime(start_date, '%Y-%m-%d')
-                            end_dt = datetime.strptime(end_date, '%Y-%m-%d')
-                    else:
-                        continue
-                    
-                    logger.info(f"Checking dasha {i+1} period: {start_dt} to {end_dt}")
-                    
-                    if start_dt <= current_date <= end_dt:
-                        current_dasha = dasha
-                        logger.info(f"Found current dasha: {dasha.get('dasa_lord')}")
-                        
-                        # Find current bhukti within this dasha
-                        bhuktis = dasha.get('bhuktis', [])
-                        for j, bhukti in enumerate(bhuktis):
-                            bhukti_start = bhukti.get('start', '')
-                            bhukti_end = bhukti.get('end', '')
-                            if bhukti_start and bhukti_end:
-                                try:
-                                    # Parse bhukti dates
-                                    if '-' in bhukti_start and len(bhukti_start.split('-')) == 3:
-                                        parts = bhukti_start.split('-')
-                                        if len(parts[0]) == 2 and len(parts[1]) == 2 and len(parts[2]) == 4:
-                                            # Convert DD-MM-YYYY to datetime
-                                            bhukti_start_dt = datetime.strptime(f"{parts[2]}-{parts[1]}-{parts[0]}", '%Y-%m-%d')
-                                            bhukti_end_dt = datetime.strptime(f"{bhukti_end.split('-')[2]}-{bhukti_end.split('-')[1]}-{bhukti_end.split('-')[0]}", '%Y-%m-%d')
-                                        else:
-                                            # Assume YYYY-MM-DD format
-                                            bhukti_start_dt = datetime.strptime(bhukti_start, '%Y-%m-%d')
-                                            bhukti_end_dt = datetime.strptime(bhukti_end, '%Y-%m-%d')
-                                    else:
-                                        continue
-                                    
-                                    logger.info(f"Checking bhukti {j+1} period: {bhukti_start_dt} to {bhukti_end_dt}")
-                                    
-                                    if bhukti_start_dt <= current_date <= bhukti_end_dt:
-                                        current_bhukti = bhukti
-                                        logger.info(f"Found current bhukti: {bhukti.get('bhukti_lord')}")
-                                        break
-                                except Exception as e:
-                                    logger.warning(f"Error parsing bhukti dates for current detection: {e}")
-                                    continue
-                        break
-                except Exception as e:
-                    logger.warning(f"Error parsing dasha dates for current detection: {e}")
-                    continue
+        current_bhukti_index = -1
+        if 0 <= current_index < len(filtered_dasha):
+            current_dasha = filtered_dasha[current_index]
+            current_bhukti_index = current_bhukti_indexes[current_index]
+        elif current_index >= 0:
+            current_dasha, current_bhukti_index = build_dasha(dasha_indexes[current_index])
+        if current_bhukti_index >= 0:
+            current_bhukti = current_dasha['bhuktis'][current_bhukti_index]
         
         total_bhukti_periods = sum(len(d.get('bhuktis', [])) for d in filtered_dasha)
         
@@ -1153,11 +1275,16 @@ def get_vimshottari_dasha(
             }
         }
         
-        logger.info(f"Final result: {len(filtered_dasha)} dasha periods, {total_bhukti_periods} bhukti periods")
+        logger.info(
+            "get_vimshottari_dasha: %d dashas, %d bhuktis for %s-%s in %.1fms (current: %s/%s)",
+            len(filtered_dasha), total_bhukti_periods, start_year, end_year,
+            (time.perf_counter() - started) * 1000,
+            current_dasha and current_dasha.get('dasa_lord'), current_bhukti and current_bhukti.get('bhukti_lord')
+        )
         return result
         
     except Exception as e:
-        logger.exception(f"Error in get_vimshottari_dasha:")
+        logger.exception("Error in get_vimshottari_dasha:")
         return {"error": f"Failed to calculate vimshottari dasha: {str(e)}"}
 
 def get_arudha_lagna(
@@ -1213,11 +1340,11 @@ def get_arudha_lagna(
         get_arudha_lagna(1990, 3, 15, 6, 30, 0, 13.08, 80.27, 5.5)
         # Returns: dict with Arudha Lagna data
     """
-    logger.info(f"get_arudha_lagna called with: year={year}, month={month}, day={day}, hour={hour}, minute={minute}, second={second}, latitude={latitude}, longitude={longitude}, timezone_offset={timezone_offset}, ayanamsa_mode={ayanamsa_mode}, language={language}")
+    logger.debug("get_arudha_lagna called with: year=%s, month=%s, day=%s, hour=%s, minute=%s, second=%s, latitude=%s, longitude=%s, timezone_offset=%s, ayanamsa_mode=%s, language=%s", year, month, day, hour, minute, second, latitude, longitude, timezone_offset, ayanamsa_mode, language)
     
     # Convert timezone offset to the format expected by JHora
     # JHora expects timezone offset in hours (e.g., 5.5 for IST)
-    return _get_arudha_lagna(
+    return _cached_arudha_lagna(
         year, month, day, hour, minute, second,
         latitude, longitude, timezone_offset,
         ayanamsa_mode, language
@@ -1244,21 +1371,10 @@ def get_previous_conversation_context(user_id: str, n_pairs: int = 3, thread_id:
         "context_summary": "No previous context available"
     }
 
-def get_upapada_lagna(
-    year: int,
-    month: int,
-    day: int,
-    hour: int,
-    minute: int,
-    second: int,
-    latitude: float,
-    longitude: float,
-    timezone_offset: float,
-    ayanamsa_mode: str = 'LAHIRI',
-    language: str = 'en'
-) -> dict:
-    """
-    Generate Upapada Lagna data for marriage and spouse dynamics analysis.
+# The special lagna tools share one signature and body; each only picks its entry out of the
+# cached _get_lagnas result, so they are generated from one factory
+_SPECIAL_LAGNA_DOC = """
+    {summary}
     
     Args:
         year (int): Birth year
@@ -1274,148 +1390,107 @@ def get_upapada_lagna(
         language (str): Language for output (default 'en')
     
     Returns:
-        dict: Upapada Lagna data for marriage analysis
+        dict: {returns}
     
     Example Usage:
-        # Get Upapada Lagna for marriage analysis
-        get_upapada_lagna(1990, 3, 15, 6, 30, 0, 13.08, 80.27, 5.5)
+        # {example}
+        get_{lagna_key}(1990, 3, 15, 6, 30, 0, 13.08, 80.27, 5.5)
     """
-    logger.info(f"get_upapada_lagna called with: year={year}, month={month}, day={day}, hour={hour}, minute={minute}, second={second}, latitude={latitude}, longitude={longitude}, timezone_offset={timezone_offset}, ayanamsa_mode={ayanamsa_mode}, language={language}")
-    
-    # Use the enhanced get_lagnas function which now includes Upapada Lagna
-    lagnas_data = _get_lagnas(
-        year, month, day, hour, minute, second,
-        latitude, longitude, timezone_offset,
-        ayanamsa_mode, language
-    )
-    
-    if 'error' in lagnas_data:
-        return lagnas_data
-    
-    # Extract and return only Upapada Lagna data
-    return {
-        "upapada_lagna": lagnas_data.get("upapada_lagna", {}),
-        "chart_info": {
-            "description": "Upapada Lagna (UL) - Essential for marriage and spouse dynamics analysis",
-            "significance": "12th house from Venus, indicates marriage timing, spouse characteristics, and relationship dynamics"
+
+def _special_lagna_tool(lagna_key: str, summary: str, returns: str, example: str, chart_info: dict):
+    """Build a get_<lagna_key> tool returning that lagna from the cached lagnas plus a static chart_info block."""
+    def tool(
+        year: int,
+        month: int,
+        day: int,
+        hour: int,
+        minute: int,
+        second: int,
+        latitude: float,
+        longitude: float,
+        timezone_offset: float,
+        ayanamsa_mode: str = 'LAHIRI',
+        language: str = 'en'
+    ) -> dict:
+        logger.debug("get_%s called with: year=%s, month=%s, day=%s, hour=%s, minute=%s, second=%s, latitude=%s, longitude=%s, timezone_offset=%s, ayanamsa_mode=%s, language=%s", lagna_key, year, month, day, hour, minute, second, latitude, longitude, timezone_offset, ayanamsa_mode, language)
+        
+        lagnas_data = _cached_lagnas(
+            year, month, day, hour, minute, second,
+            latitude, longitude, timezone_offset,
+            ayanamsa_mode, language
+        )
+        
+        if 'error' in lagnas_data:
+            return lagnas_data
+        
+        return {
+            lagna_key: lagnas_data.get(lagna_key, {}),
+            "chart_info": dict(chart_info)
         }
+    
+    tool.__name__ = tool.__qualname__ = f"get_{lagna_key}"
+    tool.__doc__ = _SPECIAL_LAGNA_DOC.format(summary=summary, returns=returns, example=example, lagna_key=lagna_key)
+    return tool
+
+get_upapada_lagna = _special_lagna_tool(
+    "upapada_lagna",
+    "Generate Upapada Lagna data for marriage and spouse dynamics analysis.",
+    "Upapada Lagna data for marriage analysis",
+    "Get Upapada Lagna for marriage analysis",
+    {
+        "description": "Upapada Lagna (UL) - Essential for marriage and spouse dynamics analysis",
+        "significance": "12th house from Venus, indicates marriage timing, spouse characteristics, and relationship dynamics"
     }
+)
 
-def get_hora_lagna(
-    year: int,
-    month: int,
-    day: int,
-    hour: int,
-    minute: int,
-    second: int,
-    latitude: float,
-    longitude: float,
-    timezone_offset: float,
-    ayanamsa_mode: str = 'LAHIRI',
-    language: str = 'en'
-) -> dict:
-    """
-    Generate Hora Lagna data for wealth and financial rhythm analysis.
-    
-    Args:
-        year (int): Birth year
-        month (int): Birth month (1-12)
-        day (int): Birth day (1-31)
-        hour (int): Birth hour (0-23)
-        minute (int): Birth minute (0-59)
-        second (int): Birth second (0-59)
-        latitude (float): Latitude of birth place
-        longitude (float): Longitude of birth place
-        timezone_offset (float): Timezone offset in hours (e.g., 5.5 for IST)
-        ayanamsa_mode (str): Ayanamsa correction system (default 'LAHIRI')
-        language (str): Language for output (default 'en')
-    
-    Returns:
-        dict: Hora Lagna data for wealth analysis
-    
-    Example Usage:
-        # Get Hora Lagna for wealth analysis
-        get_hora_lagna(1990, 3, 15, 6, 30, 0, 13.08, 80.27, 5.5)
-    """
-    logger.info(f"get_hora_lagna called with: year={year}, month={month}, day={day}, hour={hour}, minute={minute}, second={second}, latitude={latitude}, longitude={longitude}, timezone_offset={timezone_offset}, ayanamsa_mode={ayanamsa_mode}, language={language}")
-    
-    # Use the enhanced get_lagnas function which includes Hora Lagna
-    lagnas_data = _get_lagnas(
-        year, month, day, hour, minute, second,
-        latitude, longitude, timezone_offset,
-        ayanamsa_mode, language
-    )
-    
-    if 'error' in lagnas_data:
-        return lagnas_data
-    
-    # Extract and return only Hora Lagna data
-    return {
-        "hora_lagna": lagnas_data.get("hora_lagna", {}),
-        "chart_info": {
-            "description": "Hora Lagna (HL) - Wealth and financial rhythm analysis",
-            "significance": "Indicates wealth accumulation patterns, financial prosperity, and material gains timing"
-        }
+get_hora_lagna = _special_lagna_tool(
+    "hora_lagna",
+    "Generate Hora Lagna data for wealth and financial rhythm analysis.",
+    "Hora Lagna data for wealth analysis",
+    "Get Hora Lagna for wealth analysis",
+    {
+        "description": "Hora Lagna (HL) - Wealth and financial rhythm analysis",
+        "significance": "Indicates wealth accumulation patterns, financial prosperity, and material gains timing"
     }
+)
 
-def get_ghatika_lagna(
-    year: int,
-    month: int,
-    day: int,
-    hour: int,
-    minute: int,
-    second: int,
-    latitude: float,
-    longitude: float,
-    timezone_offset: float,
-    ayanamsa_mode: str = 'LAHIRI',
-    language: str = 'en'
-) -> dict:
-    """
-    Generate Ghatika Lagna data for power, authority, and social ascension analysis.
-    
-    Args:
-        year (int): Birth year
-        month (int): Birth month (1-12)
-        day (int): Birth day (1-31)
-        hour (int): Birth hour (0-23)
-        minute (int): Birth minute (0-59)
-        second (int): Birth second (0-59)
-        latitude (float): Latitude of birth place
-        longitude (float): Longitude of birth place
-        timezone_offset (float): Timezone offset in hours (e.g., 5.5 for IST)
-        ayanamsa_mode (str): Ayanamsa correction system (default 'LAHIRI')
-        language (str): Language for output (default 'en')
-    
-    Returns:
-        dict: Ghatika Lagna data for power and authority analysis
-    
-    Example Usage:
-        # Get Ghatika Lagna for power analysis
-        get_ghatika_lagna(1990, 3, 15, 6, 30, 0, 13.08, 80.27, 5.5)
-    """
-    logger.info(f"get_ghatika_lagna called with: year={year}, month={month}, day={day}, hour={hour}, minute={minute}, second={second}, latitude={latitude}, longitude={longitude}, timezone_offset={timezone_offset}, ayanamsa_mode={ayanamsa_mode}, language={language}")
-    
-    # Use the enhanced get_lagnas function which includes Ghatika Lagna
-    lagnas_data = _get_lagnas(
-        year, month, day, hour, minute, second,
-        latitude, longitude, timezone_offset,
-        ayanamsa_mode, language
-    )
-    
-    if 'error' in lagnas_data:
-        return lagnas_data
-    
-    # Extract and return only Ghatika Lagna data
-    return {
-        "ghatika_lagna": lagnas_data.get("ghatika_lagna", {}),
-        "chart_info": {
-            "description": "Ghatika Lagna (GL) - Power, authority, and social ascension analysis",
-            "significance": "Indicates power dynamics, authority positions, and social climbing opportunities"
-        }
+get_ghatika_lagna = _special_lagna_tool(
+    "ghatika_lagna",
+    "Generate Ghatika Lagna data for power, authority, and social ascension analysis.",
+    "Ghatika Lagna data for power and authority analysis",
+    "Get Ghatika Lagna for power analysis",
+    {
+        "description": "Ghatika Lagna (GL) - Power, authority, and social ascension analysis",
+        "significance": "Indicates power dynamics, authority positions, and social climbing opportunities"
+    }
+)
+
+get_sree_lagna = _special_lagna_tool(
+    "sree_lagna",
+    "Generate Sree Lagna data for overall prosperity and fortune analysis.",
+    "Sree Lagna data for prosperity analysis",
+    "Get Sree Lagna for prosperity analysis",
+    {
+        "description": "Sree Lagna - Overall prosperity and fortune analysis",
+        "significance": "Indicates general prosperity, fortune, and success in life endeavors"
     }
+)
+
+get_indu_lagna = _special_lagna_tool(
+    "indu_lagna",
+    "Generate Indu Lagna data for wealth inflow and prosperity analysis.",
+    "Indu Lagna data for wealth inflow analysis",
+    "Get Indu Lagna for wealth inflow analysis",
+    {
+        "description": "Indu Lagna - Wealth inflow and prosperity analysis",
+        "significance": "Indicates wealth accumulation patterns, financial inflow, and prosperity timing"
+    }
+)
+
+# Lagna names accepted by get_all_lagnas; all but arudha_lagna come from the one _get_lagnas result
+SPECIAL_LAGNAS = ('upapada_lagna', 'hora_lagna', 'ghatika_lagna', 'sree_lagna', 'indu_lagna', 'arudha_lagna')
 
-def get_sree_lagna(
+def get_all_lagnas(
     year: int,
     month: int,
     day: int,
@@ -1426,10 +1501,13 @@ def get_sree_lagna(
     longitude: float,
     timezone_offset: float,
     ayanamsa_mode: str = 'LAHIRI',
-    language: str = 'en'
+    language: str = 'en',
+    which: list[str] = None
 ) -> dict:
     """
-    Generate Sree Lagna data for overall prosperity and fortune analysis.
+    Generate Upapada, Hora, Ghatika, Sree, Indu and Arudha Lagnas in one call.
+    
+    Use this instead of the individual get_*_lagna tools whenever two or more lagnas are needed.
     
     Args:
         year (int): Birth year
@@ -1443,36 +1521,76 @@ def get_sree_lagna(
         timezone_offset (float): Timezone offset in hours (e.g., 5.5 for IST)
         ayanamsa_mode (str): Ayanamsa correction system (default 'LAHIRI')
         language (str): Language for output (default 'en')
+        which (list[str]): Lagnas to return, any of 'upapada_lagna', 'hora_lagna', 'ghatika_lagna',
+            'sree_lagna', 'indu_lagna', 'arudha_lagna' (default: all of them)
     
     Returns:
-        dict: Sree Lagna data for prosperity analysis
+        dict: Special lagnas computed from a single lagna calculation:
+        {
+            "upapada_lagna": {...},   # Marriage and spouse dynamics
+            "hora_lagna": {...},      # Wealth and financial rhythm
+            "ghatika_lagna": {...},   # Power and authority
+            "sree_lagna": {...},      # Overall prosperity
+            "indu_lagna": {...},      # Wealth inflow
+            "arudha_lagna": {"bhava_arudhas": {...}, "graha_arudhas": {...}},
+            "chart_info": {...}       # Arudha chart info (only with arudha_lagna)
+        }
+        Only the requested lagnas are included when `which` is given.
+        
+        Error case: {"error": "error message"}
     
     Example Usage:
-        # Get Sree Lagna for prosperity analysis
-        get_sree_lagna(1990, 3, 15, 6, 30, 0, 13.08, 80.27, 5.5)
+        # Get every special lagna for a birth instead of calling each get_*_lagna tool
+        get_all_lagnas(1990, 3, 15, 6, 30, 0, 13.08, 80.27, 5.5)
+        
+        # Get only the wealth-related lagnas
+        get_all_lagnas(1990, 3, 15, 6, 30, 0, 13.08, 80.27, 5.5, which=['hora_lagna', 'indu_lagna'])
     """
-    logger.info(f"get_sree_lagna called with: year={year}, month={month}, day={day}, hour={hour}, minute={minute}, second={second}, latitude={latitude}, longitude={longitude}, timezone_offset={timezone_offset}, ayanamsa_mode={ayanamsa_mode}, language={language}")
-    
-    # Use the enhanced get_lagnas function which includes Sree Lagna
-    lagnas_data = _get_lagnas(
-        year, month, day, hour, minute, second,
-        latitude, longitude, timezone_offset,
-        ayanamsa_mode, language
-    )
-    
-    if 'error' in lagnas_data:
-        return lagnas_data
-    
-    # Extract and return only Sree Lagna data
-    return {
-        "sree_lagna": lagnas_data.get("sree_lagna", {}),
-        "chart_info": {
-            "description": "Sree Lagna - Overall prosperity and fortune analysis",
-            "significance": "Indicates general prosperity, fortune, and success in life endeavors"
+    logger.debug("get_all_lagnas called with: year=%s, month=%s, day=%s, hour=%s, minute=%s, second=%s, latitude=%s, longitude=%s, timezone_offset=%s, ayanamsa_mode=%s, language=%s, which=%s", year, month, day, hour, minute, second, latitude, longitude, timezone_offset, ayanamsa_mode, language, which)
+    
+    names = SPECIAL_LAGNAS if which is None else [name.strip().lower() for name in which]
+    unknown = [name for name in names if name not in SPECIAL_LAGNAS]
+    if unknown:
+        return {"error": f"Unknown lagna: {', '.join(unknown)}. Supported: {', '.join(SPECIAL_LAGNAS)}"}
+    
+    # Each underlying computation runs (or hits its cache) at most once, and only if needed
+    result = {}
+    if any(name != 'arudha_lagna' for name in names):
+        lagnas_data = _cached_lagnas(
+            year, month, day, hour, minute, second,
+            latitude, longitude, timezone_offset,
+            ayanamsa_mode, language
+        )
+        if 'error' in lagnas_data:
+            return lagnas_data
+        for name in names:
+            if name != 'arudha_lagna':
+                result[name] = lagnas_data.get(name, {})
+    
+    if 'arudha_lagna' in names:
+        arudha_data = _cached_arudha_lagna(
+            year, month, day, hour, minute, second,
+            latitude, longitude, timezone_offset,
+            ayanamsa_mode, language
+        )
+        if 'error' in arudha_data:
+            return arudha_data
+        result["arudha_lagna"] = {
+            "bhava_arudhas": arudha_data.get("bhava_arudhas", {}),
+            "graha_arudhas": arudha_data.get("graha_arudhas", {})
         }
-    }
+        result["chart_info"] = arudha_data.get("chart_info", {})
+    return result
 
-def get_indu_lagna(
+# Artifact names accepted by get_birth_bundle (plus any divisional chart such as 'd9')
+BIRTH_BUNDLE_ARTIFACTS = ('rasi_chart', 'vimshottari_dasha', 'lagnas', 'special_lagnas', 'arudha_lagna', 'yogas')
+
+def _utc_offset_string(timezone_offset: float) -> str:
+    """Format a timezone offset in hours as a '+HH:MM' UTC offset string."""
+    hours, minutes = divmod(round(abs(timezone_offset) * 60), 60)
+    return f"{'-' if timezone_offset < 0 else '+'}{hours:02d}:{minutes:02d}"
+
+def get_birth_bundle(
     year: int,
     month: int,
     day: int,
@@ -1482,11 +1600,13 @@ def get_indu_lagna(
     latitude: float,
     longitude: float,
     timezone_offset: float,
-    ayanamsa_mode: str = 'LAHIRI',
+    artifacts: list[str],
+    start_year: int = None,
+    end_year: int = None,
     language: str = 'en'
 ) -> dict:
     """
-    Generate Indu Lagna data for wealth inflow and prosperity analysis.
+    Generate several charts for one birth in a single call instead of one tool call per chart.
     
     Args:
         year (int): Birth year
@@ -1498,36 +1618,52 @@ def get_indu_lagna(
         latitude (float): Latitude of birth place
         longitude (float): Longitude of birth place
         timezone_offset (float): Timezone offset in hours (e.g., 5.5 for IST)
-        ayanamsa_mode (str): Ayanamsa correction system (default 'LAHIRI')
-        language (str): Language for output (default 'en')
+        artifacts (list[str]): Any of 'rasi_chart', 'vimshottari_dasha', 'lagnas', 'special_lagnas',
+            'arudha_lagna', 'yogas', or a divisional chart name such as 'd1', 'd9', 'd10'
+        start_year (int): Start year for 'vimshottari_dasha' (default: birth year)
+        end_year (int): End year for 'vimshottari_dasha' (default: birth year + 120)
+        language (str): Output language (default 'en')
     
     Returns:
-        dict: Indu Lagna data for wealth inflow analysis
+        dict: One entry per requested artifact, keyed by the artifact name, each with the same
+        shape as the matching single-purpose tool (get_rasi_chart_with_dasha_and_significators,
+        get_vimshottari_dasha, get_lagnas, get_all_lagnas, get_arudha_lagna, get_yogas,
+        get_divisional_chart). Unknown names map to {"error": "..."}.
     
     Example Usage:
-        # Get Indu Lagna for wealth inflow analysis
-        get_indu_lagna(1990, 3, 15, 6, 30, 0, 13.08, 80.27, 5.5)
+        # Get the D1 and D9 charts plus the current dasha for a birth
+        get_birth_bundle(1990, 3, 15, 6, 30, 0, 13.08, 80.27, 5.5, ['d1', 'd9', 'vimshottari_dasha'], 2024, 2026)
     """
-    logger.info(f"get_indu_lagna called with: year={year}, month={month}, day={day}, hour={hour}, minute={minute}, second={second}, latitude={latitude}, longitude={longitude}, timezone_offset={timezone_offset}, ayanamsa_mode={ayanamsa_mode}, language={language}")
-    
-    # Use the enhanced get_lagnas function which includes Indu Lagna
-    lagnas_data = _get_lagnas(
-        year, month, day, hour, minute, second,
-        latitude, longitude, timezone_offset,
-        ayanamsa_mode, language
-    )
-    
-    if 'error' in lagnas_data:
-        return lagnas_data
-    
-    # Extract and return only Indu Lagna data
-    return {
-        "indu_lagna": lagnas_data.get("indu_lagna", {}),
-        "chart_info": {
-            "description": "Indu Lagna - Wealth inflow and prosperity analysis",
-            "significance": "Indicates wealth accumulation patterns, financial inflow, and prosperity timing"
-        }
-    }
+    logger.debug("get_birth_bundle called with: year=%s, month=%s, day=%s, hour=%s, minute=%s, second=%s, latitude=%s, longitude=%s, timezone_offset=%s, artifacts=%s, start_year=%s, end_year=%s, language=%s", year, month, day, hour, minute, second, latitude, longitude, timezone_offset, artifacts, start_year, end_year, language)
+    birth = (year, month, day, hour, minute, second)
+    utc = _utc_offset_string(timezone_offset)
+    
+    # Every artifact is served from the shared chart caches, so overlapping requests
+    # (e.g. lagnas and special_lagnas) reuse one computation
+    bundle = {}
+    for artifact in artifacts:
+        name = artifact.strip().lower()
+        if name == 'rasi_chart':
+            bundle[artifact] = get_rasi_chart_with_dasha_and_significators(*birth, utc, latitude, longitude)
+        elif name == 'vimshottari_dasha':
+            bundle[artifact] = get_vimshottari_dasha(
+                *birth, utc, latitude, longitude, start_year=start_year, end_year=end_year
+            )
+        elif name == 'lagnas':
+            bundle[artifact] = get_lagnas(*birth, latitude, longitude, timezone_offset, language)
+        elif name == 'special_lagnas':
+            bundle[artifact] = get_all_lagnas(*birth, latitude, longitude, timezone_offset, language=language)
+        elif name == 'arudha_lagna':
+            bundle[artifact] = get_arudha_lagna(*birth, latitude, longitude, timezone_offset, language=language)
+        elif name == 'yogas':
+            bundle[artifact] = get_yogas(*birth, latitude, longitude, timezone_offset, language)
+        elif name[:1] == 'd' and name[1:].isdigit():
+            bundle[artifact] = get_divisional_chart(name, *birth, latitude, longitude, timezone_offset, language)
+        else:
+            bundle[artifact] = {
+                "error": f"Unknown artifact: {artifact}. Supported: {', '.join(BIRTH_BUNDLE_ARTIFACTS)} or a divisional chart like 'd9'"
+            }
+    return bundle
 
 def get_karakamsa_lagna(
     year: int,
@@ -1565,7 +1701,7 @@ def get_karakamsa_lagna(
         # Get Karakamsa Lagna for life purpose analysis
         get_karakamsa_lagna(1990, 3, 15, 6, 30, 0, 13.08, 80.27, 5.5)
     """
-    logger.info(f"get_karakamsa_lagna called with: year={year}, month={month}, day={day}, hour={hour}, minute={minute}, second={second}, latitude={latitude}, longitude={longitude}, timezone_offset={timezone_offset}, ayanamsa_mode={ayanamsa_mode}, language={language}")
+    logger.debug("get_karakamsa_lagna called with: year=%s, month=%s, day=%s, hour=%s, minute=%s, second=%s, latitude=%s, longitude=%s, timezone_offset=%s, ayanamsa_mode=%s, language=%s", year, month, day, hour, minute, second, latitude, longitude, timezone_offset, ayanamsa_mode, language)
     
     # Use the specialized Karakamsa Lagna function
     return _get_karakamsa_lagna(
@@ -1574,6 +1710,9 @@ def get_karakamsa_lagna(
         ayanamsa_mode, language
     )
 
+# Rows of jhora's binna ashtaka varga matrix
+ASHTAKAVARGA_PLANETS = ('Sun', 'Moon', 'Mars', 'Mercury', 'Jupiter', 'Venus', 'Saturn', 'Lagna')
+
 def get_ashtakavarga(
     year: int,
     month: int,
@@ -1623,54 +1762,44 @@ def get_ashtakavarga(
         get_ashtakavarga(1990, 3, 15, 6, 30, 0, 13.08, 80.27, 5.5)
         # Returns: dict with Ashtakavarga strength analysis
     """
-    logger.info(f"get_ashtakavarga called with: year={year}, month={month}, day={day}, hour={hour}, minute={minute}, second={second}, latitude={latitude}, longitude={longitude}, timezone_offset={timezone_offset}, ayanamsa_mode={ayanamsa_mode}, language={language}")
+    logger.debug("get_ashtakavarga called with: year=%s, month=%s, day=%s, hour=%s, minute=%s, second=%s, latitude=%s, longitude=%s, timezone_offset=%s, ayanamsa_mode=%s, language=%s", year, month, day, hour, minute, second, latitude, longitude, timezone_offset, ayanamsa_mode, language)
     
     try:
-        # Import required jhora modules
-        from jhora.panchanga import drik
-        from jhora import utils
-        
         # Calculate planetary positions directly using jhora
-        jd = utils.julian_day_number(drik.Date(year, month, day), (hour, minute, second))
-        place = drik.Place('', latitude, longitude, timezone_offset)
+        jd, place = _jd_place(year, month, day, hour, minute, second, latitude, longitude, timezone_offset)
         
         # Get planetary positions for D1 chart
         planet_positions = drik.planetary_positions(jd, place)
         ascendant_info = drik.ascendant(jd, place)
         
-        # Create house_to_planet_list format expected by jhora
-        # Initialize with empty houses
-        house_to_planet_list = ['' for _ in range(12)]
+        # Create house_to_planet_list format expected by jhora ('0/4/L' style entries):
+        # collect the occupants of each house first and format every entry once at the end.
+        # Planet index (0=Sun, 1=Moon, etc.) and house/constellation number (0-11) per planet:
+        planet_ids = np.fromiter((p[0] for p in planet_positions), dtype=np.int8, count=len(planet_positions))
+        planet_houses = np.fromiter((p[2] for p in planet_positions), dtype=np.int8, count=len(planet_positions))
         
-        # Add planetary positions to houses
-        for planet_data in planet_positions:
-            planet_id = planet_data[0]  # Planet index (0=Sun, 1=Moon, etc.)
-            house_num = planet_data[2]  # House/constellation number (0-11)
-            
-            if house_to_planet_list[house_num]:
-                house_to_planet_list[house_num] += f'/{planet_id}'
-            else:
-                house_to_planet_list[house_num] = str(planet_id)
+        # Group planets by house in one stable sort, keeping jhora's planet order within a house
+        order = np.argsort(planet_houses, kind='stable')
+        house_bounds = np.searchsorted(planet_houses[order], np.arange(1, 12))
+        house_occupants = [
+            [str(planet_id) for planet_id in ids.tolist()]
+            for ids in np.split(planet_ids[order], house_bounds)
+        ]
         
         # Add ascendant (Lagna) to its house
         asc_house = ascendant_info[0]  # Ascendant house (0-11)
-        if house_to_planet_list[asc_house]:
-            house_to_planet_list[asc_house] += '/L'
-        else:
-            house_to_planet_list[asc_house] = 'L'
+        house_occupants[asc_house].append('L')
+        
+        house_to_planet_list = ['/'.join(occupants) for occupants in house_occupants]
         
         try:
-            # Import and use jhora's ashtakavarga function
-            from jhora.horoscope.chart.ashtakavarga import get_ashtaka_varga
-            
+            # Use jhora's ashtakavarga function
             binna_ashtaka_varga, samudhaya_ashtaka_varga, prastara_ashtaka_varga = get_ashtaka_varga(house_to_planet_list)
             
-            # Calculate planetary strengths (sum across all houses for each planet)
-            planetary_strengths = {}
-            planet_names = ['Sun', 'Moon', 'Mars', 'Mercury', 'Jupiter', 'Venus', 'Saturn', 'Lagna']
-            for i, planet in enumerate(planet_names):
-                if i < len(binna_ashtaka_varga):
-                    planetary_strengths[planet] = sum(binna_ashtaka_varga[i])
+            # Calculate planetary strengths (sum across all houses for each planet) in one row-wise
+            # sum; jhora's matrices are already plain int lists and are returned as is
+            planet_totals = np.asarray(binna_ashtaka_varga, dtype=np.int16).sum(axis=1).tolist()
+            planetary_strengths = dict(zip(ASHTAKAVARGA_PLANETS, planet_totals))
             
             return {
                 "binna_ashtaka_varga": binna_ashtaka_varga,
@@ -1680,14 +1809,22 @@ def get_ashtakavarga(
                 "house_strengths": samudhaya_ashtaka_varga,
                 "error": None
             }
-        except Exception as e:
-            logger.exception(f"Error in Ashtakavarga calculation:")
+        except (IndexError, KeyError, TypeError, ValueError) as e:
+            # Raised by jhora for malformed house_to_planet_list entries
+            logger.exception("Error in Ashtakavarga calculation:")
             return {"error": f"Ashtakavarga calculation failed: {str(e)}"}
         
     except Exception as e:
-        logger.exception(f"Error in get_ashtakavarga:")
+        logger.exception("Error in get_ashtakavarga:")
         return {"error": f"Failed to calculate Ashtakavarga: {str(e)}"}
 
+# Planets covered by jhora's shad_bala lists, and the per-planet keys for its nine result lists
+SHADBALA_PLANETS = ('Sun', 'Moon', 'Mars', 'Mercury', 'Jupiter', 'Venus', 'Saturn')
+SHADBALA_STRENGTH_KEYS = (
+    "sthana_bala", "kaala_bala", "dig_bala", "cheshta_bala", "naisargika_bala",
+    "drik_bala", "total_vimsopaka", "total_rupas", "strength_ratio"
+)
+
 def get_shadbala(
     year: int,
     month: int,
@@ -1741,24 +1878,18 @@ def get_shadbala(
         get_shadbala(1990, 3, 15, 6, 30, 0, 13.08, 80.27, 5.5)
         # Returns: dict with Shadbala strength analysis
     """
-    logger.info(f"get_shadbala called with: year={year}, month={month}, day={day}, hour={hour}, minute={minute}, second={second}, latitude={latitude}, longitude={longitude}, timezone_offset={timezone_offset}, ayanamsa_mode={ayanamsa_mode}, language={language}")
+    logger.debug("get_shadbala called with: year=%s, month=%s, day=%s, hour=%s, minute=%s, second=%s, latitude=%s, longitude=%s, timezone_offset=%s, ayanamsa_mode=%s, language=%s", year, month, day, hour, minute, second, latitude, longitude, timezone_offset, ayanamsa_mode, language)
     
     try:
-        # Import required jhora modules
-        from jhora.horoscope.chart.strength import shad_bala
-        from jhora import utils
-        from jhora.panchanga import drik
-        
         # Convert to Julian day and place format for jhora
-        jd = utils.julian_day_number(drik.Date(year, month, day), (hour, minute, second))
-        # Create place using drik.Place namedtuple
-        place = drik.Place('', latitude, longitude, timezone_offset)
+        jd, place = _jd_place(year, month, day, hour, minute, second, latitude, longitude, timezone_offset)
         
         # Calculate Shadbala using jhora
         try:
             shadbala_result = shad_bala(jd, place, ayanamsa_mode)
-        except Exception as e:
-            logger.exception(f"Error calling jhora shad_bala:")
+        except (ArithmeticError, IndexError, KeyError, TypeError, ValueError, swe.Error) as e:
+            # jhora's strength maths and the Swiss ephemeris calls it makes
+            logger.exception("Error calling jhora shad_bala:")
             return {"error": f"Shadbala calculation failed: {str(e)}"}
         
         if not shadbala_result or len(shadbala_result) < 9:
@@ -1767,28 +1898,21 @@ def get_shadbala(
         # Extract components: [sthana, kaala, dig, cheshta, naisargika, drik, total, rupas, ratios]
         sthana_bala, kaala_bala, dig_bala, cheshta_bala, naisargika_bala, drik_bala, total_shadbala, shadbala_rupas, strength_ratios = shadbala_result
         
-        # Planet names for mapping
-        planet_names = ['Sun', 'Moon', 'Mars', 'Mercury', 'Jupiter', 'Venus', 'Saturn']
-        
-        # Find strongest and weakest planets
-        strongest_planet = planet_names[shadbala_rupas.index(max(shadbala_rupas))] if shadbala_rupas else "Unknown"
-        weakest_planet = planet_names[shadbala_rupas.index(min(shadbala_rupas))] if shadbala_rupas else "Unknown"
+        # Find strongest and weakest planets with one array conversion
+        if shadbala_rupas:
+            rupas = np.asarray(shadbala_rupas)
+            strongest_planet = SHADBALA_PLANETS[int(rupas.argmax())]
+            weakest_planet = SHADBALA_PLANETS[int(rupas.argmin())]
+        else:
+            strongest_planet = weakest_planet = "Unknown"
         
-        # Create detailed strength mapping
-        planetary_strengths = {}
-        for i, planet in enumerate(planet_names):
-            if i < len(shadbala_rupas):
-                planetary_strengths[planet] = {
-                    "sthana_bala": sthana_bala[i] if i < len(sthana_bala) else 0,
-                    "kaala_bala": kaala_bala[i] if i < len(kaala_bala) else 0,
-                    "dig_bala": dig_bala[i] if i < len(dig_bala) else 0,
-                    "cheshta_bala": cheshta_bala[i] if i < len(cheshta_bala) else 0,
-                    "naisargika_bala": naisargika_bala[i] if i < len(naisargika_bala) else 0,
-                    "drik_bala": drik_bala[i] if i < len(drik_bala) else 0,
-                    "total_vimsopaka": total_shadbala[i] if i < len(total_shadbala) else 0,
-                    "total_rupas": shadbala_rupas[i] if i < len(shadbala_rupas) else 0,
-                    "strength_ratio": strength_ratios[i] if i < len(strength_ratios) else 0
-                }
+        # Create detailed strength mapping: one row per planet across all bala lists,
+        # with 0 for any list shorter than shadbala_rupas
+        planet_rows = itertools.zip_longest(*shadbala_result, fillvalue=0)
+        planetary_strengths = {
+            planet: dict(zip(SHADBALA_STRENGTH_KEYS, row))
+            for planet, row in zip(SHADBALA_PLANETS[:len(shadbala_rupas)], planet_rows)
+        }
         
         return {
             "sthana_bala": sthana_bala,
@@ -1807,6 +1931,6 @@ def get_shadbala(
         }
         
     except Exception as e:
-        logger.exception(f"Error in get_shadbala:")
+        logger.exception("Error in get_shadbala:")
         return {"error": f"Failed to calculate Shadbala: {str(e)}"}
 
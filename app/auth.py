@@ -1,3 +1,8 @@
+import hashlib
+import hmac
+import threading
+import time
+from collections import OrderedDict
 from fastapi import Depends, HTTPException, status, Header
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from firebase_admin import auth
@@ -5,19 +10,69 @@ from typing import Optional
 from sqlalchemy.orm import Session
 from app.database import get_db
 from app import crud, schemas
+from app.config import settings
+
+# Verified Firebase ID token claims, reused until the token expires (or at most the TTL),
+# so repeat requests with the same token skip the signature check
+_TOKEN_CACHE_MAX_SIZE = 10_000
+_TOKEN_CACHE_TTL_SECONDS = 300
+_token_cache: "OrderedDict[str, tuple[float, dict]]" = OrderedDict()
+_token_cache_lock = threading.Lock()
+
+def _verify_id_token(token: str) -> dict:
+    """
+    Verify a Firebase ID token, serving recently verified tokens from an in-process LRU cache.
+    
+    Args:
+        token: The raw Firebase ID token.
+        
+    Returns:
+        dict: The decoded token claims. Callers must not mutate them.
+    """
+    now = time.time()
+    with _token_cache_lock:
+        entry = _token_cache.get(token)
+        if entry is not None:
+            if entry[0] > now:
+                _token_cache.move_to_end(token)
+                return entry[1]
+            del _token_cache[token]
+    
+    decoded_token = auth.verify_id_token(token)
+    
+    expires_at = min(now + _TOKEN_CACHE_TTL_SECONDS, decoded_token.get("exp", 0))
+    if expires_at > now:
+        with _token_cache_lock:
+            _token_cache[token] = (expires_at, decoded_token)
+            _token_cache.move_to_end(token)
+            while len(_token_cache) > _TOKEN_CACHE_MAX_SIZE:
+                _token_cache.popitem(last=False)
+    return decoded_token
+
+def _is_trusted_internal_request(x_user_id: Optional[str], x_internal_token: Optional[str]) -> bool:
+    """Check X-Internal-Token against the HMAC of X-User-ID under INTERNAL_AUTH_SECRET."""
+    if not (settings.INTERNAL_AUTH_SECRET and x_user_id and x_internal_token):
+        return False
+    expected = hmac.new(
+        settings.INTERNAL_AUTH_SECRET.encode(), x_user_id.encode(), hashlib.sha256
+    ).hexdigest()
+    return hmac.compare_digest(expected, x_internal_token)
 
 async def get_current_user(
     credentials: Optional[HTTPAuthorizationCredentials] = Depends(HTTPBearer(auto_error=False)),
     x_user_id: Optional[str] = Header(None, alias="X-User-ID"),
+    x_internal_token: Optional[str] = Header(None, alias="X-Internal-Token"),
     db: Session = Depends(get_db)
 ) -> schemas.CurrentUser:
     """
     Verify Firebase ID token and get essential user information.
     Falls back to X-User-ID header if bearer token is not provided.
+    Internal callers that sign X-User-ID with X-Internal-Token skip Firebase verification.
     
     Args:
         credentials: The HTTP Authorization credentials.
         x_user_id: Optional X-User-ID header value.
+        x_internal_token: Optional HMAC of X-User-ID for internal service-to-service calls.
         db: The database session.
         
     Returns:
@@ -34,10 +89,10 @@ async def get_current_user(
         )
     
     try:
-        if credentials:
+        if credentials and not _is_trusted_internal_request(x_user_id, x_internal_token):
             # Verify Firebase ID token
             try:
-                decoded_token = auth.verify_id_token(credentials.credentials)
+                decoded_token = _verify_id_token(credentials.credentials)
                 
                 # Extract user information from Firebase token
                 user_id = decoded_token.get("uid")
@@ -48,9 +103,9 @@ async def get_current_user(
                 db_user = crud.get_user(db, user_id)
                 
                 if db_user:
-                    # Update only display_name for existing user if we have it from token
-                    if display_name:
-                        db_user = crud.update_user_display_name(db, user_id, display_name)
+                    # Update only display_name for existing user if the token carries a new one
+                    if display_name and display_name != db_user.display_name:
+                        db_user = crud.update_user_display_name(db, user_id, display_name) or db_user
                 else:
                     # Create new user with Firebase info (no password needed for Firebase users)
                     db_user = crud.create_user(db, user_id, email, display_name or "", state="active")
@@ -69,8 +124,8 @@ async def get_current_user(
         else:
             # Use X-User-ID header
             user_id = x_user_id
-            # Get user info from database
-            db_user = crud.get_user(db, user_id)
+            # Get user info from database (only the columns CurrentUser needs)
+            db_user = crud.get_current_user_row(db, user_id)
             if not db_user:
                 raise HTTPException(
                     status_code=status.HTTP_401_UNAUTHORIZED,
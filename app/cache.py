@@ -1,61 +1,90 @@
-import json
+import asyncio
 import functools
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+import orjson
 from app.utils.logger import get_logger
-from typing import Any, Optional, Callable
+from typing import Any, Optional, Callable, Final
 from datetime import datetime, timedelta
-import pytz
+from zoneinfo import ZoneInfo
 import redis
 from redis.connection import ConnectionPool
+from fastapi.params import Depends
+from sqlalchemy.orm import Session
 from app.config import settings
 
 logger = get_logger(__name__)
 
-# Redis client initialization
-try:
-    redis_client = redis.Redis(
-        host=settings.REDIS_HOST,
-        port=settings.REDIS_PORT,
-        db=0,
-        decode_responses=True,
-        retry_on_timeout=True,
-        socket_connect_timeout=5,
-        socket_timeout=5
-    )
-    # Test connection
-    redis_client.ping()
-    logger.info(f"Cache Redis connected: {settings.REDIS_HOST}:{settings.REDIS_PORT}")
-except Exception as e:
-    logger.warning(f"Cache Redis connection failed: {e}. Cache will be disabled.")
-    redis_client = None
+# India Standard Time, used for day/week based cache expiry
+IST = ZoneInfo('Asia/Kolkata')
 
-# Create a connection pool for better performance and connection management
+# Connection pool shared by every cache command; sockets idle for 30s are
+# health-checked before reuse
 redis_pool = ConnectionPool(
     host=settings.REDIS_HOST,
     port=settings.REDIS_PORT,
     db=0,
     decode_responses=True,
-    max_connections=20,  # Adjust based on your needs
+    max_connections=16,  # Per worker process; GET/SETEX are short, so a few sockets suffice
     retry_on_timeout=True,
     socket_connect_timeout=5,
-    socket_timeout=5
+    socket_timeout=5,
+    health_check_interval=30
 )
 
+# Redis client initialization
+try:
+    redis_client = redis.Redis(connection_pool=redis_pool)
+    # Test connection
+    redis_client.ping()
+    logger.info(f"Cache Redis connected: {settings.REDIS_HOST}:{settings.REDIS_PORT}")
+except Exception as e:
+    logger.warning(f"Cache Redis connection failed: {e}. Cache will be disabled.")
+    redis_client = None
+
+# Redis health is re-checked with a PING at most this often; errors from real commands
+# mark it unhealthy in between
+REDIS_HEALTH_CHECK_SECONDS = 5
+_redis_healthy = True
+_last_health_check = 0.0
+
+def _mark_redis_unhealthy() -> None:
+    """Record a failed Redis command so callers skip Redis until the next health check."""
+    global _redis_healthy, _last_health_check
+    _redis_healthy = False
+    _last_health_check = time.monotonic()
+
 def is_redis_available() -> bool:
     """
     Check if Redis is available and connected.
     
+    The result of the last PING is reused for REDIS_HEALTH_CHECK_SECONDS.
+    
     Returns:
         True if Redis is available, False otherwise
     """
+    global _redis_healthy, _last_health_check
     if redis_client is None:
         return False
     
+    now = time.monotonic()
+    if now - _last_health_check < REDIS_HEALTH_CHECK_SECONDS:
+        return _redis_healthy
+    
     try:
         redis_client.ping()
-        return True
+        _redis_healthy = True
     except Exception as e:
         logger.warning(f"Redis ping failed: {e}")
-        return False
+        _redis_healthy = False
+    _last_health_check = now
+    return _redis_healthy
+
+# IST is a fixed UTC+05:30 offset with no DST, so day boundaries can be computed from the epoch
+IST_OFFSET_SECONDS = 5 * 60 * 60 + 30 * 60
+SECONDS_PER_DAY = 24 * 60 * 60
 
 def get_seconds_until_next_day_ist() -> int:
     """
@@ -64,16 +93,14 @@ def get_seconds_until_next_day_ist() -> int:
     Returns:
         Number of seconds until next day 00:00:00 IST
     """
-    ist = pytz.timezone('Asia/Kolkata')
-    now_ist = datetime.now(ist)
-    
-    # Calculate next day at 00:00:00 IST
-    next_day_ist = now_ist.replace(hour=0, minute=0, second=0, microsecond=0) + timedelta(days=1)
-    
-    # Calculate seconds until next day
-    seconds_until_next_day = (next_day_ist - now_ist).total_seconds()
-    
-    return int(seconds_until_next_day)
+    now = int(time.time())
+    return SECONDS_PER_DAY - ((now + IST_OFFSET_SECONDS) % SECONDS_PER_DAY)
+
+@functools.lru_cache(maxsize=256)
+def _end_of_date_epoch_ist(target_date: str) -> float:
+    """Epoch timestamp of the last instant of a YYYY-MM-DD date in IST; raises ValueError if unparseable."""
+    target_date_obj = datetime.strptime(target_date, '%Y-%m-%d').date()
+    return datetime.combine(target_date_obj, datetime.max.time(), tzinfo=IST).timestamp()
 
 def get_seconds_until_end_of_date_ist(target_date: str) -> int:
     """
@@ -86,16 +113,9 @@ def get_seconds_until_end_of_date_ist(target_date: str) -> int:
     Returns:
         Number of seconds until the end of the target date (midnight of that date)
     """
-    ist = pytz.timezone('Asia/Kolkata')
-    now_ist = datetime.now(ist)
-    
     try:
-        # Parse the target date
-        target_date_obj = datetime.strptime(target_date, '%Y-%m-%d').date()
-        target_datetime_ist = datetime.combine(target_date_obj, datetime.max.time(), tzinfo=ist)
-        
         # Calculate seconds until the end of the target date
-        seconds_until_end = (target_datetime_ist - now_ist).total_seconds()
+        seconds_until_end = _end_of_date_epoch_ist(target_date) - time.time()
         
         # If the target date is in the past, return 0 (expire immediately)
         if seconds_until_end <= 0:
@@ -106,6 +126,35 @@ def get_seconds_until_end_of_date_ist(target_date: str) -> int:
         # If date parsing fails, fall back to next day logic
         return get_seconds_until_next_day_ist()
 
+# Cache payloads are JSON encoded with orjson; int dict keys and NumPy values are accepted as well.
+# They stay JSON rather than a binary format like MessagePack: the cached values are mostly prose
+# (daily facts, horoscopes), where binary encodings save little, and the shared client decodes
+# responses to str.
+ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+
+def _serialize_default(value: Any) -> Any:
+    """Encode Pydantic models nested in cached values by their model_dump."""
+    if hasattr(value, 'model_dump'):
+        return value.model_dump()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+# Per-user SET of cache keys written with a user_id, so a user's entries can be cleared
+# without scanning the keyspace. It outlives the longest user-scoped entry (weekly horoscope)
+# and is refreshed on every indexed write; stale members just fail to delete.
+USER_KEYS_INDEX_TTL_SECONDS = 8 * 24 * 60 * 60
+
+def generate_user_keys_index_key(user_id: str) -> str:
+    """
+    Generate the key of the SET indexing a user's cache keys.
+    
+    Args:
+        user_id: The user ID
+        
+    Returns:
+        A cache key string
+    """
+    return f"user_keys:{user_id}"
+
 def get_cached_data(key: str) -> Optional[Any]:
     """
     Get data from Redis cache.
@@ -122,20 +171,48 @@ def get_cached_data(key: str) -> Optional[Any]:
     try:
         data = redis_client.get(key)
         if data:
-            return json.loads(data)
+            return orjson.loads(data)
+    except redis.RedisError as e:
+        _mark_redis_unhealthy()
+        logger.error(f"Error getting cached data for key {key}: {e}")
     except Exception as e:
         logger.error(f"Error getting cached data for key {key}: {e}")
     
     return None
 
-def set_cached_data(key: str, value: Any, expire_seconds: int = 3600) -> bool:
+def get_cached_many(keys: list) -> dict:
+    """
+    Get several entries from Redis cache with a single MGET round trip.
+    
+    Args:
+        keys: The cache keys
+        
+    Returns:
+        Dict mapping each key found in the cache to its data; missing keys are omitted
+    """
+    if not keys or not is_redis_available():
+        return {}
+    
+    try:
+        values = redis_client.mget(keys)
+        return {key: orjson.loads(data) for key, data in zip(keys, values) if data}
+    except redis.RedisError as e:
+        _mark_redis_unhealthy()
+        logger.error(f"Error getting cached data for {len(keys)} keys: {e}")
+    except Exception as e:
+        logger.error(f"Error getting cached data for {len(keys)} keys: {e}")
+    
+    return {}
+
+def set_cached_data(key: str, value: Any, expire_seconds: int = 3600, user_id: Optional[str] = None) -> bool:
     """
     Set data in Redis cache with expiration.
     
     Args:
         key: The cache key
-        value: The data to cache
+        value: The data to cache; Pydantic models are serialized straight to JSON
         expire_seconds: Time to live in seconds (default: 1 hour)
+        user_id: If given, the key is recorded in that user's key index so clear_user_cache can find it
         
     Returns:
         True if successful, False otherwise
@@ -144,12 +221,25 @@ def set_cached_data(key: str, value: Any, expire_seconds: int = 3600) -> bool:
         return False
     
     try:
-        redis_client.setex(
-            key,
-            expire_seconds,
-            json.dumps(value)
-        )
+        if hasattr(value, 'model_dump_json'):
+            payload = value.model_dump_json()
+        else:
+            payload = orjson.dumps(value, default=_serialize_default, option=ORJSON_OPTIONS)
+        if user_id is None:
+            redis_client.setex(key, expire_seconds, payload)
+        else:
+            # Write the entry and index it in one round trip
+            index_key = generate_user_keys_index_key(user_id)
+            pipe = redis_client.pipeline(transaction=False)
+            pipe.setex(key, expire_seconds, payload)
+            pipe.sadd(index_key, key)
+            pipe.expire(index_key, USER_KEYS_INDEX_TTL_SECONDS)
+            pipe.execute()
         return True
+    except redis.RedisError as e:
+        _mark_redis_unhealthy()
+        logger.error(f"Error setting cached data for key {key}: {e}")
+        return False
     except Exception as e:
         logger.error(f"Error setting cached data for key {key}: {e}")
         return False
@@ -174,7 +264,10 @@ def delete_cached_data(key: str) -> bool:
         logger.error(f"Error deleting cached data for key {key}: {e}")
         return False
 
-def scan_keys(pattern: str, count: int = 100) -> list:
+# SCAN COUNT hint: larger pages mean fewer round trips to walk the keyspace
+SCAN_COUNT = 1000
+
+def scan_keys(pattern: str, count: int = SCAN_COUNT) -> list:
     """
     Scan Redis keys matching a pattern.
     This is the recommended approach instead of using KEYS command.
@@ -202,6 +295,25 @@ def scan_keys(pattern: str, count: int = 100) -> list:
         logger.error(f"Error scanning keys with pattern {pattern}: {e}")
         return []
 
+# Dependency values and kwarg names that never take part in cache keys
+_NON_KEY_TYPES = (Session, Depends)
+_NON_KEY_KWARGS = frozenset({'db', 'current_user'})
+
+# Stringified arguments longer than this are replaced by a fixed-size hash in cache keys
+MAX_KEY_PART_LENGTH = 64
+
+def _key_part(value: Any) -> str:
+    """
+    Stringify one cache key argument, hashing it with blake2b when it is long.
+    
+    Hashing per argument (rather than the whole key) keeps short values such as user IDs
+    readable, so clear_user_cache can still match a user's keys by pattern.
+    """
+    part = str(value)
+    if len(part) > MAX_KEY_PART_LENGTH:
+        return hashlib.blake2b(part.encode(), digest_size=16).hexdigest()
+    return part
+
 def generate_cache_key(func_name: str, *args, **kwargs) -> str:
     """
     Generate a cache key based on function name and arguments.
@@ -216,38 +328,15 @@ def generate_cache_key(func_name: str, *args, **kwargs) -> str:
         A cache key string
     """
     # Filter out database sessions and other dependencies that shouldn't be in cache keys
-    filtered_args = []
-    for arg in args:
-        # Skip database session objects and other dependencies
-        if hasattr(arg, '__class__') and 'Session' in arg.__class__.__name__:
-            continue
-        if hasattr(arg, '__class__') and 'Depends' in str(type(arg)):
-            continue
-        # Check for SQLAlchemy Session type
-        if hasattr(arg, '__class__') and hasattr(arg.__class__, '__module__'):
-            if 'sqlalchemy' in arg.__class__.__module__ and 'Session' in arg.__class__.__name__:
-                continue
-        filtered_args.append(arg)
-    
-    # Filter out database sessions and dependencies from kwargs
-    filtered_kwargs = {}
-    for key, value in kwargs.items():
-        # Skip database session objects and other dependencies
-        if hasattr(value, '__class__') and 'Session' in value.__class__.__name__:
-            continue
-        if hasattr(value, '__class__') and 'Depends' in str(type(value)):
-            continue
-        # Check for SQLAlchemy Session type
-        if hasattr(value, '__class__') and hasattr(value.__class__, '__module__'):
-            if 'sqlalchemy' in value.__class__.__module__ and 'Session' in value.__class__.__name__:
-                continue
-        if key in ['db', 'current_user']:  # Skip common dependency names
-            continue
-        filtered_kwargs[key] = value
+    filtered_args = [arg for arg in args if not isinstance(arg, _NON_KEY_TYPES)]
+    filtered_kwargs = {
+        key: value for key, value in kwargs.items()
+        if key not in _NON_KEY_KWARGS and not isinstance(value, _NON_KEY_TYPES)
+    }
     
     # Convert filtered args and kwargs to a sorted string representation
-    args_str = ":".join(str(arg) for arg in filtered_args)
-    kwargs_str = ":".join(f"{k}={v}" for k, v in sorted(filtered_kwargs.items()))
+    args_str = ":".join(_key_part(arg) for arg in filtered_args)
+    kwargs_str = ":".join(f"{k}={_key_part(v)}" for k, v in sorted(filtered_kwargs.items()))
     
     # Combine all parts with the function name
     key_parts = [func_name]
@@ -258,6 +347,9 @@ def generate_cache_key(func_name: str, *args, **kwargs) -> str:
     
     return ":".join(key_parts)
 
+# Read once; settings do not change at runtime
+CACHE_DEBUG: Final[bool] = settings.DEBUG
+
 def cache(expire_seconds: int = 3600, until_next_day_ist: bool = False):
     """
     Decorator for caching function results.
@@ -276,18 +368,19 @@ def cache(expire_seconds: int = 3600, until_next_day_ist: bool = False):
             cache_key = generate_cache_key(func.__name__, *args, **kwargs)
             
             # Log cache key for debugging (only in debug mode)
-            if settings.DEBUG:
+            if CACHE_DEBUG:
                 logger.debug(f"Generated cache key for {func.__name__}: {cache_key}")
             
-            # Try to get cached data
-            cached_data = get_cached_data(cache_key)
+            # Try to get cached data; the sync Redis client runs in a worker thread so the
+            # event loop keeps serving other requests during the round trip
+            cached_data = await asyncio.to_thread(get_cached_data, cache_key)
             if cached_data is not None:
-                if settings.DEBUG:
+                if CACHE_DEBUG:
                     logger.debug(f"Cache hit for {func.__name__}")
                 return cached_data
             
             # If no cache, call the function
-            if settings.DEBUG:
+            if CACHE_DEBUG:
                 logger.debug(f"Cache miss for {func.__name__}, executing function")
             result = await func(*args, **kwargs)
             
@@ -302,12 +395,52 @@ def cache(expire_seconds: int = 3600, until_next_day_ist: bool = False):
                 actual_expire_seconds = expire_seconds
             
             # Cache the result
-            set_cached_data(cache_key, result, actual_expire_seconds)
+            await asyncio.to_thread(set_cached_data, cache_key, result, actual_expire_seconds)
             
             return result
         return wrapper
     return decorator
 
+# Small per-process LRU in front of Redis for the hottest reads (daily facts, weekly horoscopes).
+# Entries live LOCAL_CACHE_TTL_SECONDS, which bounds staleness across worker processes.
+LOCAL_CACHE_MAX_SIZE = 2048
+LOCAL_CACHE_TTL_SECONDS = 60
+_local_cache: "OrderedDict[str, tuple[float, Any]]" = OrderedDict()
+_local_cache_lock = threading.Lock()
+
+def _get_local_or_cached_data(key: str) -> Optional[Any]:
+    """
+    Get data from the in-process LRU, falling back to Redis and remembering hits.
+    
+    Args:
+        key: The cache key
+        
+    Returns:
+        The cached data if found, None otherwise. Callers must not mutate it.
+    """
+    now = time.monotonic()
+    with _local_cache_lock:
+        entry = _local_cache.get(key)
+        if entry is not None:
+            if entry[0] > now:
+                _local_cache.move_to_end(key)
+                return entry[1]
+            del _local_cache[key]
+    
+    data = get_cached_data(key)
+    if data is not None:
+        with _local_cache_lock:
+            _local_cache[key] = (now + LOCAL_CACHE_TTL_SECONDS, data)
+            _local_cache.move_to_end(key)
+            while len(_local_cache) > LOCAL_CACHE_MAX_SIZE:
+                _local_cache.popitem(last=False)
+    return data
+
+def _discard_local_cached_data(key: str) -> None:
+    """Drop a key from the in-process LRU so the next read goes to Redis."""
+    with _local_cache_lock:
+        _local_cache.pop(key, None)
+
 def generate_daily_facts_key(user_id: str) -> str:
     """
     Generate a cache key for daily facts.
@@ -345,7 +478,7 @@ def get_daily_facts_from_cache(user_id: str, target_date: str) -> Optional[Any]:
         The cached daily facts if found, None otherwise
     """
     cache_key = generate_daily_facts_date_key(user_id, target_date)
-    return get_cached_data(cache_key)
+    return _get_local_or_cached_data(cache_key)
 
 def set_daily_facts_in_cache(user_id: str, target_date: str, daily_facts: Any, expire_seconds: int = None) -> bool:
     """
@@ -362,17 +495,17 @@ def set_daily_facts_in_cache(user_id: str, target_date: str, daily_facts: Any, e
     """
     cache_key = generate_daily_facts_date_key(user_id, target_date)
     
-    # Convert Pydantic model to dict if needed
-    if hasattr(daily_facts, 'model_dump'):
-        daily_facts = daily_facts.model_dump()
-    elif hasattr(daily_facts, 'dict'):
+    # Pydantic v2 models go to set_cached_data as is and are dumped straight to JSON;
+    # convert older models to dict
+    if not hasattr(daily_facts, 'model_dump_json') and hasattr(daily_facts, 'dict'):
         daily_facts = daily_facts.dict()
     
     # If no expiration specified, use 72 hours (3 days)
     if expire_seconds is None:
         expire_seconds = 72 * 60 * 60  # 72 hours in seconds
     
-    return set_cached_data(cache_key, daily_facts, expire_seconds)
+    _discard_local_cached_data(cache_key)
+    return set_cached_data(cache_key, daily_facts, expire_seconds, user_id=user_id)
 
 def get_seconds_until_end_of_week_ist(week_start_date: str) -> int:
     """
@@ -385,15 +518,14 @@ def get_seconds_until_end_of_week_ist(week_start_date: str) -> int:
     Returns:
         Number of seconds until the end of the week (midnight of Sunday)
     """
-    ist = pytz.timezone('Asia/Kolkata')
-    now_ist = datetime.now(ist)
+    now_ist = datetime.now(IST)
     
     try:
         # Parse the week start date (Monday)
         week_start_obj = datetime.strptime(week_start_date, '%Y-%m-%d').date()
         # Calculate week end date (Sunday) - 6 days after Monday
         week_end_obj = week_start_obj + timedelta(days=6)
-        week_end_datetime_ist = datetime.combine(week_end_obj, datetime.max.time(), tzinfo=ist)
+        week_end_datetime_ist = datetime.combine(week_end_obj, datetime.max.time(), tzinfo=IST)
         
         # Calculate seconds until the end of the week
         seconds_until_end = (week_end_datetime_ist - now_ist).total_seconds()
@@ -432,7 +564,7 @@ def get_weekly_horoscope_from_cache(user_id: str, week_start_date: str) -> Optio
         The cached weekly horoscope if found, None otherwise
     """
     cache_key = generate_weekly_horoscope_date_key(user_id, week_start_date)
-    return get_cached_data(cache_key)
+    return _get_local_or_cached_data(cache_key)
 
 def set_weekly_horoscope_in_cache(user_id: str, week_start_date: str, weekly_horoscope: Any, expire_seconds: int = None) -> bool:
     """
@@ -449,55 +581,109 @@ def set_weekly_horoscope_in_cache(user_id: str, week_start_date: str, weekly_hor
     """
     cache_key = generate_weekly_horoscope_date_key(user_id, week_start_date)
     
-    # Convert Pydantic model to dict if needed
-    if hasattr(weekly_horoscope, 'model_dump'):
-        weekly_horoscope = weekly_horoscope.model_dump()
-    elif hasattr(weekly_horoscope, 'dict'):
+    # Pydantic v2 models go to set_cached_data as is and are dumped straight to JSON;
+    # convert older models to dict
+    if not hasattr(weekly_horoscope, 'model_dump_json') and hasattr(weekly_horoscope, 'dict'):
         weekly_horoscope = weekly_horoscope.dict()
     
     # If no expiration specified, use until_end_of_week logic
     if expire_seconds is None:
         expire_seconds = get_seconds_until_end_of_week_ist(week_start_date)
     
-    return set_cached_data(cache_key, weekly_horoscope, expire_seconds)
+    _discard_local_cached_data(cache_key)
+    return set_cached_data(cache_key, weekly_horoscope, expire_seconds, user_id=user_id)
+
+# Committed partner edits and deletes evict the cached row (see app/crud/partner.py), so the TTL only bounds memory
+PARTNER_CACHE_TTL_SECONDS = 300
+
+def generate_partner_key(partner_id: str) -> str:
+    """
+    Generate a cache key for a partner row.
+    
+    Args:
+        partner_id: The partner ID
+        
+    Returns:
+        A cache key string for the partner
+    """
+    return f"partner:{partner_id}"
+
+def get_partner_from_cache(partner_id: str) -> Optional[dict]:
+    """
+    Get a partner's column values from cache.
+    
+    Args:
+        partner_id: The partner ID
+        
+    Returns:
+        The cached column values if found, None otherwise
+    """
+    return get_cached_data(generate_partner_key(partner_id))
+
+def set_partner_in_cache(partner_id: str, user_id: str, partner_data: dict) -> bool:
+    """
+    Set a partner's column values in cache, indexed under the owning user.
+    
+    Args:
+        partner_id: The partner ID
+        user_id: The ID of the user the partner belongs to
+        partner_data: The partner's column values
+        
+    Returns:
+        True if successful, False otherwise
+    """
+    return set_cached_data(generate_partner_key(partner_id), partner_data, PARTNER_CACHE_TTL_SECONDS, user_id=user_id)
+
+def delete_partner_from_cache(partner_id: str) -> bool:
+    """
+    Delete a partner's cached column values.
+    
+    Args:
+        partner_id: The partner ID
+        
+    Returns:
+        True if successful, False otherwise
+    """
+    return delete_cached_data(generate_partner_key(partner_id))
+
+# Keys per DELETE command when clearing a user's cache
+CLEAR_CACHE_BATCH_SIZE = 500
 
 def clear_user_cache(user_id: str) -> bool:
     """
     Clear all cache entries for a specific user.
     
+    Covers every entry written through set_cached_data with the user's user_id
+    (daily facts, weekly horoscopes and partners). Entries written before the key index
+    existed are not indexed and expire on their own TTL (at most a week).
+    
     Args:
         user_id: The user ID to clear cache for
         
     Returns:
         True if successful, False otherwise
     """
+    # Drop this process's local copies first, even if Redis is unavailable
+    user_marker = f":{user_id}:"
+    with _local_cache_lock:
+        for key in [key for key in _local_cache if user_marker in key]:
+            del _local_cache[key]
+    
     if not is_redis_available():
         logger.warning("Redis not available, cannot clear user cache")
         return False
     
     try:
-        # Get all keys that match the user pattern
-        # This includes daily_facts, weekly_horoscope, and any other user-specific cache keys
-        user_patterns = [
-            f"daily_facts:{user_id}*",
-            f"weekly_horoscope:{user_id}*",
-            f"*:{user_id}:*",  # Any cache key that contains the user_id
-            f"*:{user_id}",    # Any cache key that ends with user_id
-        ]
+        # The user's cache keys are indexed at write time, so no keyspace SCAN is needed
+        index_key = generate_user_keys_index_key(user_id)
+        keys = list(redis_client.smembers(index_key))
         
-        total_deleted = 0
-        for pattern in user_patterns:
-            # Use SCAN to find matching keys (more efficient than KEYS for large datasets)
-            cursor = 0
-            while True:
-                cursor, keys = redis_client.scan(cursor=cursor, match=pattern, count=100)
-                if keys:
-                    deleted_count = redis_client.delete(*keys)
-                    total_deleted += deleted_count
-                    logger.info(f"Deleted {deleted_count} cache keys matching pattern '{pattern}' for user {user_id}")
-                
-                if cursor == 0:
-                    break
+        # Queue every DELETE batch plus the index itself on one pipeline (a single round trip)
+        pipe = redis_client.pipeline(transaction=False)
+        for start in range(0, len(keys), CLEAR_CACHE_BATCH_SIZE):
+            pipe.delete(*keys[start:start + CLEAR_CACHE_BATCH_SIZE])
+        pipe.delete(index_key)
+        total_deleted = sum(pipe.execute()[:-1])
         
         logger.info(f"Cleared {total_deleted} total cache entries for user {user_id}")
         return True
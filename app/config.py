@@ -18,6 +18,11 @@ class Settings(BaseSettings):
     # Explicit Firebase Admin SDK credentials JSON path
     FIREBASE_SERVICE_ACCOUNT_JSON: str = os.getenv("FIREBASE_SERVICE_ACCOUNT_JSON", "./firebase-service-account.json")
     
+    # Shared secret for internal service-to-service calls: a request carrying
+    # X-Internal-Token = hex HMAC-SHA256(secret, X-User-ID) skips Firebase verification.
+    # Empty disables the internal fast path.
+    INTERNAL_AUTH_SECRET: str = os.getenv("INTERNAL_AUTH_SECRET", "")
+    
     # AI/ML service settings
     TAVILY_API_KEY: str = os.getenv("TAVILY_API_KEY", "")
     OPENAI_API_KEY: str = os.getenv("OPENAI_API_KEY", "")
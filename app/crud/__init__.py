@@ -1,5 +1,6 @@
 from app.crud.user import (
     get_user,
+    get_current_user_row,
     get_user_by_email,
     create_user,
     update_user,
@@ -54,6 +55,7 @@ from app.crud.friends import FriendsCRUD
 __all__ = [
     # User operations
     "get_user",
+    "get_current_user_row",
     "get_user_by_email",
     "create_user",
     "update_user",
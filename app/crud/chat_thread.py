@@ -2,7 +2,8 @@ from sqlalchemy.orm import Session
 from app.models import ChatThread
 from typing import List, Optional
 from app.models import Message
-from sqlalchemy import func
+from sqlalchemy import delete, func, insert, select, update
+import uuid
 
 
 def _verify_thread_user_ownership(db: Session, thread_id: str, user_id: str) -> Optional[ChatThread]:
@@ -23,22 +24,24 @@ def create_chat_thread(
     ashtakoota_raw_json: Optional[str] = None,
 ) -> ChatThread:
     """Create a new chat thread for a user (no business logic)."""
-    db_thread = ChatThread(
-        user_id=user_id,
-        title=title,
-    )
+    # Transient instance only resolves the participant properties into participants_json
+    draft = ChatThread(user_id=user_id, title=title)
     if participant_user_ids is not None:
-        db_thread.participant_user_ids = participant_user_ids
+        draft.participant_user_ids = participant_user_ids
     if participant_partner_ids is not None:
-        db_thread.participant_partner_ids = participant_partner_ids
-    if compatibility_type is not None:
-        db_thread.compatibility_type = compatibility_type
-    if ashtakoota_raw_json is not None:
-        db_thread.ashtakoota_raw_json = ashtakoota_raw_json
+        draft.participant_partner_ids = participant_partner_ids
 
-    db.add(db_thread)
+    # RETURNING hands back the server-filled columns, so no refresh SELECT is needed
+    stmt = insert(ChatThread).values(
+        id=str(uuid.uuid4()),
+        user_id=user_id,
+        title=title,
+        participants_json=draft.participants_json,
+        compatibility_type=compatibility_type,
+        ashtakoota_raw_json=ashtakoota_raw_json,
+    ).returning(ChatThread)
+    db_thread = db.scalars(stmt).one()
     db.commit()
-    db.refresh(db_thread)
     return db_thread
 
 
@@ -56,36 +59,56 @@ def get_user_threads(db: Session, user_id: str, skip: int = 0, limit: int = 100)
 
 def update_chat_thread(db: Session, thread_id: str, user_id: str, **kwargs) -> Optional[ChatThread]:
     """Update a chat thread, verifying user ownership."""
-    thread = _verify_thread_user_ownership(db, thread_id, user_id)
-    if not thread:
-        return None
-    
-    # Update fields
-    for key, value in kwargs.items():
-        if hasattr(thread, key):
-            setattr(thread, key, value)
-    
-    thread.updated_at = func.now()
+    values = {key: value for key, value in kwargs.items() if key in ChatThread.__table__.c}
+
+    # Participant lists are properties over participants_json; resolve them on a transient instance
+    participant_keys = [key for key in ("participant_user_ids", "participant_partner_ids") if key in kwargs]
+    if participant_keys:
+        draft = ChatThread()
+        if len(participant_keys) == 1:
+            # Replacing one list keeps the other, which needs the stored value
+            draft.participants_json = db.scalar(
+                select(ChatThread.participants_json).where(
+                    ChatThread.id == thread_id,
+                    ChatThread.user_id == user_id
+                )
+            )
+        for key in participant_keys:
+            setattr(draft, key, kwargs[key])
+        values["participants_json"] = draft.participants_json
+
+    # Ownership check and update in one statement: no row comes back for another user's thread
+    stmt = update(ChatThread).where(
+        ChatThread.id == thread_id,
+        ChatThread.user_id == user_id
+    ).values(updated_at=func.now(), **values).returning(ChatThread)
+    thread = db.scalars(stmt, execution_options={"populate_existing": True}).one_or_none()
     db.commit()
-    db.refresh(thread)
     return thread
 
 
 def delete_chat_thread(db: Session, thread_id: str, user_id: str) -> bool:
     """Delete a chat thread, verifying user ownership."""
-    thread = _verify_thread_user_ownership(db, thread_id, user_id)
-    if not thread:
-        return False
-    
-    db.delete(thread)
+    # Messages go with it through the database's ON DELETE CASCADE, not the ORM relationship cascade
+    stmt = delete(ChatThread).where(
+        ChatThread.id == thread_id,
+        ChatThread.user_id == user_id
+    ).returning(ChatThread.id)
+    deleted_id = db.scalar(stmt)
     db.commit()
+    if deleted_id is None:
+        return False
+    # The session never saw those message deletes; expire what it holds so nothing stale is served
+    db.expire_all()
     return True
 
 
 def get_thread_message_count(db: Session, thread_id: str, user_id: str) -> int:
-    """Get the count of messages in a specific thread for a user"""
-    thread = get_chat_thread(db, thread_id, user_id)
-    if not thread:
-        return 0
-    
-    return db.query(Message).filter(Message.thread_id == thread_id).count() 
\ No newline at end of file
+    """Get the count of messages in a specific thread for a user (0 if the user does not own it)"""
+    # Ownership check and count in one query: the join yields no rows for another user's thread
+    return db.query(func.count(Message.id)).join(
+        ChatThread, ChatThread.id == Message.thread_id
+    ).filter(
+        ChatThread.id == thread_id,
+        ChatThread.user_id == user_id
+    ).scalar() or 0
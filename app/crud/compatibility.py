@@ -1,46 +1,54 @@
 from sqlalchemy.orm import Session
+from sqlalchemy.dialects.postgresql import insert
 from app.models.compatibility import Compatibility
 from typing import Optional
+import uuid
 
 def create_compatibility(db: Session, user_id: str, partner_id: Optional[str] = None, other_user_id: str = None, result_json: str = None, report_type: str = "love") -> Compatibility:
     """Create a new compatibility record. Either partner_id or other_user_id must be provided."""
     if not partner_id and not other_user_id:
         raise ValueError("Either partner_id or other_user_id must be provided")
     
-    db_compatibility = Compatibility(
+    # RETURNING hands back the server-filled columns, so no refresh SELECT is needed
+    stmt = insert(Compatibility).values(
+        id=str(uuid.uuid4()),
         user_id=user_id,
         partner_id=partner_id,
         other_user_id=other_user_id,
         report_type=report_type,
         result_json=result_json
-    )
-    db.add(db_compatibility)
+    ).returning(Compatibility)
+    db_compatibility = db.scalars(stmt).one()
     db.commit()
-    db.refresh(db_compatibility)
     return db_compatibility
 
 def get_compatibility(db: Session, user_id: str, partner_id: Optional[str] = None, other_user_id: str = None, report_type: str = "love") -> Compatibility:
     """Get compatibility record for a specific user-partner pair or user-other_user pair scoped by report_type."""
     if partner_id:
-        return db.query(Compatibility).filter(
-            Compatibility.user_id == user_id,
-            Compatibility.partner_id == partner_id,
-            Compatibility.report_type == report_type,
-        ).first()
+        pair_filter = Compatibility.partner_id == partner_id
     elif other_user_id:
-        return db.query(Compatibility).filter(
-            Compatibility.user_id == user_id,
-            Compatibility.other_user_id == other_user_id,
-            Compatibility.report_type == report_type,
-        ).first()
+        pair_filter = Compatibility.other_user_id == other_user_id
     else:
         raise ValueError("Either partner_id or other_user_id must be provided")
-
-def get_user_compatibilities(db: Session, user_id: str) -> list[Compatibility]:
-    """Get all compatibility records for a specific user (both partner and user-user)."""
     return db.query(Compatibility).filter(
+        Compatibility.user_id == user_id,
+        pair_filter,
+        Compatibility.report_type == report_type,
+    ).first()
+
+def get_user_compatibilities(db: Session, user_id: str, columns: Optional[list] = None) -> list:
+    """
+    Get all compatibility records for a specific user (both partner and user-user).
+    
+    Pass `columns` (e.g. [Compatibility.id, Compatibility.report_type]) to load only those
+    columns as lightweight rows instead of full Compatibility entities.
+    """
+    query = db.query(Compatibility).filter(
         Compatibility.user_id == user_id
-    ).all()
+    )
+    if columns:
+        query = query.with_entities(*columns)
+    return query.all()
 
 def update_compatibility(db: Session, user_id: str, partner_id: Optional[str] = None, other_user_id: str = None, result_json: str = None, report_type: str = "love") -> Compatibility:
     """Update existing compatibility record scoped by report_type."""
@@ -54,9 +62,28 @@ def update_compatibility(db: Session, user_id: str, partner_id: Optional[str] =
 
 def get_or_create_compatibility(db: Session, user_id: str, partner_id: Optional[str] = None, other_user_id: str = None, result_json: str = None, report_type: str = "love") -> Compatibility:
     """Get existing compatibility or create new one if result_json provided, scoped by report_type."""
-    existing = get_compatibility(db, user_id, partner_id, other_user_id, report_type)
-    if existing:
-        return existing
-    elif result_json:
-        return create_compatibility(db, user_id, partner_id, other_user_id, result_json, report_type)
-    return None 
\ No newline at end of file
+    if not result_json:
+        return get_compatibility(db, user_id, partner_id, other_user_id, report_type)
+    if partner_id:
+        constraint = 'uq_user_partner_compatibility'
+    elif other_user_id:
+        constraint = 'uq_user_other_user_compatibility'
+    else:
+        raise ValueError("Either partner_id or other_user_id must be provided")
+    
+    # Single round trip: insert, or on conflict touch the existing row (keeping its result_json)
+    # so RETURNING hands back whichever row now exists
+    stmt = insert(Compatibility).values(
+        id=str(uuid.uuid4()),
+        user_id=user_id,
+        partner_id=partner_id,
+        other_user_id=other_user_id,
+        report_type=report_type,
+        result_json=result_json
+    ).on_conflict_do_update(
+        constraint=constraint,
+        set_={'result_json': Compatibility.result_json}
+    ).returning(Compatibility)
+    compatibility = db.scalars(stmt, execution_options={"populate_existing": True}).one()
+    db.commit()
+    return compatibility
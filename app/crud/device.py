@@ -1,7 +1,10 @@
+from sqlalchemy import select, update
 from sqlalchemy.orm import Session
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.sql import func
 from typing import List
 from app.models.device import Device
+import uuid
 
 
 def register_or_update_device(
@@ -12,36 +15,36 @@ def register_or_update_device(
     app_version: str | None,
     lang: str | None,
 ) -> Device:
-    device = db.query(Device).filter(Device.fcm_token == fcm_token).first()
-    if device:
-        device.user_id = user_id
-        device.platform = platform
-        device.app_version = app_version
-        device.lang = lang
-        device.push_enabled = True
-        device.last_seen = func.now()
-    else:
-        device = Device(
-            user_id=user_id,
-            fcm_token=fcm_token,
-            platform=platform,
-            app_version=app_version,
-            lang=lang,
-            push_enabled=True,
-        )
-        db.add(device)
+    # Single round trip: insert, or on conflict re-point the existing token at this user
+    stmt = insert(Device).values(
+        id=str(uuid.uuid4()),
+        user_id=user_id,
+        fcm_token=fcm_token,
+        platform=platform,
+        app_version=app_version,
+        lang=lang,
+        push_enabled=True,
+    )
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[Device.fcm_token],
+        set_={
+            "user_id": stmt.excluded.user_id,
+            "platform": stmt.excluded.platform,
+            "app_version": stmt.excluded.app_version,
+            "lang": stmt.excluded.lang,
+            "push_enabled": True,
+            "last_seen": func.now(),
+        },
+    ).returning(Device)
+    device = db.scalars(stmt, execution_options={"populate_existing": True}).one()
     db.commit()
-    db.refresh(device)
     return device
 
 
 def list_user_tokens(db: Session, user_id: str) -> List[str]:
-    return [
-        d.fcm_token
-        for d in db.query(Device)
-        .filter(Device.user_id == user_id, Device.push_enabled == True)
-        .all()
-    ]
+    return list(db.scalars(
+        select(Device.fcm_token).where(Device.user_id == user_id, Device.push_enabled.is_(True))
+    ))
 
 
 def delete_by_token(db: Session, fcm_token: str) -> None:
@@ -52,7 +55,5 @@ def delete_by_token(db: Session, fcm_token: str) -> None:
 
 
 def touch_heartbeat(db: Session, fcm_token: str) -> None:
-    d = db.query(Device).filter(Device.fcm_token == fcm_token).first()
-    if d:
-        d.last_seen = func.now()
-        db.commit() 
\ No newline at end of file
+    db.execute(update(Device).where(Device.fcm_token == fcm_token).values(last_seen=func.now()))
+    db.commit()
@@ -1,59 +1,64 @@
-from sqlalchemy.orm import Session, joinedload
-from sqlalchemy import and_, or_
+from sqlalchemy.orm import Session, joinedload, raiseload, selectinload
+from sqlalchemy import and_, case, exists, func, insert, literal, or_, select, union_all
 from typing import List, Optional, Tuple
+from dataclasses import dataclass
+from datetime import date
 from app.models.friend_request import FriendRequest
 from app.models.friendship import Friendship
 from app.models.user import User
 from app.models.user_streak import UserStreak
 from app.utils.logger import get_logger
+import uuid
 
 logger = get_logger(__name__)
 
+@dataclass(slots=True)
+class StreakData:
+    """Friend's streak fields attached to a friendship as friend_streak_data"""
+    current_streak: Optional[int]
+    longest_streak: Optional[int]
+    last_active_local_date: Optional[date]
+    timezone: Optional[str]
+
 class FriendsCRUD:
     
     @staticmethod
     def send_friend_request(db: Session, requester_id: str, recipient_username: str) -> Optional[FriendRequest]:
         """Send a friend request to a user by username"""
         try:
-            # Find recipient by username
-            recipient = db.query(User).filter(User.username == recipient_username).first()
-            if not recipient:
-                return None
-            
-            # Check if recipient has a username
-            if not recipient.username:
-                return None
-            
-            # Prevent self-friend requests
-            if requester_id == recipient.id:
-                return None
-            
-            # Check if friendship already exists
-            if FriendsCRUD._are_friends(db, requester_id, recipient.id):
-                return None
-
-            existing_request = db.query(FriendRequest).filter(
+            # Single INSERT ... SELECT: the recipient is resolved by username inline, and nothing is
+            # inserted for self-requests, existing friendships, or a pending request either way
+            already_friends = exists().where(
+                or_(
+                    and_(Friendship.user1_id == requester_id, Friendship.user2_id == User.id),
+                    and_(Friendship.user1_id == User.id, Friendship.user2_id == requester_id)
+                )
+            )
+            pending_request = exists().where(
                 and_(
                     or_(
-                        and_(FriendRequest.requester_id == requester_id, FriendRequest.recipient_id == recipient.id),
-                        and_(FriendRequest.requester_id == recipient.id, FriendRequest.recipient_id == requester_id)
+                        and_(FriendRequest.requester_id == requester_id, FriendRequest.recipient_id == User.id),
+                        and_(FriendRequest.requester_id == User.id, FriendRequest.recipient_id == requester_id)
                     ),
                     FriendRequest.status == "pending"
                 )
-            ).first()
-            
-            if existing_request:
-                return None
-            
-            # Create new request
-            friend_request = FriendRequest(
-                requester_id=requester_id,
-                recipient_id=recipient.id,
-                status="pending"
             )
-            db.add(friend_request)
+            recipient = select(
+                literal(str(uuid.uuid4())),
+                literal(requester_id),
+                User.id,
+                literal("pending")
+            ).where(
+                User.username == recipient_username,
+                User.id != requester_id,
+                ~already_friends,
+                ~pending_request
+            )
+            stmt = insert(FriendRequest).from_select(
+                ["id", "requester_id", "recipient_id", "status"], recipient
+            ).returning(FriendRequest)
+            friend_request = db.scalars(stmt).one_or_none()
             db.commit()
-            db.refresh(friend_request)
             return friend_request
             
         except Exception as e:
@@ -136,11 +141,12 @@ class FriendsCRUD:
                     FriendRequest.status == "pending"
                 )
             ).options(
-                joinedload(FriendRequest.requester)
+                joinedload(FriendRequest.requester),
+                raiseload("*")
             ).order_by(FriendRequest.created_at.desc())
             
-            total = query.count()
-            requests = query.offset((page - 1) * page_size).limit(page_size).all()
+            rows, total = FriendsCRUD._paginate_with_total(query, page, page_size)
+            requests = [row[0] for row in rows]
             
             return requests, total
             
@@ -158,11 +164,12 @@ class FriendsCRUD:
                     FriendRequest.status == "pending"
                 )
             ).options(
-                joinedload(FriendRequest.recipient)
+                joinedload(FriendRequest.recipient),
+                raiseload("*")
             ).order_by(FriendRequest.created_at.desc())
             
-            total = query.count()
-            requests = query.offset((page - 1) * page_size).limit(page_size).all()
+            rows, total = FriendsCRUD._paginate_with_total(query, page, page_size)
+            requests = [row[0] for row in rows]
             
             return requests, total
             
@@ -172,82 +179,55 @@ class FriendsCRUD:
     
     @staticmethod
     def get_friends_list(db: Session, user_id: str, page: int = 1, page_size: int = 20) -> Tuple[List[Friendship], int]:
-        """Get friends list for a user with streak information using single JOIN query"""
+        """Get friends list for a user with streak information for the friend side"""
         try:
-            # Create aliases for user streaks to handle both user1 and user2 streaks
-            from sqlalchemy.orm import aliased
-            UserStreak1 = aliased(UserStreak)
-            UserStreak2 = aliased(UserStreak)
-            
-            # Single query with JOINs to get all data at once
-            query = db.query(
-                Friendship,
-                UserStreak1.current_streak.label('user1_current_streak'),
-                UserStreak1.longest_streak.label('user1_longest_streak'),
-                UserStreak1.last_active_local_date.label('user1_last_active_date'),
-                UserStreak1.timezone.label('user1_timezone'),
-                UserStreak2.current_streak.label('user2_current_streak'),
-                UserStreak2.longest_streak.label('user2_longest_streak'),
-                UserStreak2.last_active_local_date.label('user2_last_active_date'),
-                UserStreak2.timezone.label('user2_timezone')
-            ).filter(
+            query = db.query(Friendship).filter(
                 or_(
                     Friendship.user1_id == user_id,
                     Friendship.user2_id == user_id
                 )
             ).options(
-                joinedload(Friendship.user1),
-                joinedload(Friendship.user2)
-            ).outerjoin(
-                UserStreak1, Friendship.user1_id == UserStreak1.user_id
-            ).outerjoin(
-                UserStreak2, Friendship.user2_id == UserStreak2.user_id
+                selectinload(Friendship.user1),
+                selectinload(Friendship.user2),
+                raiseload("*")
             ).order_by(Friendship.created_at.desc())
             
-            # Get total count from the main query (before pagination)
-            total = query.count()
+            # Get paginated results along with the total count (before pagination)
+            results, total = FriendsCRUD._paginate_with_total(query, page, page_size)
+            friendships = [row[0] for row in results]
             
-            # Get paginated results
-            results = query.offset((page - 1) * page_size).limit(page_size).all()
+            # Batch-load streaks for the friend side only, in one query for the whole page
+            friend_ids = [
+                f.user2_id if f.user1_id == user_id else f.user1_id
+                for f in friendships
+            ]
+            streaks = {
+                row.user_id: row
+                for row in db.execute(
+                    select(
+                        UserStreak.user_id,
+                        UserStreak.current_streak,
+                        UserStreak.longest_streak,
+                        UserStreak.last_active_local_date,
+                        UserStreak.timezone
+                    ).where(UserStreak.user_id.in_(friend_ids))
+                )
+            } if friend_ids else {}
             
-            # Process results and attach streak data
-            friendships = []
-            for row in results:
-                friendship = row[0]  # The Friendship object
-                
-                # Determine which user is the friend and get their streak data
-                if friendship.user1_id == user_id:
-                    # user2 is the friend
-                    friend_streak_data = {
-                        'current_streak': row.user2_current_streak,
-                        'longest_streak': row.user2_longest_streak,
-                        'last_active_local_date': row.user2_last_active_date,
-                        'timezone': row.user2_timezone
-                    }
-                else:
-                    # user1 is the friend
-                    friend_streak_data = {
-                        'current_streak': row.user1_current_streak,
-                        'longest_streak': row.user1_longest_streak,
-                        'last_active_local_date': row.user1_last_active_date,
-                        'timezone': row.user1_timezone
-                    }
-                
-                # Create a simple object to hold streak data
-                class StreakData:
-                    def __init__(self, data):
-                        self.current_streak = data['current_streak']
-                        self.longest_streak = data['longest_streak']
-                        self.last_active_local_date = data['last_active_local_date']
-                        self.timezone = data['timezone']
+            # Attach streak data to each friendship
+            for friendship, friend_id in zip(friendships, friend_ids):
+                streak = streaks.get(friend_id)
                 
                 # Attach streak data to friendship object
-                if any(friend_streak_data.values()):  # Only if we have streak data
-                    setattr(friendship, 'friend_streak_data', StreakData(friend_streak_data))
+                if streak and any(streak[1:]):  # Only if we have streak data
+                    setattr(friendship, 'friend_streak_data', StreakData(
+                        streak.current_streak,
+                        streak.longest_streak,
+                        streak.last_active_local_date,
+                        streak.timezone
+                    ))
                 else:
                     setattr(friendship, 'friend_streak_data', None)
-                
-                friendships.append(friendship)
             
             return friendships, total
             
@@ -280,6 +260,17 @@ class FriendsCRUD:
             db.rollback()
             return False
     
+    @staticmethod
+    def _paginate_with_total(query, page: int, page_size: int) -> Tuple[list, int]:
+        """Fetch one page of rows and the total row count in a single query via COUNT(*) OVER ()"""
+        rows = query.add_columns(
+            func.count().over().label("_total")
+        ).offset((page - 1) * page_size).limit(page_size).all()
+        if rows:
+            return rows, rows[0]._total
+        # Past the last page there is no row to carry the window count
+        return rows, query.count() if page > 1 else 0
+
     @staticmethod
     def _are_friends(db: Session, user1_id: str, user2_id: str) -> bool:
         """Check if two users are friends"""
@@ -308,19 +299,24 @@ class FriendsCRUD:
         status_map: dict[str, str] = {user_id: 'none' for user_id in other_user_ids}
 
         try:
-            # Friends
-            friendships = db.query(Friendship).filter(
+            # Friends and pending requests in both directions, resolved to (other_id, status) in one query
+            friends = select(
+                case(
+                    (Friendship.user1_id == current_user_id, Friendship.user2_id),
+                    else_=Friendship.user1_id
+                ).label('other_id'),
+                literal('friend').label('status')
+            ).where(
                 or_(
                     and_(Friendship.user1_id == current_user_id, Friendship.user2_id.in_(other_user_ids)),
                     and_(Friendship.user2_id == current_user_id, Friendship.user1_id.in_(other_user_ids))
                 )
-            ).all()
-            for fr in friendships:
-                other_id = fr.user2_id if fr.user1_id == current_user_id else fr.user1_id
-                status_map[other_id] = 'friend'
-
-            # Pending requests both directions
-            pending_requests = db.query(FriendRequest).filter(
+            )
+            sent_by_current = FriendRequest.requester_id == current_user_id
+            pending_requests = select(
+                case((sent_by_current, FriendRequest.recipient_id), else_=FriendRequest.requester_id),
+                case((sent_by_current, literal('request_sent')), else_=literal('request_received'))
+            ).where(
                 and_(
                     FriendRequest.status == 'pending',
                     or_(
@@ -328,15 +324,11 @@ class FriendsCRUD:
                         and_(FriendRequest.recipient_id == current_user_id, FriendRequest.requester_id.in_(other_user_ids))
                     )
                 )
-            ).all()
-            for req in pending_requests:
-                if req.requester_id == current_user_id:
-                    # Only set if not already friends
-                    if status_map.get(req.recipient_id) != 'friend':
-                        status_map[req.recipient_id] = 'request_sent'
-                elif req.recipient_id == current_user_id:
-                    if status_map.get(req.requester_id) != 'friend':
-                        status_map[req.requester_id] = 'request_received'
+            )
+            for other_id, status in db.execute(union_all(friends, pending_requests)):
+                # Friendship takes priority over any pending request
+                if status == 'friend' or status_map.get(other_id) != 'friend':
+                    status_map[other_id] = status
 
             return status_map
         except Exception as e:
@@ -12,7 +12,7 @@ logger = get_logger(__name__)
 
 def get_google_play_payment(db: Session, order_id: str) -> Optional[GooglePlayPayment]:
     """Get a Google Play payment by order ID."""
-    return db.query(GooglePlayPayment).filter(GooglePlayPayment.id == order_id).first()
+    return db.get(GooglePlayPayment, order_id)
 
 def get_google_play_payments_by_user(db: Session, user_id: str, skip: int = 0, limit: int = 100) -> List[GooglePlayPayment]:
     """Get Google Play payments for a specific user."""
@@ -41,7 +41,6 @@ def create_google_play_payment(
     )
     db.add(db_payment)
     db.commit()
-    db.refresh(db_payment)
     return db_payment
 
 def update_google_play_payment_status(
@@ -125,7 +124,6 @@ def create_purchase_event(db: Session, event_data: dict) -> PurchaseEvent:
     db_event = PurchaseEvent(**event_data)
     db.add(db_event)
     db.commit()
-    db.refresh(db_event)
     return db_event
 
 def get_purchase_event_by_message_id(db: Session, message_id: str) -> PurchaseEvent:
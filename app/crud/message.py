@@ -1,6 +1,8 @@
 from sqlalchemy.orm import Session
 from app.models import Message
 from typing import List, Optional
+from datetime import datetime
+from sqlalchemy import tuple_
 
 def get_messages(db: Session, user_id: str, skip: int = 0, limit: int = 100) -> List[Message]:
     """Get all messages for a user."""
@@ -19,7 +21,6 @@ def create_message(db: Session, user_id: str, role: str, query: str, content: st
     )
     db.add(db_message)
     db.commit()
-    db.refresh(db_message)
     return db_message
 
 def get_last_messages(db: Session, user_id: str, n: int = 3, skip: int = 0) -> List[Message]:
@@ -28,11 +29,22 @@ def get_last_messages(db: Session, user_id: str, n: int = 3, skip: int = 0) -> L
         Message.user_id == user_id
     ).order_by(Message.created_at.desc()).offset(skip).limit(n).all()[::-1]
 
-def get_thread_messages(db: Session, thread_id: str, skip: int = 0, limit: int = 100) -> List[Message]:
-    """Get messages for a specific thread with pagination"""
-    return db.query(Message).filter(
-        Message.thread_id == thread_id
-    ).order_by(Message.created_at.desc()).offset(skip).limit(limit).all()
+def get_thread_messages(
+    db: Session,
+    thread_id: str,
+    skip: int = 0,
+    limit: int = 100,
+    before_created_at: Optional[datetime] = None,
+    before_id: Optional[str] = None,
+) -> List[Message]:
+    """Get messages for a specific thread with pagination, newest first.
+    Passing the created_at and id of the last message seen seeks straight to the next page; skip is ignored then."""
+    query = db.query(Message).filter(Message.thread_id == thread_id)
+    if before_created_at is not None and before_id is not None:
+        # Keyset seek on (created_at, id): served by an index range scan however deep the page is
+        query = query.filter(tuple_(Message.created_at, Message.id) < (before_created_at, before_id))
+        skip = 0
+    return query.order_by(Message.created_at.desc(), Message.id.desc()).offset(skip).limit(limit).all()
 
 def get_last_thread_messages(db: Session, thread_id: str, n: int = 3, skip: int = 0) -> List[Message]:
     """Get the last N messages for a specific thread"""
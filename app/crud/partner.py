@@ -1,6 +1,9 @@
-from sqlalchemy.orm import Session
+from sqlalchemy import event
+from sqlalchemy.orm import Session, make_transient_to_detached
 from app.models.partner import Partner
 from app.schemas.partner import PartnerCreate
+from app.cache import get_partner_from_cache, set_partner_in_cache, delete_partner_from_cache
+from datetime import datetime
 
 def create_partner(db: Session, partner: PartnerCreate) -> Partner:
     db_partner = Partner(
@@ -12,18 +15,54 @@ def create_partner(db: Session, partner: PartnerCreate) -> Partner:
     )
     db.add(db_partner)
     db.commit()
-    db.refresh(db_partner)
     return db_partner
 
 def get_partners_by_user(db: Session, user_id: str, skip: int = 0, limit: int = 100):
     return db.query(Partner).filter(Partner.user_id == user_id).offset(skip).limit(limit).all()
 
+# Partner datetime columns; they come back from the JSON cache as ISO strings
+_PARTNER_DATETIME_COLUMNS = ("time_of_birth", "created_at", "updated_at")
+
 def get_partner(db: Session, partner_id: str):
-    return db.query(Partner).filter(Partner.id == partner_id).first()
+    # Read-through cache: a hit is rebuilt from the cached column values and attached to the
+    # session without a SELECT, so relationships load and changes persist as for a queried row
+    cached = get_partner_from_cache(partner_id)
+    if cached is not None:
+        for column in _PARTNER_DATETIME_COLUMNS:
+            if cached.get(column):
+                cached[column] = datetime.fromisoformat(cached[column])
+        partner = Partner(**cached)
+        make_transient_to_detached(partner)
+        return db.merge(partner, load=False)
+    partner = db.get(Partner, partner_id)
+    if partner:
+        partner_data = {column.key: getattr(partner, column.key) for column in Partner.__table__.columns}
+        set_partner_in_cache(partner_id, partner.user_id, partner_data)
+    return partner
 
 def delete_partner(db: Session, partner_id: str):
-    partner = db.query(Partner).filter(Partner.id == partner_id).first()
+    partner = db.get(Partner, partner_id)
     if partner:
         db.delete(partner)
         db.commit()
-    return partner 
\ No newline at end of file
+    return partner
+
+# Any committed edit or delete of a Partner, whatever the write path, evicts its cached row.
+# Ids are collected at flush (while the session still lists them as dirty/deleted) and evicted
+# only after commit, so a concurrent read cannot re-cache the old row in between.
+_CHANGED_PARTNER_IDS = "changed_partner_ids"
+
+@event.listens_for(Session, "after_flush")
+def _collect_changed_partners(session: Session, flush_context) -> None:
+    changed = [obj.id for obj in (*session.dirty, *session.deleted) if isinstance(obj, Partner)]
+    if changed:
+        session.info.setdefault(_CHANGED_PARTNER_IDS, set()).update(changed)
+
+@event.listens_for(Session, "after_commit")
+def _evict_changed_partners(session: Session) -> None:
+    for partner_id in session.info.pop(_CHANGED_PARTNER_IDS, ()):
+        delete_partner_from_cache(partner_id)
+
+@event.listens_for(Session, "after_rollback")
+def _forget_changed_partners(session: Session) -> None:
+    session.info.pop(_CHANGED_PARTNER_IDS, None)
@@ -18,7 +18,6 @@ def create_rant(db: Session, rant_data: dict) -> Rant:
     db_rant = Rant(**rant_data)
     db.add(db_rant)
     db.commit()
-    db.refresh(db_rant)
     return db_rant
 
 
@@ -42,10 +41,11 @@ def get_rants_by_user(db: Session, user_id: str, skip: int = 0, limit: int = 100
 
 def get_rant_by_id(db: Session, rant_id: str, user_id: str) -> Optional[Rant]:
     """Get a specific rant by ID for a specific user"""
-    return db.query(Rant).filter(
-        Rant.id == rant_id,
-        Rant.user_id == user_id
-    ).first()
+    # Primary-key lookup goes through the identity map first; ownership is checked on the row
+    rant = db.get(Rant, rant_id)
+    if rant is None or rant.user_id != user_id:
+        return None
+    return rant
 
 
 def get_rant_count_by_user(db: Session, user_id: str) -> int:
@@ -1,6 +1,6 @@
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import IntegrityError
-from sqlalchemy import func
+from sqlalchemy import bindparam, func, select, update
 from app.models import User
 from datetime import datetime
 import json
@@ -10,6 +10,15 @@ def get_user(db: Session, user_id: str) -> User:
     """Get a user by ID."""
     return db.query(User).filter(User.id == user_id).first()
 
+# Built once so every authenticated request reuses the same statement (and its compiled SQL cache entry)
+_CURRENT_USER_STMT = select(
+    User.email, User.display_name, User.username, User.credits, User.pronouns
+).where(User.id == bindparam("user_id"))
+
+def get_current_user_row(db: Session, user_id: str):
+    """Get only the columns needed for the authenticated CurrentUser, without loading the ORM entity."""
+    return db.execute(_CURRENT_USER_STMT, {"user_id": user_id}).first()
+
 def get_user_by_id(db: Session, user_id: str) -> User:
     """Get a user by ID (alias for get_user)."""
     return get_user(db, user_id)
@@ -131,13 +140,15 @@ def update_user(db: Session, user: User, update_data: dict) -> User:
     """Update a user with the provided data."""
     return update_user_fields(db, user, update_data)
 
-def update_user_display_name(db: Session, user_id: str, display_name: str) -> User:
-    """Update a user's display name."""
-    db_user = get_user(db, user_id)
-    if db_user:
-        db_user.display_name = display_name
-        db.commit()
-        db.refresh(db_user)
+def update_user_display_name(db: Session, user_id: str, display_name: str) -> Optional[User]:
+    """Update a user's display name; returns None when the user is missing or the name is already current."""
+    # Existence check, no-op check and write in one statement; a loaded User is refreshed in place
+    stmt = update(User).where(
+        User.id == user_id,
+        User.display_name.is_distinct_from(display_name)
+    ).values(display_name=display_name).returning(User)
+    db_user = db.scalars(stmt, execution_options={"populate_existing": True}).one_or_none()
+    db.commit()
     return db_user
 
 # Add a function to set user state (activate)
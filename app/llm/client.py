@@ -618,7 +618,7 @@ class LLMClient:
         """
         try:
             # Import tools from agents
-            from app.agents.tools import get_divisional_chart, get_vimshottari_dasha, get_ashtakavarga, get_shadbala, get_lat_long, get_timezone
+            from app.agents.tools import get_divisional_chart_model, get_vimshottari_dasha, get_ashtakavarga, get_shadbala, get_lat_long, get_timezone
             
             # Parse birth data
             birth_date = birth_data.get('date', 'N/A')
@@ -628,7 +628,7 @@ class LLMClient:
             # Extract date/time components for calculations
             if birth_date != 'N/A' and birth_time != 'N/A':
                 try:
-                    birth_dt = datetime.strptime(f"{birth_date} {birth_time}", "%Y-%m-%d %H:%M")
+                    birth_dt = datetime.fromisoformat(f"{birth_date}T{birth_time}")
                     
                     # Get location data
                     latitude = birth_data.get('latitude')
@@ -685,17 +685,17 @@ class LLMClient:
                     logger.info(f"Birth data parsed - Date: {birth_dt}, Lat: {latitude} ({type(latitude)}), Lon: {longitude} ({type(longitude)}), TZ: {timezone_offset} ({type(timezone_offset)})")
                     
                     # 1. Get D1, D9, D10 charts (Essential for personality)
-                    d1_chart = get_divisional_chart('d1', birth_dt.year, birth_dt.month, birth_dt.day, 
-                                                   birth_dt.hour, birth_dt.minute, 0, 
-                                                   latitude, longitude, timezone_offset)
+                    d1_chart = get_divisional_chart_model('d1', birth_dt.year, birth_dt.month, birth_dt.day, 
+                                                         birth_dt.hour, birth_dt.minute, 0, 
+                                                         latitude, longitude, timezone_offset)
                     
-                    d9_chart = get_divisional_chart('d9', birth_dt.year, birth_dt.month, birth_dt.day, 
-                                                   birth_dt.hour, birth_dt.minute, 0, 
-                                                   latitude, longitude, timezone_offset)
+                    d9_chart = get_divisional_chart_model('d9', birth_dt.year, birth_dt.month, birth_dt.day, 
+                                                         birth_dt.hour, birth_dt.minute, 0, 
+                                                         latitude, longitude, timezone_offset)
                     
-                    d10_chart = get_divisional_chart('d10', birth_dt.year, birth_dt.month, birth_dt.day, 
-                                                    birth_dt.hour, birth_dt.minute, 0, 
-                                                    latitude, longitude, timezone_offset)
+                    d10_chart = get_divisional_chart_model('d10', birth_dt.year, birth_dt.month, birth_dt.day, 
+                                                          birth_dt.hour, birth_dt.minute, 0, 
+                                                          latitude, longitude, timezone_offset)
                     
                     # 2. Get Vimshottari Dasha (Current life period)
                     current_year = datetime.now().year
@@ -731,13 +731,13 @@ class LLMClient:
                     **Birth Details:** {birth_date} at {birth_time} in {birth_place}
                     
                     **D1 Chart (Basic Nature & Personality):**
-                    {d1_chart.get('charts', 'Data unavailable') if not d1_chart.get('error') else 'Chart calculation failed'}
+                    {d1_chart.charts if not d1_chart.error else 'Chart calculation failed'}
                     
                     **D9 Chart (Marriage, Relationships & Deep Personality):**
-                    {d9_chart.get('charts', 'Data unavailable') if not d9_chart.get('error') else 'Chart calculation failed'}
+                    {d9_chart.charts if not d9_chart.error else 'Chart calculation failed'}
                     
                     **D10 Chart (Career & Professional Traits):**
-                    {d10_chart.get('charts', 'Data unavailable') if not d10_chart.get('error') else 'Chart calculation failed'}
+                    {d10_chart.charts if not d10_chart.error else 'Chart calculation failed'}
                     
                     **Current Dasha Period (Life Phase Influences):**
                     Current Dasha: {vimshottari_dasha.get('current_dasha', {}).get('dasa_lord', 'Unknown')}
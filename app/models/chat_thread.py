@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, DateTime, ForeignKey, Boolean, Text
+from sqlalchemy import Column, String, DateTime, ForeignKey, Boolean, Text, Index
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
 from app.database import Base
@@ -26,6 +26,11 @@ class ChatThread(Base):
     user = relationship("User", back_populates="chat_threads")
     messages = relationship("Message", back_populates="thread", cascade="all, delete-orphan")
 
+    # Serves get_user_threads (user_id = ? ORDER BY updated_at DESC) with a backward index scan, no sort
+    __table_args__ = (
+        Index("ix_chat_threads_user_updated", "user_id", "updated_at"),
+    )
+
     def _get_participants_obj(self) -> dict:
         if not self.participants_json:
             return {"user_ids": [], "partner_ids": []}
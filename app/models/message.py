@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, DateTime, ForeignKey, Text
+from sqlalchemy import Column, String, DateTime, ForeignKey, Text, Index
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
 from app.database import Base
@@ -20,5 +20,12 @@ class Message(Base):
     user = relationship("User", back_populates="messages")
     thread = relationship("ChatThread", back_populates="messages")
     
+    # Serves thread message pages (thread_id = ? ORDER BY created_at DESC, id DESC) and keyset seeks
+    __table_args__ = (
+        Index("ix_messages_thread_created_id", "thread_id", "created_at", "id"),
+    )
+    
+    __mapper_args__ = {"eager_defaults": True}
+    
     def __repr__(self):
         return f"<Message id={self.id} user_id={self.user_id} thread_id={self.thread_id}>" 
\ No newline at end of file
@@ -20,5 +20,7 @@ class Partner(Base):
     # Relationships
     user = relationship("User", back_populates="partners")
     
+    __mapper_args__ = {"eager_defaults": True}
+    
     def __repr__(self):
         return f"<Partner id={self.id} name={self.name}>" 
\ No newline at end of file
@@ -28,6 +28,8 @@ class GooglePlayPayment(Base):
     # Relationship to user
     user = relationship("User", back_populates="google_play_payments")
     
+    __mapper_args__ = {"eager_defaults": True}
+    
     def __repr__(self):
         return f"<GooglePlayPayment id={self.id} user_id={self.user_id} product_id={self.product_id} status={self.status}>"
 
@@ -69,5 +71,7 @@ class PurchaseEvent(Base):
     created_at = Column(DateTime, server_default=func.now())
     processed_at = Column(DateTime)
 
+    __mapper_args__ = {"eager_defaults": True}
+
     def __repr__(self):
         return f"<PurchaseEvent id={self.id} purchase_token={self.purchase_token} status={self.status}>" 
\ No newline at end of file
@@ -31,5 +31,7 @@ class Rant(Base):
     # Relationships
     user = relationship("User", back_populates="rants")
     
+    __mapper_args__ = {"eager_defaults": True}
+    
     def __repr__(self) -> str:
         return f"<Rant id={self.id} user_id={self.user_id} type={self.rant_type} valid={self.is_valid_rant}>" 
\ No newline at end of file
@@ -9,7 +9,7 @@ router = APIRouter(prefix="/devices", tags=["devices"])
 
 
 @router.post("/register", response_model=DeviceResponse)
-async def register_device(
+def register_device(
     body: DeviceRegisterRequest,
     db: Session = Depends(get_db),
     current_user = Depends(get_current_user),
@@ -33,7 +33,7 @@ async def register_device(
 
 
 @router.delete("/unregister")
-async def unregister_device(
+def unregister_device(
     fcm_token: str,
     db: Session = Depends(get_db),
     _=Depends(get_current_user),
@@ -43,7 +43,7 @@ async def unregister_device(
 
 
 @router.post("/heartbeat")
-async def heartbeat(
+def heartbeat(
     body: DeviceHeartbeatRequest,
     db: Session = Depends(get_db),
     _=Depends(get_current_user),
@@ -53,7 +53,7 @@ async def heartbeat(
 
 
 @router.get("", response_model=list[str])
-async def my_tokens(
+def my_tokens(
     db: Session = Depends(get_db),
     current_user = Depends(get_current_user),
 ):
@@ -18,7 +18,7 @@ logger = get_logger(__name__)
 router = APIRouter(prefix="/friends", tags=["friends"])
 
 @router.post("/request", response_model=FriendRequestResponse)
-async def send_friend_request(
+def send_friend_request(
     request: FriendRequestCreate,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
@@ -63,7 +63,7 @@ async def send_friend_request(
         raise HTTPException(status_code=500, detail="Internal server error")
 
 @router.post("/request/{request_id}/accept", response_model=FriendRequestStatusResponse)
-async def accept_friend_request(
+def accept_friend_request(
     request_id: str,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
@@ -97,7 +97,7 @@ async def accept_friend_request(
         raise HTTPException(status_code=500, detail="Internal server error")
 
 @router.post("/request/{request_id}/reject", response_model=FriendRequestStatusResponse)
-async def reject_friend_request(
+def reject_friend_request(
     request_id: str,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
@@ -124,7 +124,7 @@ async def reject_friend_request(
         raise HTTPException(status_code=500, detail="Internal server error")
 
 @router.delete("/request/{request_id}", response_model=FriendRequestStatusResponse)
-async def cancel_friend_request(
+def cancel_friend_request(
     request_id: str,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
@@ -151,7 +151,7 @@ async def cancel_friend_request(
         raise HTTPException(status_code=500, detail="Internal server error")
 
 @router.get("/requests", response_model=FriendRequestsListResponse)
-async def get_friend_requests(
+def get_friend_requests(
     page: int = Query(1, ge=1, description="Page number"),
     page_size: int = Query(20, ge=1, le=100, description="Items per page"),
     current_user: User = Depends(get_current_user),
@@ -183,7 +183,7 @@ async def get_friend_requests(
         raise HTTPException(status_code=500, detail="Internal server error")
 
 @router.get("/requests/sent", response_model=FriendRequestsListResponse)
-async def get_sent_friend_requests(
+def get_sent_friend_requests(
     page: int = Query(1, ge=1, description="Page number"),
     page_size: int = Query(20, ge=1, le=100, description="Items per page"),
     current_user: User = Depends(get_current_user),
@@ -215,7 +215,7 @@ async def get_sent_friend_requests(
         raise HTTPException(status_code=500, detail="Internal server error")
 
 @router.get("/list", response_model=FriendsListResponse)
-async def get_friends_list(
+def get_friends_list(
     page: int = Query(1, ge=1, description="Page number"),
     page_size: int = Query(20, ge=1, le=100, description="Items per page"),
     search_username: str | None = Query(None, description="Optional search on friend's username"),
@@ -310,7 +310,7 @@ async def get_friends_list(
         raise HTTPException(status_code=500, detail="Internal server error")
 
 @router.delete("/{friend_username}", response_model=FriendRequestStatusResponse)
-async def remove_friend(
+def remove_friend(
     friend_username: str,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
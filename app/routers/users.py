@@ -285,6 +285,8 @@ async def get_user_thread_messages(
     thread_id: UUID = Path(..., description="The ID of the thread"),
     skip: int = Query(0, description="Number of messages to skip", ge=0),
     limit: int = Query(20, description="Maximum number of messages to return", ge=1, le=100),
+    before_created_at: datetime | None = Query(None, description="created_at of the last message already received"),
+    before_id: str | None = Query(None, description="ID of the last message already received"),
     current_user: schemas.CurrentUser = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
@@ -293,8 +295,10 @@ async def get_user_thread_messages(
     
     Args:
         thread_id: The ID of the thread
-        skip: Number of messages to skip for pagination
+        skip: Number of messages to skip for pagination (ignored when a cursor is given)
         limit: Maximum number of messages to return
+        before_created_at: Cursor; with before_id, returns the messages older than that message
+        before_id: Cursor; with before_created_at, returns the messages older than that message
         current_user: The authenticated user
         db: Database session
         
@@ -307,7 +311,10 @@ async def get_user_thread_messages(
     if not thread:
         raise HTTPException(status_code=404, detail="Thread not found")
     
-    messages = crud.get_thread_messages(db, str(thread_id), skip, limit)
+    if (before_created_at is None) != (before_id is None):
+        raise HTTPException(status_code=400, detail="before_created_at and before_id must be given together")
+    
+    messages = crud.get_thread_messages(db, str(thread_id), skip, limit, before_created_at, before_id)
     return messages
 
 async def _calculate_compatibility(
@@ -0,0 +1,43 @@
+"""
+Shared pytest fixtures.
+
+Database-backed tests run against the throwaway Postgres database in TEST_DATABASE_URL
+(its tables are created and emptied by the fixtures) and are skipped when it is not set.
+"""
+
+import os
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+TEST_DATABASE_URL = os.getenv("TEST_DATABASE_URL")
+
+
+@pytest.fixture(scope="session")
+def db_engine():
+    if not TEST_DATABASE_URL:
+        pytest.skip("TEST_DATABASE_URL not set")
+    from app.database import Base
+    import app.models  # noqa: F401  (registers every table on Base.metadata)
+
+    engine = create_engine(TEST_DATABASE_URL)
+    Base.metadata.create_all(engine)
+    yield engine
+    Base.metadata.drop_all(engine)
+    engine.dispose()
+
+
+@pytest.fixture
+def db(db_engine):
+    """A session configured like the app's SessionLocal; every table is emptied afterwards."""
+    from app.database import Base
+
+    session = sessionmaker(autocommit=False, autoflush=False, expire_on_commit=False, bind=db_engine)()
+    try:
+        yield session
+    finally:
+        session.close()
+        with db_engine.begin() as conn:
+            for table in reversed(Base.metadata.sorted_tables):
+                conn.execute(table.delete())
@@ -0,0 +1,31 @@
+"""Add composite (thread_id, created_at, id) index to messages
+
+Revision ID: v5
+Revises: v4
+Create Date: 2026-10-15 00:00:00
+"""
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = 'v5'
+down_revision = 'v4'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        'ix_messages_thread_created_id',
+        'messages',
+        ['thread_id', 'created_at', 'id'],
+        unique=False
+    )
+    # The composite index's leading column covers every lookup the single-column index served
+    op.drop_index('ix_messages_thread_id', table_name='messages')
+
+
+def downgrade() -> None:
+    op.create_index('ix_messages_thread_id', 'messages', ['thread_id'], unique=False)
+    op.drop_index('ix_messages_thread_created_id', table_name='messages')
@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+Tests for the Redis cache helpers. Requires a Redis server at REDIS_HOST:REDIS_PORT.
+"""
+
+import asyncio
+import uuid
+
+import pytest
+
+from app.cache import (
+    cache,
+    clear_user_cache,
+    delete_cached_data,
+    generate_cache_key,
+    generate_user_keys_index_key,
+    get_cached_data,
+    get_daily_facts_from_cache,
+    get_partner_from_cache,
+    get_weekly_horoscope_from_cache,
+    is_redis_available,
+    redis_client,
+    set_cached_data,
+    set_daily_facts_in_cache,
+    set_partner_in_cache,
+    set_weekly_horoscope_in_cache,
+)
+
+pytestmark = pytest.mark.skipif(not is_redis_available(), reason="Redis server not available")
+
+
+@pytest.fixture
+def user_id():
+    return f"test-{uuid.uuid4()}"
+
+
+def test_clear_user_cache_removes_indexed_keys(user_id):
+    set_daily_facts_in_cache(user_id, "2026-01-01", {"fact": "indexed"})
+    assert get_daily_facts_from_cache(user_id, "2026-01-01") == {"fact": "indexed"}
+
+    assert clear_user_cache(user_id)
+
+    assert get_daily_facts_from_cache(user_id, "2026-01-01") is None
+    assert not redis_client.exists(generate_user_keys_index_key(user_id))
+
+
+def test_clear_user_cache_removes_every_indexed_entry(user_id):
+    set_weekly_horoscope_in_cache(user_id, "2026-01-05", {"week": "indexed"}, 60)
+    set_partner_in_cache("partner-1", user_id, {"id": "partner-1"})
+
+    assert clear_user_cache(user_id)
+
+    assert get_weekly_horoscope_from_cache(user_id, "2026-01-05") is None
+    assert get_partner_from_cache("partner-1") is None
+
+
+def test_clear_user_cache_leaves_prefix_sharing_users_alone(user_id):
+    """Clearing "abc" must not touch "abcd"'s entries."""
+    longer_user_id = f"{user_id}d"
+    set_daily_facts_in_cache(longer_user_id, "2026-01-01", {"fact": "other"})
+
+    try:
+        assert clear_user_cache(user_id)
+        assert get_daily_facts_from_cache(longer_user_id, "2026-01-01") == {"fact": "other"}
+    finally:
+        clear_user_cache(longer_user_id)
+
+
+def test_clear_user_cache_leaves_other_users_alone(user_id):
+    other_user_id = f"test-{uuid.uuid4()}"
+    other_key = f"daily_facts:{other_user_id}:2026-01-01"
+    set_cached_data(other_key, {"fact": "other"}, 60, user_id=other_user_id)
+
+    try:
+        assert clear_user_cache(user_id)
+        assert get_cached_data(other_key) == {"fact": "other"}
+    finally:
+        clear_user_cache(other_user_id)
+
+
+def test_cache_decorator_serves_repeat_calls_from_redis(user_id):
+    calls = []
+
+    @cache(expire_seconds=60)
+    async def lookup(key):
+        calls.append(key)
+        return {"key": key, "calls": len(calls)}
+
+    async def call_twice():
+        return await lookup(user_id), await lookup(user_id)
+
+    try:
+        first, second = asyncio.run(call_twice())
+        assert first == second == {"key": user_id, "calls": 1}
+        assert calls == [user_id]
+    finally:
+        delete_cached_data(generate_cache_key("lookup", user_id))
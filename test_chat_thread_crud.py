@@ -0,0 +1,31 @@
+#!/usr/bin/env python3
+"""
+Tests for the chat thread CRUD helpers. Requires TEST_DATABASE_URL (see conftest.py).
+"""
+
+import pytest
+from sqlalchemy.orm.exc import ObjectDeletedError
+
+from app import crud
+
+
+def test_delete_chat_thread_removes_loaded_messages(db):
+    crud.create_user(db, "user-1", "one@example.com", "One", state="active")
+    thread = crud.create_chat_thread(db, "user-1", "Thread")
+    message = crud.create_message(db, "user-1", "user", "hi", "hello", thread.id)
+
+    assert crud.delete_chat_thread(db, thread.id, "user-1")
+
+    # The cascaded delete happens in the database; the loaded message must not serve stale data
+    with pytest.raises(ObjectDeletedError):
+        message.content
+    assert crud.get_chat_thread(db, thread.id, "user-1") is None
+
+
+def test_delete_chat_thread_checks_ownership(db):
+    crud.create_user(db, "user-1", "one@example.com", "One", state="active")
+    crud.create_user(db, "user-2", "two@example.com", "Two", state="active")
+    thread = crud.create_chat_thread(db, "user-1", "Thread")
+
+    assert not crud.delete_chat_thread(db, thread.id, "user-2")
+    assert crud.get_chat_thread(db, thread.id, "user-1") is not None
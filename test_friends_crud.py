@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+Tests for FriendsCRUD. Requires TEST_DATABASE_URL (see conftest.py).
+"""
+
+import pytest
+
+from app.crud import FriendsCRUD
+from app.models import FriendRequest, Friendship, User
+
+
+@pytest.fixture
+def users(db):
+    for name in ("alice", "bob", "carol"):
+        db.add(User(id=name, email=f"{name}@example.com", username=name))
+    db.commit()
+    return "alice", "bob", "carol"
+
+
+def test_send_friend_request_creates_a_pending_request(db, users):
+    request = FriendsCRUD.send_friend_request(db, "alice", "bob")
+
+    assert request.requester_id == "alice"
+    assert request.recipient_id == "bob"
+    assert request.status == "pending"
+
+
+def test_send_friend_request_to_self_is_rejected(db, users):
+    assert FriendsCRUD.send_friend_request(db, "alice", "alice") is None
+    assert db.query(FriendRequest).count() == 0
+
+
+def test_send_friend_request_to_unknown_username_is_rejected(db, users):
+    assert FriendsCRUD.send_friend_request(db, "alice", "nobody") is None
+
+
+@pytest.mark.parametrize("requester, recipient", [("alice", "bob"), ("bob", "alice")])
+def test_send_friend_request_duplicate_is_rejected(db, users, requester, recipient):
+    """A pending request in either direction blocks a new one."""
+    assert FriendsCRUD.send_friend_request(db, "alice", "bob") is not None
+
+    assert FriendsCRUD.send_friend_request(db, requester, recipient) is None
+    assert db.query(FriendRequest).count() == 1
+
+
+def test_send_friend_request_to_a_friend_is_rejected(db, users):
+    db.add(Friendship(user1_id="alice", user2_id="bob"))
+    db.commit()
+
+    assert FriendsCRUD.send_friend_request(db, "bob", "alice") is None
+    assert db.query(FriendRequest).count() == 0
+
+
+@pytest.fixture
+def incoming_requests(db, users):
+    """Three pending requests to alice."""
+    db.add(User(id="dave", email="dave@example.com", username="dave"))
+    db.commit()
+    for name in ("bob", "carol", "dave"):
+        FriendsCRUD.send_friend_request(db, name, "alice")
+
+
+@pytest.mark.parametrize("page, expected_rows", [(1, 2), (2, 1), (3, 0), (10, 0)])
+def test_friend_request_pages_report_the_full_total(db, incoming_requests, page, expected_rows):
+    """The total stays correct on every page, including pages past the last one."""
+    requests, total = FriendsCRUD.get_friend_requests(db, "alice", page=page, page_size=2)
+
+    assert len(requests) == expected_rows
+    assert total == 3
+
+
+def test_friend_request_pages_are_empty_without_requests(db, users):
+    assert FriendsCRUD.get_friend_requests(db, "alice", page=1, page_size=2) == ([], 0)
+    assert FriendsCRUD.get_friend_requests(db, "alice", page=2, page_size=2) == ([], 0)
@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""
+Tests for the get_lagnas tool and its memoized wrapper.
+"""
+
+import os
+
+import pytest
+
+from app.agents import tools
+from app.agents.tools import DEFAULT_EPHE_PATH, get_lagnas, get_upapada_lagna
+
+# Chennai, March 15, 1990, 6:30 AM IST
+BIRTH = (1990, 3, 15, 6, 30, 0, 13.0878, 80.2785, 5.5)
+
+requires_ephemeris = pytest.mark.skipif(
+    not os.path.isdir(DEFAULT_EPHE_PATH),
+    reason=f"Swiss Ephemeris files not found at {DEFAULT_EPHE_PATH}"
+)
+
+
+@pytest.mark.parametrize("divisional_chart_factor", [1, 9])
+def test_get_lagnas_forwards_every_argument(monkeypatch, divisional_chart_factor):
+    """Every argument get_lagnas takes reaches the memoized computation."""
+    calls = []
+    monkeypatch.setattr(tools, "_memoized_lagnas", lambda *args: calls.append(args) or {})
+
+    get_lagnas(*BIRTH, language='ta', divisional_chart_factor=divisional_chart_factor)
+
+    assert calls == [(*BIRTH, 'LAHIRI', 'ta', divisional_chart_factor)]
+
+
+@requires_ephemeris
+def test_get_lagnas_divisional_chart_factor_changes_the_result():
+    rasi = get_lagnas(*BIRTH, divisional_chart_factor=1)
+    navamsa = get_lagnas(*BIRTH, divisional_chart_factor=9)
+    assert 'error' not in rasi
+    assert 'error' not in navamsa
+    assert rasi != navamsa
+
+
+@requires_ephemeris
+def test_get_lagnas_returns_lagna_positions():
+    result = get_lagnas(*BIRTH)
+    assert 'error' not in result
+    constellation, longitude = result['lagna'][:2]
+    assert 0 <= constellation <= 11
+    assert 0 <= longitude < 30
+
+
+@requires_ephemeris
+def test_get_lagnas_results_are_independent_copies():
+    """Mutating one result must not leak into the next call's cached result."""
+    first = get_lagnas(*BIRTH)
+    first['lagna'] = None
+    assert get_lagnas(*BIRTH)['lagna'] is not None
+
+
+def test_special_lagna_chart_info_is_a_plain_dict():
+    """The static chart_info block is handed to the agent as a fresh, JSON-serializable dict."""
+    result = get_upapada_lagna(*BIRTH)
+    if 'error' in result:
+        pytest.skip(result['error'])
+    assert type(result['chart_info']) is dict
+    result['chart_info']['description'] = None
+    assert get_upapada_lagna(*BIRTH)['chart_info']['description'] is not None
@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+"""
+Tests for the message CRUD helpers. Requires TEST_DATABASE_URL (see conftest.py).
+"""
+
+from datetime import datetime, timedelta
+
+import pytest
+
+from app import crud
+from app.models import Message
+
+START = datetime(2026, 1, 1, 12, 0, 0)
+
+
+@pytest.fixture
+def thread_id(db):
+    """A thread with seven messages; the last three share a created_at, so only the id orders them."""
+    crud.create_user(db, "user-1", "one@example.com", "One", state="active")
+    thread = crud.create_chat_thread(db, "user-1", "Thread")
+    for i in range(7):
+        db.add(Message(
+            id=f"message-{i}",
+            user_id="user-1",
+            thread_id=thread.id,
+            role="user",
+            query=f"q{i}",
+            content=f"c{i}",
+            created_at=START + timedelta(minutes=min(i, 4)),
+        ))
+    db.commit()
+    return thread.id
+
+
+def _newest_first(db, thread_id):
+    return [m.id for m in crud.get_thread_messages(db, thread_id, limit=100)]
+
+
+def test_thread_messages_are_newest_first_with_id_tiebreak(db, thread_id):
+    assert _newest_first(db, thread_id) == [f"message-{i}" for i in reversed(range(7))]
+
+
+def test_thread_message_cursor_pages_cover_every_message_once(db, thread_id):
+    seen = []
+    page = crud.get_thread_messages(db, thread_id, limit=2)
+    while page:
+        seen.extend(m.id for m in page)
+        last = page[-1]
+        page = crud.get_thread_messages(
+            db, thread_id, limit=2, before_created_at=last.created_at, before_id=last.id
+        )
+
+    assert seen == _newest_first(db, thread_id)
+
+
+def test_thread_message_cursor_ignores_skip(db, thread_id):
+    first_page = crud.get_thread_messages(db, thread_id, limit=2)
+    last = first_page[-1]
+
+    seeked = crud.get_thread_messages(
+        db, thread_id, skip=50, limit=2, before_created_at=last.created_at, before_id=last.id
+    )
+
+    assert [m.id for m in seeked] == _newest_first(db, thread_id)[2:4]
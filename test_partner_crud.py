@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""
+Tests for the partner CRUD helpers and their Redis read-through cache.
+Requires TEST_DATABASE_URL (see conftest.py) and a Redis server at REDIS_HOST:REDIS_PORT.
+"""
+
+from datetime import datetime
+
+import pytest
+
+from app import crud
+from app.cache import clear_user_cache, get_partner_from_cache, is_redis_available
+from app.crud import partner as partner_crud
+from app.schemas.partner import PartnerCreate
+
+pytestmark = pytest.mark.skipif(not is_redis_available(), reason="Redis server not available")
+
+TIME_OF_BIRTH = datetime(1990, 3, 15, 6, 30, 15)
+
+
+@pytest.fixture
+def partner(db):
+    crud.create_user(db, "user-1", "one@example.com", "One", state="active")
+    partner = partner_crud.create_partner(db, PartnerCreate(
+        user_id="user-1", name="Partner", gender="female", city_of_birth="Chennai", time_of_birth=TIME_OF_BIRTH
+    ))
+    yield partner
+    clear_user_cache("user-1")
+
+
+def _cache_hit(db, partner_id):
+    """Warm the cache, then read it back through a session that holds no Partner."""
+    partner_crud.get_partner(db, partner_id)
+    db.expunge_all()
+    return partner_crud.get_partner(db, partner_id)
+
+
+def test_get_partner_cache_hit_round_trips_datetimes(db, partner):
+    cached = _cache_hit(db, partner.id)
+
+    assert cached.time_of_birth == TIME_OF_BIRTH
+    assert isinstance(cached.created_at, datetime)
+    assert cached.created_at == partner.created_at
+
+
+def test_get_partner_cache_hit_is_attached_to_the_session(db, partner):
+    cached = _cache_hit(db, partner.id)
+
+    assert cached.user.id == "user-1"
+
+
+def test_committed_partner_edit_evicts_the_cached_row(db, partner):
+    cached = _cache_hit(db, partner.id)
+
+    cached.name = "Renamed"
+    db.commit()
+
+    assert get_partner_from_cache(partner.id) is None
+    db.expunge_all()
+    assert partner_crud.get_partner(db, partner.id).name == "Renamed"
+
+
+def test_rolled_back_partner_edit_keeps_the_cached_row(db, partner):
+    cached = _cache_hit(db, partner.id)
+
+    cached.name = "Renamed"
+    db.flush()
+    db.rollback()
+
+    assert get_partner_from_cache(partner.id)["name"] == "Partner"
+
+
+def test_delete_partner_evicts_the_cached_row(db, partner):
+    _cache_hit(db, partner.id)
+
+    partner_crud.delete_partner(db, partner.id)
+
+    assert get_partner_from_cache(partner.id) is None
+    assert partner_crud.get_partner(db, partner.id) is None
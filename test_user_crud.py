@@ -0,0 +1,24 @@
+#!/usr/bin/env python3
+"""
+Tests for the user CRUD helpers. Requires TEST_DATABASE_URL (see conftest.py).
+"""
+
+from app import crud
+
+
+def test_update_user_display_name_refreshes_the_loaded_user(db):
+    user = crud.create_user(db, "user-1", "one@example.com", "Old Name", state="active")
+
+    updated = crud.update_user_display_name(db, "user-1", "New Name")
+
+    assert updated is user
+    assert user.display_name == "New Name"
+    db.expire_all()
+    assert crud.get_user(db, "user-1").display_name == "New Name"
+
+
+def test_update_user_display_name_skips_unchanged_and_missing_users(db):
+    crud.create_user(db, "user-1", "one@example.com", "Same Name", state="active")
+
+    assert crud.update_user_display_name(db, "user-1", "Same Name") is None
+    assert crud.update_user_display_name(db, "missing", "Any Name") is None
@@ -3,10 +3,15 @@
 Simple script to test get_vimshottari_dasha function and output results to a file.
 """
 
+import copy
+import json
 import sys
 import os
-from datetime import datetime
+from datetime import date, datetime
 
+import pytest
+
+from app.agents import tools
 from app.agents.tools import get_vimshottari_dasha
 
 # Add the app directory to the Python path
@@ -134,6 +139,62 @@ def save_result_to_file(result, filename="vimshottari_dasha_result.txt"):
         
         print(f"✅ Result saved to: {filename}")
 
+def _synthetic_chart(*args):
+    """Ten-year dashas centered on today, each split into two five-year bhuktis."""
+    first = date.today().year - 50
+    dashas = []
+    for k in range(10):
+        start, middle, end = first + 10 * k, first + 10 * k + 5, first + 10 * k + 10
+        dashas.append({
+            "dasa_lord": f"Lord{k}",
+            "start": f"01-01-{start}",
+            "end": f"01-01-{end}",
+            "bhuktis": [
+                {"bhukti_lord": f"Lord{k}a", "start": f"01-01-{start}", "end": f"01-01-{middle}"},
+                {"bhukti_lord": f"Lord{k}b", "start": f"01-01-{middle}", "end": f"01-01-{end}"},
+            ]
+        })
+    return {"vimshottari_dasa": dashas}
+
+
+@pytest.fixture
+def synthetic_dasha(monkeypatch):
+    monkeypatch.setattr(tools, "_cached_rasi_impl", _synthetic_chart)
+    tools._vimshottari_timeline.cache_clear()
+    yield
+    tools._vimshottari_timeline.cache_clear()
+
+
+def _synthetic_dasha(**kwargs):
+    return get_vimshottari_dasha(2000, 1, 1, 0, 0, 0, "+00:00", 0.0, 0.0, **kwargs)
+
+
+def test_current_dasha_survives_max_periods(synthetic_dasha):
+    result = _synthetic_dasha(start_year=1900, end_year=2200, max_periods=2)
+    assert len(result["vimshottari_dasa"]) == 2
+    assert result["current_dasha"]["dasa_lord"] == "Lord5"
+    assert result["current_bhukti"]["bhukti_lord"] in ("Lord5a", "Lord5b")
+
+
+def test_bhuktis_are_shared_read_only(synthetic_dasha):
+    first = _synthetic_dasha(start_year=1900, end_year=2200)
+    bhukti = first["vimshottari_dasa"][0]["bhuktis"][0]
+
+    with pytest.raises(TypeError):
+        bhukti["bhukti_lord"] = "mutated"
+    second = _synthetic_dasha(start_year=1900, end_year=2200)
+    assert second["vimshottari_dasa"][0]["bhuktis"][0] is bhukti
+    assert bhukti["bhukti_lord"] == "Lord0a"
+
+
+def test_bhukti_copies_are_plain_dicts(synthetic_dasha):
+    bhukti = _synthetic_dasha(start_year=1900, end_year=2200)["vimshottari_dasa"][0]["bhuktis"][0]
+
+    for copied in (dict(bhukti), copy.copy(bhukti), copy.deepcopy(bhukti)):
+        copied["bhukti_lord"] = "mutated"
+    assert json.loads(json.dumps(bhukti)) == bhukti
+
+
 def main():
     """Main function to run the test and save results."""
     